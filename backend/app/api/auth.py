@@ -4,11 +4,11 @@ from sqlalchemy.orm import Session
 from pydantic import BaseModel
 from jose import jwt, JWTError
 from typing import Optional
-import httpx
 import secrets
 
 from app.core.database import get_db
 from app.core.config import settings
+from app.core.http import http_clients
 from app.core.security import create_access_token
 from app.models.user import User
 
@@ -59,63 +59,63 @@ async def github_callback(request: GitHubCallbackRequest, db: Session = Depends(
         except JWTError:
             raise HTTPException(status_code=400, detail="유효하지 않거나 만료된 인증 요청입니다")
 
-    async with httpx.AsyncClient() as client:
-        token_response = await client.post(
-            "https://github.com/login/oauth/access_token",
-            data={
-                "client_id": settings.GITHUB_CLIENT_ID,
-                "client_secret": settings.GITHUB_CLIENT_SECRET,
-                "code": request.code,
-                "redirect_uri": settings.GITHUB_REDIRECT_URI,
-            },
-            headers={"Accept": "application/json"}
-        )
+    client = http_clients.get("github")
+    token_response = await client.post(
+        "https://github.com/login/oauth/access_token",
+        data={
+            "client_id": settings.GITHUB_CLIENT_ID,
+            "client_secret": settings.GITHUB_CLIENT_SECRET,
+            "code": request.code,
+            "redirect_uri": settings.GITHUB_REDIRECT_URI,
+        },
+        headers={"Accept": "application/json"}
+    )
+
+    if token_response.status_code != 200:
+        raise HTTPException(status_code=400, detail="GitHub 인증 실패")
+
+    token_data = token_response.json()
+
+    if "error" in token_data:
+        raise HTTPException(status_code=400, detail=token_data.get("error_description", "GitHub 인증 실패"))
 
-        if token_response.status_code != 200:
-            raise HTTPException(status_code=400, detail="GitHub 인증 실패")
+    github_access_token = token_data.get("access_token")
 
-        token_data = token_response.json()
+    if not github_access_token:
+        raise HTTPException(status_code=400, detail="GitHub 액세스 토큰을 받지 못했습니다")
 
-        if "error" in token_data:
-            raise HTTPException(status_code=400, detail=token_data.get("error_description", "GitHub 인증 실패"))
+    # GitHub 사용자 정보 가져오기
+    user_response = await client.get(
+        "https://api.github.com/user",
+        headers={
+            "Authorization": f"Bearer {github_access_token}",
+            "Accept": "application/json"
+        }
+    )
 
-        github_access_token = token_data.get("access_token")
+    if user_response.status_code != 200:
+        raise HTTPException(status_code=400, detail="GitHub 사용자 정보를 가져올 수 없습니다")
 
-        if not github_access_token:
-            raise HTTPException(status_code=400, detail="GitHub 액세스 토큰을 받지 못했습니다")
+    github_user = user_response.json()
 
-        # GitHub 사용자 정보 가져오기
-        user_response = await client.get(
-            "https://api.github.com/user",
+    # 이메일 가져오기
+    email = github_user.get("email")
+    if not email:
+        email_response = await client.get(
+            "https://api.github.com/user/emails",
             headers={
                 "Authorization": f"Bearer {github_access_token}",
                 "Accept": "application/json"
             }
         )
-
-        if user_response.status_code != 200:
-            raise HTTPException(status_code=400, detail="GitHub 사용자 정보를 가져올 수 없습니다")
-
-        github_user = user_response.json()
-
-        # 이메일 가져오기
-        email = github_user.get("email")
-        if not email:
-            email_response = await client.get(
-                "https://api.github.com/user/emails",
-                headers={
-                    "Authorization": f"Bearer {github_access_token}",
-                    "Accept": "application/json"
-                }
-            )
-            if email_response.status_code == 200:
-                emails = email_response.json()
-                primary_email = next((e for e in emails if e.get("primary")), None)
-                if primary_email:
-                    email = primary_email.get("email")
-
-        if not email:
-            email = f"{github_user['login']}@github.local"
+        if email_response.status_code == 200:
+            emails = email_response.json()
+            primary_email = next((e for e in emails if e.get("primary")), None)
+            if primary_email:
+                email = primary_email.get("email")
+
+    if not email:
+        email = f"{github_user['login']}@github.local"
 
     github_id = str(github_user["id"])
 
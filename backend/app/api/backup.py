@@ -1,24 +1,36 @@
-from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks, Query
+from fastapi import APIRouter, Depends, HTTPException, Query
 from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
-from pydantic import BaseModel
-from typing import List, Optional
+from pydantic import BaseModel, field_validator
+from typing import Dict, List, NamedTuple, Optional, Tuple
 from datetime import datetime, timezone, timedelta
+from collections import Counter
 import json
+import time
 import asyncio
 import zipfile
-import io
+import shutil
+import tempfile
 import logging
-import httpx
 
+from app.core.config import settings
 from app.core.database import get_db
+from app.core.metrics import observe_backup_run, observe_image_optimization
 from app.core.security import get_current_active_user
 from app.models.user import User
 from app.models.post import PostCache
 from app.models.backup import BackupLog, BackupStatus
-from app.services.velog import VelogService
+from app.models.job import BackupJob, JobClass, JobStatus
+from app.services.velog import VelogService, PostBatchSizer
 from app.services.markdown import MarkdownService
-from app.services.image import ImageService
+from app.services.image import ImageQuota, ImageService
+from app.services.image_optimizer import ImageOptimizer
+from app.services.concurrency import AdaptiveLimiter
+from app.services.post_writer import PostCacheWriter, PostWriteStage
+from app.services.checkpoint import BackupCheckpoint
+from app.services.progress import BackupProgress, TERMINAL_STATUSES, progress_bus
+from app.services.timing import PhaseTimer
+from app.services.job_queue import BackupJobQueue
 
 logger = logging.getLogger(__name__)
 
@@ -36,10 +48,24 @@ class BackupLogResponse(BaseModel):
     posts_new: int
     posts_updated: int
     posts_skipped: int
+    posts_resumed: int | None = 0
+    resumed_from_id: int | None = None
+    listing_mode: str | None = None
     message: str | None
+    metrics: dict | None = None  # Velog 요청 통계, 단계별 소요 시간(phases)
     started_at: datetime
     completed_at: datetime | None
 
+    @field_validator("metrics", mode="before")
+    @classmethod
+    def parse_metrics(cls, value):
+        if isinstance(value, str):
+            try:
+                return json.loads(value)
+            except ValueError:
+                return None
+        return value
+
     class Config:
         from_attributes = True
 
@@ -72,101 +98,417 @@ class PostListResponse(BaseModel):
     limit: int
 
 
-async def process_single_post(
-    semaphore: asyncio.Semaphore,
-    velog: VelogService,
-    username: str,
+def _as_utc(value: Optional[datetime]) -> Optional[datetime]:
+    """DB에서 읽은 시각을 UTC aware datetime으로 정규화 (SQLite는 naive 반환)"""
+    if value is not None and value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value
+
+
+class StoredPost(NamedTuple):
+    """변경 감지용 PostCache 요약 (content 컬럼 제외)"""
+    id: int
+    content_hash: Optional[str]
+    velog_updated_at: Optional[datetime]
+    title: Optional[str]
+    thumbnail: Optional[str]
+    tags: Optional[str]
+
+
+def _post_metadata_values(post_data: dict) -> dict:
+    """Velog 목록/본문 메타데이터 → PostCache 컬럼 값"""
+    return {
+        'title': post_data['title'],
+        'thumbnail': post_data.get('thumbnail'),
+        'tags': json.dumps(post_data.get('tags', [])),
+        'short_description': post_data.get('short_description'),
+        'velog_post_id': post_data.get('id'),
+        'velog_published_at': VelogService.parse_datetime(post_data.get('released_at')),
+        'velog_updated_at': VelogService.parse_datetime(post_data.get('updated_at')),
+    }
+
+
+def load_stored_posts(db: Session, user_id: int) -> Dict[str, StoredPost]:
+    """사용자의 백업된 포스트 요약 ({slug: StoredPost}, content를 읽지 않는 단일 쿼리)"""
+    rows = db.query(
+        PostCache.slug,
+        PostCache.id,
+        PostCache.content_hash,
+        PostCache.velog_updated_at,
+        PostCache.title,
+        PostCache.thumbnail,
+        PostCache.tags,
+    ).filter(PostCache.user_id == user_id).all()
+    return {row[0]: StoredPost(*row[1:]) for row in rows}
+
+
+def filter_changed_posts(
+    posts: List[dict],
+    stored: Dict[str, StoredPost],
+    force: bool
+) -> Tuple[List[dict], List[dict]]:
+    """목록 메타데이터(updated_at)를 저장된 값과 비교해 본문 조회가 필요한 포스트만 선별
+
+    Returns: (본문 조회 대상, 변경 없음으로 건너뛸 포스트)
+    """
+    if force:
+        return list(posts), []
+
+    changed, unchanged = [], []
+    for post_info in posts:
+        stored_post = stored.get(post_info['url_slug'])
+        stored_updated_at = _as_utc(stored_post.velog_updated_at) if stored_post else None
+        listed_updated_at = VelogService.parse_datetime(post_info.get('updated_at'))
+        if stored_updated_at and listed_updated_at and stored_updated_at == listed_updated_at:
+            unchanged.append(post_info)
+        else:
+            changed.append(post_info)
+    return changed, unchanged
+
+
+def save_post_content(
     post_info: dict,
+    post_data: Optional[dict],
     user_id: int,
     force: bool,
-    db: Session
+    writer: PostCacheWriter,
+    stored: Dict[str, StoredPost]
+) -> dict:
+    """조회된 포스트 본문을 변경 감지 후 writer에 기록 (행을 읽지 않음)
+
+    stored(미리 읽은 요약)로 비교하고, 변경분은 upsert, 동일한 본문은 메타데이터만 갱신한다.
+    """
+    try:
+        if not post_data:
+            return {'status': 'failed', 'slug': post_info['url_slug']}
+
+        content_hash = VelogService.compute_content_hash(post_data['body'])
+        stored_post = stored.get(post_data['url_slug'])
+        metadata = _post_metadata_values(post_data)
+
+        if (
+            not force
+            and stored_post
+            and stored_post.content_hash == content_hash
+            and stored_post.title == metadata['title']
+            and stored_post.thumbnail == metadata['thumbnail']
+            and stored_post.tags == metadata['tags']
+        ):
+            # 본문/메타데이터 동일 - updated_at 등만 기록해 다음 실행에서 본문 조회 생략
+            writer.touch(stored_post.id, post_data['url_slug'], metadata)
+            return {'status': 'skipped', 'slug': post_info['url_slug']}
+
+        markdown_content = MarkdownService.convert_to_markdown(
+            title=post_data['title'],
+            content=post_data['body'],
+            tags=post_data.get('tags', []),
+            published_at=post_data.get('released_at'),
+            thumbnail=post_data.get('thumbnail'),
+            url_slug=post_data.get('url_slug')
+        )
+
+        writer.upsert({
+            'user_id': user_id,
+            'slug': post_data['url_slug'],
+            'content': markdown_content,
+            'content_hash': content_hash,
+            'last_backed_up': datetime.now(timezone.utc),
+            **metadata,
+        })
+        return {'status': 'updated' if stored_post else 'new', 'slug': post_info['url_slug']}
+
+    except Exception as e:
+        logger.error(f"Error backing up post {post_info.get('url_slug')}: {e}")
+        return {'status': 'failed', 'slug': post_info['url_slug'], 'error': str(e)}
+
+
+async def take_batch(queue: asyncio.Queue, size: int) -> Optional[List[dict]]:
+    """큐에서 최대 size개 포스트를 꺼냄 (첫 항목은 대기, 나머지는 이미 도착한 것만)
+
+    종료 신호(None)를 만나면 지금까지 모은 배치를 반환하고 신호는 다른 워커를 위해 되돌린다.
+    Returns: 포스트 목록, 종료 신호만 남았으면 None
+    """
+    first = await queue.get()
+    if first is None:
+        return None
+    batch = [first]
+    while len(batch) < size:
+        try:
+            item = queue.get_nowait()
+        except asyncio.QueueEmpty:
+            break
+        if item is None:
+            queue.put_nowait(None)
+            break
+        batch.append(item)
+    return batch
+
+
+async def process_post_batches(
+    queue: asyncio.Queue,
+    sizer: PostBatchSizer,
+    velog: VelogService,
+    username: str,
+    stage: PostWriteStage
 ):
-    """단일 포스트 처리 (병렬 처리용)"""
-    async with semaphore:
+    """대기열에서 배치 단위로 포스트를 꺼내 일괄 조회 후 writer 단계로 전달 (병렬 워커용, DB 접근 없음)"""
+    while True:
+        batch = await take_batch(queue, sizer.size)
+        if batch is None:
+            return
         try:
-            post_data = await velog.get_post_content(username, post_info['url_slug'])
-            if not post_data:
-                return {'status': 'failed', 'slug': post_info['url_slug']}
-
-            content_hash = velog.compute_content_hash(post_data['body'])
-            existing_post = db.query(PostCache).filter(
-                PostCache.user_id == user_id,
-                PostCache.slug == post_data['url_slug']
-            ).first()
-
-            if not force and existing_post and existing_post.content_hash == content_hash:
-                return {'status': 'skipped', 'slug': post_info['url_slug']}
-
-            markdown_content = MarkdownService.convert_to_markdown(
-                title=post_data['title'],
-                content=post_data['body'],
-                tags=post_data.get('tags', []),
-                published_at=post_data.get('released_at'),
-                thumbnail=post_data.get('thumbnail'),
-                url_slug=post_data.get('url_slug')
+            contents = await velog.get_posts_content(
+                username, [p['url_slug'] for p in batch], sizer
             )
-
-            if existing_post:
-                existing_post.content = markdown_content
-                existing_post.content_hash = content_hash
-                existing_post.title = post_data['title']
-                existing_post.thumbnail = post_data.get('thumbnail')
-                existing_post.tags = json.dumps(post_data.get('tags', []))
-                existing_post.last_backed_up = datetime.now(timezone.utc)
-                return {'status': 'updated', 'slug': post_info['url_slug']}
-            else:
-                new_post = PostCache(
-                    user_id=user_id,
-                    slug=post_data['url_slug'],
-                    title=post_data['title'],
-                    content=markdown_content,
-                    content_hash=content_hash,
-                    thumbnail=post_data.get('thumbnail'),
-                    tags=json.dumps(post_data.get('tags', [])),
-                    velog_published_at=post_data.get('released_at'),
-                    last_backed_up=datetime.now(timezone.utc)
-                )
-                db.add(new_post)
-                return {'status': 'new', 'slug': post_info['url_slug']}
-
         except Exception as e:
-            logger.error(f"Error backing up post {post_info.get('url_slug')}: {e}")
-            return {'status': 'failed', 'slug': post_info['url_slug'], 'error': str(e)}
+            logger.error(f"Error fetching batch of {len(batch)} posts: {e}")
+            contents = {}
+        for post_info in batch:
+            await stage.put((post_info, contents.get(post_info['url_slug'])))
+
+
+def resolve_listing_watermark(db: Session, user_id: int, force: bool) -> Optional[datetime]:
+    """증분 목록 조회에 사용할 워터마크 결정 (None이면 전체 목록 조회)
+
+    - 강제 백업이거나 이전 성공 백업이 없으면 전체 조회
+    - 마지막 전체 조회가 VELOG_FULL_SCAN_INTERVAL_HOURS보다 오래되면
+      오래된 포스트의 수정분을 잡기 위해 전체 조회 (주기적 재조정)
+    """
+    if force:
+        return None
+
+    last_success = db.query(BackupLog).filter(
+        BackupLog.user_id == user_id,
+        BackupLog.status == BackupStatus.SUCCESS,
+        BackupLog.velog_watermark.isnot(None)
+    ).order_by(BackupLog.started_at.desc()).first()
+    if not last_success:
+        return None
+
+    last_full = db.query(BackupLog).filter(
+        BackupLog.user_id == user_id,
+        BackupLog.status == BackupStatus.SUCCESS,
+        BackupLog.listing_mode == "full"
+    ).order_by(BackupLog.started_at.desc()).first()
+    full_scan_cutoff = datetime.now(timezone.utc) - timedelta(hours=settings.VELOG_FULL_SCAN_INTERVAL_HOURS)
+    if not last_full or _as_utc(last_full.started_at) < full_scan_cutoff:
+        return None
+
+    return _as_utc(last_success.velog_watermark)
+
+
+def find_resumable_log(db: Session, user_id: int, force: bool) -> Optional[Tuple[BackupLog, BackupCheckpoint]]:
+    """이어서 진행할 중단된 백업 조회
+
+    사용자의 가장 최근 로그가 체크포인트를 남기고 실패(워커 중단/시간 초과/예외)했고,
+    BACKUP_RESUME_MAX_AGE_HOURS 이내이며 같은 force 옵션이면 (로그, 체크포인트) 반환.
+    """
+    last = db.query(BackupLog).filter(
+        BackupLog.user_id == user_id
+    ).order_by(BackupLog.started_at.desc(), BackupLog.id.desc()).first()
+    if not last or last.status != BackupStatus.FAILED or not last.checkpoint:
+        return None
+
+    cutoff = datetime.now(timezone.utc) - timedelta(hours=settings.BACKUP_RESUME_MAX_AGE_HOURS)
+    if _as_utc(last.started_at) < cutoff:
+        return None
+
+    checkpoint = BackupCheckpoint.from_json(last.checkpoint)
+    if checkpoint is None or checkpoint.force != force or not (checkpoint.done or checkpoint.cursor):
+        return None
+    return last, checkpoint
+
+
+def velog_run_stats(velog: VelogService) -> dict:
+    """백업 실행 기록용 Velog 요청 통계 (동시성/지연/스로틀/재시도/요청률 대기)"""
+    stats = velog.limiter.snapshot() if velog.limiter else {}
+    stats["retries"] = velog.retries
+    stats["rate_limited_seconds"] = round(velog.rate_limited_seconds, 3)
+    return stats
+
+
+def backup_run_metrics(velog: VelogService, timer: PhaseTimer, **extra) -> dict:
+    """BackupLog.metrics: Velog 요청 통계 + 단계별 소요 시간/요청 수/바이트/재시도"""
+    metrics = {"velog": velog_run_stats(velog), **timer.to_dict(), **extra}
+    for op in ("listing", "fetch"):
+        stats = velog.op_stats.get(op)
+        if stats:
+            metrics["phases"].setdefault(op, {"seconds": 0.0}).update(
+                requests=stats["requests"],
+                bytes=stats["bytes"],
+                retries=stats["retries"],
+                request_seconds=round(stats["seconds"], 3),
+            )
+    return metrics
 
 
-async def perform_backup_task(user_id: int, force: bool, db: Session):
-    """백업 작업 수행 (백그라운드) - 서버 DB에 직접 저장 (병렬 처리)"""
+async def perform_backup_task(user_id: int, force: bool, db: Session, job_id: Optional[int] = None):
+    """백업 작업 수행 (워커 프로세스) - 서버 DB에 직접 저장 (병렬 처리)
+
+    job_id: 실행 중인 BackupJob (생성한 BackupLog를 연결)
+    중단된 이전 실행의 체크포인트가 있으면 목록 커서와 처리 완료 포스트를 이어받아 진행한다.
+    진행 상황(단계, 카운터, ETA)은 progress_bus로 발행한다 (GET /backup/progress).
+    """
     user = db.query(User).filter(User.id == user_id).first()
     if not user or not user.velog_username:
         return
 
+    resumable = find_resumable_log(db, user_id, force)
     backup_log = BackupLog(user_id=user_id, status=BackupStatus.IN_PROGRESS)
     db.add(backup_log)
+    db.flush()
+    checkpoint = None
+    carried: Dict[str, str] = {}  # 이전 실행에서 처리 완료된 포스트 {slug: status}
+    if resumable:
+        previous, checkpoint = resumable
+        carried = dict(checkpoint.done)
+        previous.status = BackupStatus.RESUMED
+        previous.message = f"{previous.message or '중단됨'} → 백업 #{backup_log.id}에서 이어서 진행"
+        backup_log.resumed_from_id = previous.id
+        backup_log.posts_resumed = sum(1 for status in carried.values() if status != 'failed')
+        backup_log.posts_total = resumed_listed = checkpoint.listed
+        logger.info(
+            f"Resuming backup #{previous.id} for user {user_id}: "
+            f"{len(carried)} posts done, listing from cursor {checkpoint.cursor}"
+        )
+    if job_id:
+        db.query(BackupJob).filter(BackupJob.id == job_id).update(
+            {BackupJob.backup_log_id: backup_log.id}, synchronize_session=False
+        )
     db.commit()
     db.refresh(backup_log)
 
+    progress = BackupProgress(user_id, backup_log.id)
+    progress.resumed = backup_log.posts_resumed or 0
+    progress.add_total(backup_log.posts_total or 0)
+    for status in carried.values():
+        progress.record(status, fetched=False)
+    progress_task = asyncio.create_task(progress.run())
+
     github_repo_url = None
+    # Velog 응답 상태에 따라 동시성을 조절하는 작업 단위 제한기 (AIMD)
+    limiter = AdaptiveLimiter()
+    velog = VelogService(limiter=limiter, rate_key=str(user_id))
+    # 단계별 소요 시간 (prepare, listing, fetch, write, github_sync, email) → metrics.phases
+    timer = PhaseTimer()
 
     try:
-        velog = VelogService()
-        posts = await velog.get_user_posts(user.velog_username)
-
-        backup_log.posts_total = len(posts)
-        db.commit()
+        with timer.phase("prepare"):
+            if checkpoint is None:
+                checkpoint = BackupCheckpoint(force=force, watermark=resolve_listing_watermark(db, user_id, force))
+            watermark = checkpoint.watermark
+            backup_log.listing_mode = "incremental" if watermark else "full"
+            stored_posts = load_stored_posts(db, user_id)
+
+        # stage 실행 중 요청 세션(db)과 backup_log는 DB 스레드(update_log)에서만 다룸
+        # (이벤트 루프에서 속성을 읽거나 쓰면 커밋/만료 후 lazy SELECT가 두 스레드에서 겹침)
+        velog_username = user.velog_username
+        posts_listed = backup_log.posts_total or 0
+
+        def update_log(posts_total: int, checkpoint_json: str):
+            backup_log.posts_total = posts_total
+            backup_log.checkpoint = checkpoint_json
+            db.commit()
+
+        async def save_checkpoint(committed: List[dict]):
+            """writer가 커밋한 결과를 체크포인트에 반영해 저장"""
+            checkpoint.record(committed)
+            await stage.run_db(update_log, posts_listed, checkpoint.to_json())
+
+        def write_post(writer: PostCacheWriter, item) -> dict:
+            result = save_post_content(item[0], item[1], user_id, force, writer, stored_posts)
+            progress.record(result['status'])
+            return result
+
+        # fetch 워커 → bounded 큐 → 단일 writer (DB I/O는 전용 스레드, 별도 세션)
+        stage = PostWriteStage(db.get_bind(), write_post, on_checkpoint=save_checkpoint)
+
+        # 목록 페이지가 도착하는 대로 변경분을 큐에 넣고, 워커가 즉시 본문 조회 시작
+        # 실제 동시 요청 수는 limiter가 결정 (워커는 최대 한도만큼)
+        sizer = PostBatchSizer()
+        worker_count = limiter.max_limit
+        queue: asyncio.Queue = asyncio.Queue(maxsize=worker_count * sizer.max_size)
+        unchanged_results = []
+
+        async def produce_posts():
+            """목록 스트리밍 → 메타데이터 비교 → 변경분 큐 투입"""
+            nonlocal posts_listed
+            progress.set_phase("listing")
+            listing_started = time.monotonic()
+            try:
+                pages = velog.iter_user_post_pages(velog_username, since=watermark, cursor=checkpoint.cursor)
+                async for page in pages:
+                    checkpoint.add_page(velog.list_cursor, page)
+                    posts_listed += len(page)
+                    progress.add_total(len(page))
+
+                    # 이전 실행에서 끝난 포스트 제외, 목록 메타데이터로 변경분만 선별 → 변경 없는 포스트는 본문 조회 생략
+                    page = [p for p in page if p['url_slug'] not in carried]
+                    changed, unchanged = filter_changed_posts(page, stored_posts, force)
+                    skipped = [{'status': 'skipped', 'slug': p['url_slug']} for p in unchanged]
+                    unchanged_results.extend(skipped)
+                    checkpoint.record(skipped)
+                    for _ in skipped:
+                        progress.record('skipped', fetched=False)
+                    await stage.run_db(update_log, posts_listed, checkpoint.to_json())
+
+                    for post_info in changed:
+                        await queue.put(post_info)
+            finally:
+                timer.record("listing", seconds=time.monotonic() - listing_started)
+                progress.set_phase("saving")
+                for _ in range(worker_count):
+                    await queue.put(None)
+
+        producer = asyncio.create_task(produce_posts())
+        write_task = asyncio.create_task(stage.run())
+        workers = []
+        try:
+            workers = [
+                asyncio.create_task(process_post_batches(queue, sizer, velog, velog_username, stage))
+                for _ in range(worker_count)
+            ]
+            with timer.phase("fetch"):
+                # 워커 예외는 그대로 전파 (삼키면 그 배치의 포스트가 저장도 실패 집계도 없이 빠진 채 성공 처리됨)
+                # writer도 함께 감시 - writer가 먼저 죽으면 큐가 비워지지 않아 워커가 stage.put에서 영원히 대기
+                fetch = asyncio.gather(*workers)
+                done, _ = await asyncio.wait({fetch, write_task}, return_when=asyncio.FIRST_COMPLETED)
+                if write_task in done:
+                    write_task.result()
+                    raise RuntimeError("Backup writer stopped before fetch finished")
+                fetch.result()
+            await producer
+            await stage.finish()
+            results = await write_task
+        finally:
+            for task in (*workers, producer):
+                task.cancel()
+            write_task.cancel()
+            await stage.aclose()
+            timer.record(
+                "write",
+                seconds=stage.db_seconds,
+                calls=stage.db_calls,
+                rows=stage.writer.written,
+                batches=stage.writer.batches,
+            )
+        logger.info(f"Metadata diff: {len(unchanged_results)} unchanged posts skipped without body fetch")
 
-        semaphore = asyncio.Semaphore(10)
-        tasks = [
-            process_single_post(semaphore, velog, user.velog_username, post_info, user_id, force, db)
-            for post_info in posts
-        ]
+        results.extend(unchanged_results)
+        results.extend({'status': status, 'slug': slug} for slug, status in carried.items())
 
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        # 다음 증분 조회용 워터마크: 이번에 본 가장 최신 시각 (없으면 이전 값 유지)
+        backup_log.velog_watermark = max((ts for ts in (checkpoint.seen, watermark) if ts), default=None)
 
         posts_new = sum(1 for r in results if isinstance(r, dict) and r.get('status') == 'new')
         posts_updated = sum(1 for r in results if isinstance(r, dict) and r.get('status') == 'updated')
         posts_skipped = sum(1 for r in results if isinstance(r, dict) and r.get('status') == 'skipped')
         posts_failed = sum(1 for r in results if isinstance(r, dict) and r.get('status') == 'failed')
 
+        # 실패한 포스트가 있으면 워터마크를 전진시키지 않음 (다음 실행에서 재시도)
+        if posts_failed:
+            backup_log.velog_watermark = watermark
+
         db.commit()
 
         # 변경된 포스트 slug 수집
@@ -182,58 +524,96 @@ async def perform_backup_task(user_id: int, force: bool, db: Session):
         backup_log.posts_failed = posts_failed
         backup_log.completed_at = datetime.now(timezone.utc)
         backup_log.message = f"새 포스트 {posts_new}개, 업데이트 {posts_updated}개"
+        backup_log.checkpoint = None
+        extra_metrics = {}
+        if resumable:
+            backup_log.message += f" (이전 백업에서 {backup_log.posts_resumed}개 이어받음)"
+            extra_metrics["resume"] = {
+                "from_log": backup_log.resumed_from_id,
+                "posts": backup_log.posts_resumed,
+                "listed": resumed_listed,
+            }
+        backup_log.metrics = json.dumps(backup_run_metrics(velog, timer, **extra_metrics))
 
         db.commit()
+        progress.counts = Counter(
+            new=posts_new, updated=posts_updated, skipped=posts_skipped, failed=posts_failed
+        )
 
         # GitHub 동기화 (활성화된 경우, 변경분이 있을 때만)
         has_github_token = user.github_installation_id or user.github_access_token
         if user.github_sync_enabled and user.github_repo and has_github_token and changed_slugs:
-            try:
-                from app.services.github_sync import GitHubSyncService
-                if user.github_installation_id:
-                    github_sync = await GitHubSyncService.from_installation(user.github_installation_id)
-                else:
-                    github_sync = GitHubSyncService(user.github_access_token)
-                all_posts = db.query(PostCache).filter(PostCache.user_id == user_id).all()
-                gh_owner = await github_sync.sync_posts(
-                    user.github_repo, all_posts, user.velog_username,
-                    changed_slugs=changed_slugs, owner=user.name,
-                )
-                github_repo_url = f"https://github.com/{gh_owner}/{user.github_repo}"
-                backup_log.message += " | GitHub 동기화 완료"
-                db.commit()
-            except Exception as e:
-                backup_log.message += f" | GitHub 동기화 실패: {str(e)[:100]}"
-                db.commit()
-
-        # 이메일 알림 (변경분이 있거나 실패가 있을 때만)
+            progress.set_phase("github_sync")
+            with timer.phase("github_sync"):
+                try:
+                    from app.services.github_sync import GitHubSyncService
+                    if user.github_installation_id:
+                        github_sync = await GitHubSyncService.from_installation(user.github_installation_id)
+                    else:
+                        github_sync = GitHubSyncService(user.github_access_token)
+                    all_posts = db.query(PostCache).filter(PostCache.user_id == user_id).all()
+                    optimizer = ImageOptimizer() if user.image_optimization_enabled else None
+                    gh_owner = await github_sync.sync_posts(
+                        user.github_repo, all_posts, user.velog_username,
+                        changed_slugs=changed_slugs, owner=user.name, optimizer=optimizer,
+                    )
+                    if optimizer:
+                        extra_metrics["images"] = optimizer.to_dict()
+                    github_repo_url = f"https://github.com/{gh_owner}/{user.github_repo}"
+                    backup_log.message += " | GitHub 동기화 완료"
+                    db.commit()
+                except Exception as e:
+                    backup_log.message += f" | GitHub 동기화 실패: {str(e)[:100]}"
+                    db.commit()
+
+        # 이메일 알림 (변경분이 있거나 실패가 있을 때만) - 발송 대기열에 추가, 발송은 워커가 배치로
         if user.email_notification_enabled and (posts_new > 0 or posts_updated > 0 or posts_failed > 0):
-            try:
-                from app.services.email import EmailService
-                EmailService.send_backup_notification(
-                    to_email=user.email,
-                    username=user.velog_username,
-                    posts_new=posts_new,
-                    posts_updated=posts_updated,
-                    posts_failed=posts_failed,
-                    total_posts=len(posts),
-                    status="success",
-                    github_repo_url=github_repo_url,
-                )
-            except Exception as e:
-                logger.error(f"Failed to send email notification: {e}")
+            with timer.phase("email"):
+                try:
+                    from app.services.email import EmailService
+                    EmailService.queue_backup_notification(
+                        db,
+                        dedupe_key=f"backup:{backup_log.id}:success",
+                        user_id=user_id,
+                        to_email=user.email,
+                        username=user.velog_username,
+                        posts_new=posts_new,
+                        posts_updated=posts_updated,
+                        posts_failed=posts_failed,
+                        total_posts=db.query(PostCache).filter(PostCache.user_id == user_id).count(),
+                        status="success",
+                        github_repo_url=github_repo_url,
+                    )
+                except Exception as e:
+                    db.rollback()
+                    logger.error(f"Failed to queue email notification: {e}")
+
+        run_metrics = backup_run_metrics(velog, timer, **extra_metrics)
+        backup_log.metrics = json.dumps(run_metrics)
+        db.commit()
+        observe_backup_run("success", run_metrics)
+        progress.set_phase("done")
+        await progress.publish("success", backup_log.message)
 
     except Exception as e:
         backup_log.status = BackupStatus.FAILED
         backup_log.error_details = str(e)
+        run_metrics = backup_run_metrics(velog, timer)
+        backup_log.metrics = json.dumps(run_metrics)
         backup_log.completed_at = datetime.now(timezone.utc)
         db.commit()
+        observe_backup_run("failed", run_metrics)
+        progress.set_phase("failed")
+        await progress.publish("failed", str(e)[:200])
 
         # 실패 알림
         if user.email_notification_enabled:
             try:
                 from app.services.email import EmailService
-                EmailService.send_backup_notification(
+                EmailService.queue_backup_notification(
+                    db,
+                    dedupe_key=f"backup:{backup_log.id}:failed",
+                    user_id=user_id,
                     to_email=user.email,
                     username=user.velog_username,
                     posts_new=0,
@@ -247,13 +627,26 @@ async def perform_backup_task(user_id: int, force: bool, db: Session):
             except Exception:
                 pass
 
+    finally:
+        progress_task.cancel()
+
 
 def recover_stuck_backups(db: Session, user_id: int = None):
-    """30분 이상 IN_PROGRESS 상태인 백업을 FAILED로 자동 전환"""
-    cutoff = datetime.now(timezone.utc) - timedelta(minutes=30)
+    """30분 이상 IN_PROGRESS 상태인 백업을 FAILED로 자동 전환 (워커가 lease를 유지 중인 작업은 제외)
+
+    체크포인트는 그대로 두어 다음 실행이 이어서 진행한다.
+    """
+    now = datetime.now(timezone.utc)
+    cutoff = now - timedelta(minutes=30)
+    leased_logs = db.query(BackupJob.backup_log_id).filter(
+        BackupJob.status == JobStatus.RUNNING,
+        BackupJob.lease_expires_at > now,
+        BackupJob.backup_log_id.isnot(None)
+    )
     query = db.query(BackupLog).filter(
         BackupLog.status == BackupStatus.IN_PROGRESS,
-        BackupLog.started_at < cutoff
+        BackupLog.started_at < cutoff,
+        BackupLog.id.notin_(leased_logs)
     )
     if user_id:
         query = query.filter(BackupLog.user_id == user_id)
@@ -275,25 +668,33 @@ BACKUP_COOLDOWN_MINUTES = 5
 @router.post("/trigger")
 async def trigger_backup(
     request: BackupTriggerRequest,
-    background_tasks: BackgroundTasks,
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db)
 ):
-    """수동 백업 트리거 - 서버 DB에 저장"""
+    """수동 백업 트리거 - 작업 큐에 추가 (실행은 워커 프로세스, 예약 작업보다 먼저 실행)"""
     if not current_user.velog_username:
         raise HTTPException(status_code=400, detail="Velog 계정을 먼저 연동해주세요")
 
     # 멈춘 백업 자동 복구
     recover_stuck_backups(db, current_user.id)
 
-    # 이미 진행 중인 백업이 있는지 확인
+    # 이미 대기/진행 중인 백업이 있는지 확인
     in_progress = db.query(BackupLog).filter(
         BackupLog.user_id == current_user.id,
         BackupLog.status == BackupStatus.IN_PROGRESS
     ).first()
-    if in_progress:
+    active_job = BackupJobQueue.active_job(db, current_user.id)
+    if in_progress or (active_job and active_job.status == JobStatus.RUNNING):
         raise HTTPException(status_code=409, detail="이미 백업이 진행 중입니다")
 
+    # 대기 중인 예약 백업이 있으면 수동 우선순위로 앞당김
+    if active_job:
+        if active_job.job_class == JobClass.MANUAL:
+            raise HTTPException(status_code=409, detail="이미 백업이 대기 중입니다")
+        job = BackupJobQueue.promote(db, active_job, request.force)
+        await progress_bus.publish(current_user.id, {"status": "queued", "phase": "queued", "job_id": job.id})
+        return {"message": "백업이 시작되었습니다", "job_id": job.id}
+
     # 쿨다운: 마지막 백업 후 5분 이내 재시도 차단
     cooldown_cutoff = datetime.now(timezone.utc) - timedelta(minutes=BACKUP_COOLDOWN_MINUTES)
     recent_backup = db.query(BackupLog).filter(
@@ -304,9 +705,10 @@ async def trigger_backup(
     if recent_backup:
         raise HTTPException(status_code=429, detail=f"백업은 {BACKUP_COOLDOWN_MINUTES}분에 한 번만 가능합니다")
 
-    background_tasks.add_task(perform_backup_task, current_user.id, request.force, db)
+    job = BackupJobQueue.enqueue(db, current_user.id, request.force)
+    await progress_bus.publish(current_user.id, {"status": "queued", "phase": "queued", "job_id": job.id})
 
-    return {"message": "백업이 시작되었습니다"}
+    return {"message": "백업이 시작되었습니다", "job_id": job.id}
 
 
 @router.get("/stats", response_model=BackupStatsResponse)
@@ -348,6 +750,122 @@ async def get_backup_logs(
     return logs
 
 
+@router.get("/queue")
+async def get_queue_stats(
+    current_user: User = Depends(get_current_active_user),
+    db: Session = Depends(get_db)
+):
+    """백업 작업 큐 상태 (우선순위 클래스별 대기/실행 수, 대기 시간)"""
+    return {"classes": BackupJobQueue.stats(db)}
+
+
+def _sse(event: dict) -> str:
+    return f"event: progress\ndata: {json.dumps(event, ensure_ascii=False, default=str)}\n\n"
+
+
+def _log_event(log: BackupLog) -> dict:
+    if log.status == BackupStatus.IN_PROGRESS:
+        return {"log_id": log.id, "status": "in_progress", "total": log.posts_total or 0}
+    return {
+        "log_id": log.id,
+        "status": "success" if log.status == BackupStatus.SUCCESS else "failed",
+        "phase": "done" if log.status == BackupStatus.SUCCESS else "failed",
+        "total": log.posts_total or 0,
+        "new": log.posts_new or 0,
+        "updated": log.posts_updated or 0,
+        "skipped": log.posts_skipped or 0,
+        "failed": log.posts_failed or 0,
+    }
+
+
+def backup_status_event(db: Session, user_id: int) -> dict:
+    """DB에 기록된 최근 백업 상태를 progress 이벤트로 변환
+
+    progress_bus가 워커와 공유되지 않을 때(REDIS_URL 없음) SSE 스트림이 완료를 알아내는 폴백.
+    단계/카운터는 백업이 끝나야 기록되므로 실행 중에는 목록 수(total)만 담긴다.
+    """
+    job = db.query(BackupJob).filter(BackupJob.user_id == user_id).order_by(BackupJob.id.desc()).first()
+    if job is not None and job.status == JobStatus.QUEUED:
+        return {"status": "queued", "phase": "queued", "job_id": job.id}
+    if job is not None and job.backup_log_id:
+        log = db.query(BackupLog).filter(BackupLog.id == job.backup_log_id).first()
+    else:
+        log = db.query(BackupLog).filter(
+            BackupLog.user_id == user_id
+        ).order_by(BackupLog.started_at.desc(), BackupLog.id.desc()).first()
+    if job is not None and job.status == JobStatus.RUNNING:
+        return _log_event(log) if log else {"status": "in_progress", "phase": "starting", "job_id": job.id}
+    if job is not None and job.status == JobStatus.FAILED and log is None:
+        return {"status": "failed", "phase": "failed", "job_id": job.id, "message": (job.error or "")[:200]}
+    return _log_event(log) if log else {"status": "idle"}
+
+
+@router.get("/progress")
+async def stream_backup_progress(
+    current_user: User = Depends(get_current_active_user),
+    db: Session = Depends(get_db)
+):
+    """백업 진행 상황 SSE 스트림 (text/event-stream)
+
+    대기/실행 중인 백업의 단계, 처리 카운터, ETA를 progress 이벤트로 전달하고
+    완료(success/failed) 이벤트 후 종료한다. 진행 중인 백업이 없으면 idle 이벤트 후 바로 종료.
+    progress_bus가 워커와 공유되지 않으면(REDIS_URL 없음) PROGRESS_DB_POLL_SECONDS마다
+    DB 상태(backup_status_event)를 확인해 상태가 바뀌었을 때 전달한다.
+    """
+    user_id = current_user.id
+    active = BackupJobQueue.active_job(db, user_id) is not None or db.query(BackupLog.id).filter(
+        BackupLog.user_id == user_id,
+        BackupLog.status == BackupStatus.IN_PROGRESS
+    ).first() is not None
+
+    bind = db.get_bind()
+
+    def poll_status() -> dict:
+        # 요청 세션은 스트리밍 중 닫힐 수 있으므로 조회마다 별도 세션
+        with Session(bind) as session:
+            return backup_status_event(session, user_id)
+
+    async def events():
+        if not active:
+            yield _sse({"status": "idle"})
+            return
+        async with progress_bus.subscribe(user_id) as queue:
+            keepalive = settings.PROGRESS_STREAM_KEEPALIVE_SECONDS
+            # 워커가 별도 프로세스이고 Redis가 없으면 이 프로세스의 버스로는 이벤트가 오지 않음
+            poll = None if progress_bus.shared else settings.PROGRESS_DB_POLL_SECONDS
+            now = time.monotonic()
+            deadline = now + settings.PROGRESS_STREAM_MAX_SECONDS
+            next_poll = now + (poll or 0)
+            last_sent = now
+            status = None
+            while time.monotonic() < deadline:
+                try:
+                    event = await asyncio.wait_for(queue.get(), timeout=keepalive if poll is None else min(poll, keepalive))
+                except asyncio.TimeoutError:
+                    event = None
+                    if poll is not None and time.monotonic() >= next_poll:
+                        next_poll = time.monotonic() + poll
+                        polled = await asyncio.to_thread(poll_status)
+                        if polled["status"] != status:  # 버스로 받은 것보다 정보가 적으므로 상태가 바뀔 때만
+                            event = polled
+                    if event is None:
+                        if time.monotonic() - last_sent >= keepalive:
+                            yield ": keepalive\n\n"
+                            last_sent = time.monotonic()
+                        continue
+                status = event.get("status")
+                yield _sse(event)
+                last_sent = time.monotonic()
+                if status in TERMINAL_STATUSES:
+                    return
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @router.get("/posts", response_model=PostListResponse)
 async def get_backed_up_posts(
     page: int = Query(default=1, ge=1, le=1000),
@@ -411,6 +929,33 @@ async def delete_backed_up_post(
     return {"message": "포스트가 삭제되었습니다"}
 
 
+def _iter_file(f, chunk_size: int = 256 * 1024):
+    """파일을 조각으로 읽어 응답 (다 보내면 닫음)"""
+    with f:
+        while chunk := f.read(chunk_size):
+            yield chunk
+
+
+def record_zip_image_metrics(db: Session, user_id: int, stats: dict):
+    """ZIP 내보내기의 이미지 최적화 결과를 내보낸 백업(가장 최근 성공 로그)의 metrics.zip_images에 기록"""
+    observe_image_optimization("zip_export", stats)
+    logger.info(f"ZIP export image optimization for user {user_id}: {stats}")
+    log = db.query(BackupLog).filter(
+        BackupLog.user_id == user_id,
+        BackupLog.status == BackupStatus.SUCCESS
+    ).order_by(BackupLog.started_at.desc(), BackupLog.id.desc()).first()
+    if log is None:
+        return
+    try:
+        metrics = json.loads(log.metrics) if log.metrics else {}
+        metrics["zip_images"] = {**stats, "exported_at": datetime.now(timezone.utc).isoformat()}
+        log.metrics = json.dumps(metrics)
+        db.commit()
+    except Exception as e:
+        db.rollback()
+        logger.warning(f"Failed to record ZIP image metrics: {e}")
+
+
 @router.get("/download-zip")
 async def download_all_posts_as_zip(
     current_user: User = Depends(get_current_active_user),
@@ -424,7 +969,10 @@ async def download_all_posts_as_zip(
     if not posts or len(posts) == 0:
         raise HTTPException(status_code=404, detail="백업된 포스트가 없습니다")
 
-    zip_buffer = io.BytesIO()
+    # 이미지가 큰 블로그도 메모리에 쌓이지 않도록 ZIP은 임시 파일에 작성하고 이미지는 파일에서 복사
+    zip_buffer = tempfile.TemporaryFile()
+    quota = ImageQuota()
+    optimizer = ImageOptimizer() if current_user.image_optimization_enabled else None
 
     # 중복 폴더명 처리용
     folder_names = {}
@@ -443,50 +991,35 @@ async def download_all_posts_as_zip(
 
             # 마크다운 콘텐츠에서 이미지 URL 추출 및 다운로드
             content = post.content or ""
-            images = ImageService.extract_image_urls(content)
-
-            if images:
-                # 이미지가 있는 경우: 이미지 URL을 상대 경로로 치환
-                processed_content = content
-                for index, (full_match, alt_text, url) in enumerate(images, 1):
-                    filename = ImageService.get_image_filename(url, index)
-                    relative_path = f"./images/{filename}"
-
-                    if full_match.startswith('!['):
-                        new_ref = f"![{alt_text}]({relative_path})"
-                        processed_content = processed_content.replace(full_match, new_ref, 1)
-                    elif full_match.startswith('<img'):
-                        new_ref = full_match.replace(url, relative_path)
-                        processed_content = processed_content.replace(full_match, new_ref, 1)
-
-                # index.md 작성
-                zip_file.writestr(f"{folder_name}/index.md", processed_content)
+            images = ImageService.scan_images(content)
 
-                # 이미지 다운로드 및 추가 (동기적으로 - ZIP 생성 시)
-                with httpx.Client(follow_redirects=True, timeout=15.0) as img_client:
-                    for index, (full_match, alt_text, url) in enumerate(images, 1):
-                        try:
-                            resp = img_client.get(url)
-                            if resp.status_code == 200:
-                                img_filename = ImageService.get_image_filename(url, index)
-                                zip_file.writestr(
-                                    f"{folder_name}/images/{img_filename}",
-                                    resp.content
-                                )
-                        except Exception:
-                            pass  # 다운로드 실패 시 건너뜀
-            else:
-                # 이미지 없는 경우: index.md만 저장
-                zip_file.writestr(f"{folder_name}/index.md", content)
+            # 이미지 동시 다운로드 (공유 이미지 커넥션 풀, 순서 유지)
+            files = await ImageService.download_images([image.url for image in images], timeout=15.0, quota=quota)
+            downloaded = [(image, f) for image, f in zip(images, files) if f is not None]
+            try:
+                if optimizer:
+                    downloaded = await optimizer.optimize_all(downloaded)
+
+                # 받은 이미지만 상대 경로로 치환 (다운로드 실패 시 원본 URL 유지)
+                processed_content, _ = ImageService.rewrite_images(content, [image for image, _ in downloaded])
+                zip_file.writestr(f"{folder_name}/index.md", processed_content)
+                for image, f in downloaded:
+                    f.seek(0)
+                    with zip_file.open(f"{folder_name}/images/{image.filename}", "w") as dest:
+                        shutil.copyfileobj(f, dest, settings.IMAGE_DOWNLOAD_CHUNK_BYTES)
+            finally:
+                ImageService.close_images(files + [f for _, f in downloaded])
 
     zip_buffer.seek(0)
+    if optimizer and optimizer.images:
+        record_zip_image_metrics(db, current_user.id, optimizer.to_dict())
 
     username = current_user.velog_username or current_user.email.split('@')[0]
     today = datetime.now(timezone.utc).strftime('%Y%m%d')
     zip_filename = f"velog_backup_{username}_{today}.zip"
 
     return StreamingResponse(
-        zip_buffer,
+        _iter_file(zip_buffer),
         media_type="application/zip",
         headers={
             "Content-Disposition": f"attachment; filename={zip_filename}"
@@ -2,19 +2,20 @@ from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
 from pydantic import BaseModel, field_validator
 from typing import Optional
+from datetime import datetime
 import re
 import logging
 
-import httpx
-
 from app.core.database import get_db
 from app.core.config import settings
+from app.core.http import http_clients
 from app.core.security import get_current_active_user
 from app.models.user import User
 from app.models.post import PostCache
 from app.models.backup import BackupLog
 from app.services.velog import VelogService
 from app.services.github_app import GitHubAppService
+from app.services.scheduler import BackupScheduler
 
 logger = logging.getLogger(__name__)
 
@@ -54,7 +55,11 @@ class UserSettingsResponse(BaseModel):
     github_repo: Optional[str]
     github_sync_enabled: bool
     github_installed: bool = False
+    image_optimization_enabled: bool = False
     email_notification_enabled: bool
+    auto_backup_enabled: bool = True
+    auto_backup_interval_hours: int = 24
+    next_auto_backup_at: Optional[datetime] = None
 
     class Config:
         from_attributes = True
@@ -63,7 +68,22 @@ class UserSettingsResponse(BaseModel):
 class UserSettingsUpdate(BaseModel):
     github_repo: Optional[str] = None
     github_sync_enabled: Optional[bool] = None
+    image_optimization_enabled: Optional[bool] = None
     email_notification_enabled: Optional[bool] = None
+    auto_backup_enabled: Optional[bool] = None
+    auto_backup_interval_hours: Optional[int] = None
+
+    @field_validator('auto_backup_interval_hours')
+    @classmethod
+    def validate_interval(cls, v: Optional[int]) -> Optional[int]:
+        if v is None:
+            return v
+        if not settings.AUTO_BACKUP_MIN_INTERVAL_HOURS <= v <= settings.AUTO_BACKUP_MAX_INTERVAL_HOURS:
+            raise ValueError(
+                f'자동 백업 주기는 {settings.AUTO_BACKUP_MIN_INTERVAL_HOURS}~'
+                f'{settings.AUTO_BACKUP_MAX_INTERVAL_HOURS}시간 사이여야 합니다'
+            )
+        return v
 
     @field_validator('github_repo')
     @classmethod
@@ -101,7 +121,11 @@ async def get_user_settings(current_user: User = Depends(get_current_active_user
         "github_repo": current_user.github_repo,
         "github_sync_enabled": current_user.github_sync_enabled or False,
         "github_installed": bool(current_user.github_installation_id),
+        "image_optimization_enabled": current_user.image_optimization_enabled or False,
         "email_notification_enabled": current_user.email_notification_enabled or False,
+        "auto_backup_enabled": current_user.auto_backup_enabled,
+        "auto_backup_interval_hours": BackupScheduler.interval_hours(current_user),
+        "next_auto_backup_at": current_user.next_auto_backup_at,
     }
 
 
@@ -118,9 +142,26 @@ async def update_user_settings(
     if settings.github_sync_enabled is not None:
         current_user.github_sync_enabled = settings.github_sync_enabled
 
+    if settings.image_optimization_enabled is not None:
+        current_user.image_optimization_enabled = settings.image_optimization_enabled
+
     if settings.email_notification_enabled is not None:
         current_user.email_notification_enabled = settings.email_notification_enabled
 
+    # 자동 백업 주기 변경 시 다음 실행 시각 재계산 (끄면 해제)
+    schedule_changed = False
+    if settings.auto_backup_enabled is not None:
+        schedule_changed = settings.auto_backup_enabled != current_user.auto_backup_enabled
+        current_user.auto_backup_enabled = settings.auto_backup_enabled
+    if settings.auto_backup_interval_hours is not None:
+        schedule_changed = schedule_changed or settings.auto_backup_interval_hours != current_user.auto_backup_interval_hours
+        current_user.auto_backup_interval_hours = settings.auto_backup_interval_hours
+    if schedule_changed:
+        current_user.next_auto_backup_at = (
+            BackupScheduler.next_run_at(BackupScheduler.interval_hours(current_user))
+            if current_user.auto_backup_enabled else None
+        )
+
     db.commit()
     db.refresh(current_user)
 
@@ -128,7 +169,11 @@ async def update_user_settings(
         "github_repo": current_user.github_repo,
         "github_sync_enabled": current_user.github_sync_enabled or False,
         "github_installed": bool(current_user.github_installation_id),
+        "image_optimization_enabled": current_user.image_optimization_enabled or False,
         "email_notification_enabled": current_user.email_notification_enabled or False,
+        "auto_backup_enabled": current_user.auto_backup_enabled,
+        "auto_backup_interval_hours": BackupScheduler.interval_hours(current_user),
+        "next_auto_backup_at": current_user.next_auto_backup_at,
     }
 
 
@@ -152,33 +197,33 @@ async def check_github_repo(
             owner = current_user.name
         else:
             token = current_user.github_access_token
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                owner_resp = await client.get(
-                    "https://api.github.com/user",
-                    headers={
-                        "Authorization": f"Bearer {token}",
-                        "Accept": "application/vnd.github.v3+json",
-                    },
-                )
-                owner_resp.raise_for_status()
-                owner = owner_resp.json()["login"]
-
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            repo_resp = await client.get(
-                f"https://api.github.com/repos/{owner}/{name.strip()}",
+            owner_resp = await http_clients.get("github").get(
+                "https://api.github.com/user",
                 headers={
                     "Authorization": f"Bearer {token}",
                     "Accept": "application/vnd.github.v3+json",
                 },
+                timeout=10.0,
             )
-            if repo_resp.status_code == 200:
-                repo_data = repo_resp.json()
-                return {
-                    "exists": True,
-                    "description": repo_data.get("description", ""),
-                    "private": repo_data.get("private", False),
-                }
-            return {"exists": False}
+            owner_resp.raise_for_status()
+            owner = owner_resp.json()["login"]
+
+        repo_resp = await http_clients.get("github").get(
+            f"https://api.github.com/repos/{owner}/{name.strip()}",
+            headers={
+                "Authorization": f"Bearer {token}",
+                "Accept": "application/vnd.github.v3+json",
+            },
+            timeout=10.0,
+        )
+        if repo_resp.status_code == 200:
+            repo_data = repo_resp.json()
+            return {
+                "exists": True,
+                "description": repo_data.get("description", ""),
+                "private": repo_data.get("private", False),
+            }
+        return {"exists": False}
     except Exception as e:
         logger.warning(f"GitHub repo check failed: {e}")
         return {"exists": False}
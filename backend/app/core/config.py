@@ -28,8 +28,98 @@ class Settings(BaseSettings):
     GITHUB_APP_PRIVATE_KEY: Optional[str] = None  # PEM key (base64 encoded in env)
     GITHUB_APP_NAME: Optional[str] = None  # App slug for install URL
 
+    # Velog GraphQL
+    VELOG_GRAPHQL_URL: str = "https://v2.velog.io/graphql"  # 벤치마크 시 로컬 fake 서버로 교체
+    VELOG_BATCH_SIZE: int = 20  # 한 요청에 묶어 조회할 포스트 수
+    VELOG_BATCH_MAX_BYTES: int = 2 * 1024 * 1024  # 배치 응답 크기 상한 (초과 시 배치 자동 축소)
+    VELOG_FULL_SCAN_INTERVAL_HOURS: int = 24  # 증분 목록 조회 중에도 전체 목록을 다시 훑는 주기
+    VELOG_CONCURRENCY_INITIAL: int = 4  # 적응형 동시성 시작값 (AIMD)
+    VELOG_CONCURRENCY_MIN: int = 1
+    VELOG_CONCURRENCY_MAX: int = 16
+    VELOG_LATENCY_TARGET_SECONDS: float = 5.0  # 이 지연을 넘으면 동시성 감소
+    VELOG_MAX_RETRIES: int = 4  # 일시적 오류(네트워크, 429, 5xx) 재시도 횟수
+    VELOG_BACKOFF_BASE_SECONDS: float = 0.5
+    VELOG_BACKOFF_MAX_SECONDS: float = 30.0
+    VELOG_CIRCUIT_FAILURE_THRESHOLD: int = 5  # 연속 실패 시 서킷 open
+    VELOG_CIRCUIT_RESET_SECONDS: float = 30.0  # open 후 probe까지 대기
+    VELOG_CIRCUIT_MAX_WAIT_SECONDS: float = 300.0  # 서킷이 닫히길 기다리는 최대 시간
+    VELOG_RATE_LIMIT_PER_SECOND: float = 20.0  # 모든 작업/워커 합산 Velog 요청률 상한
+    VELOG_RATE_LIMIT_BURST: int = 20
+    VELOG_RATE_LIMIT_SHARED: bool = True  # REDIS_URL이 있으면 워커 간 예산 공유
+    VELOG_RATE_LIMIT_REDIS_RETRY_SECONDS: float = 30.0  # Redis 오류 시 이 시간 동안만 로컬 예산 사용 후 재시도
+
+    # Backup
+    BACKUP_WRITE_BATCH_SIZE: int = 100  # PostCache upsert 한 번에 쓰는 행 수 (배치마다 커밋)
+    BACKUP_CHECKPOINT_SECONDS: float = 5.0  # 진행 상황 체크포인트 기록 간격
+    BACKUP_RESUME_MAX_AGE_HOURS: int = 24  # 중단된 백업을 이어서 진행할 수 있는 기간
+
+    # Backup Worker (python -m app.worker)
+    BACKUP_WORKER_CONCURRENCY: int = 2  # 워커 프로세스당 동시 실행 작업 수
+    BACKUP_JOB_POLL_SECONDS: float = 2.0  # 큐가 비었을 때 재조회 간격
+    BACKUP_JOB_LEASE_SECONDS: int = 120  # heartbeat가 끊기고 이 시간이 지나면 다른 워커가 작업 회수
+    BACKUP_JOB_HEARTBEAT_SECONDS: int = 30
+    BACKUP_JOB_MAX_ATTEMPTS: int = 3  # 워커 중단/예외 시 재시도 포함 최대 실행 횟수
+    BACKUP_EMBEDDED_WORKER: bool = False  # 별도 워커 없이 웹 프로세스 안에서 워커 실행 (개발/단일 인스턴스용)
+    BACKUP_LARGE_ACCOUNT_POSTS: int = 500  # 이 이상 포스트를 가진 계정의 작업은 대형 작업으로 분류
+    BACKUP_MAX_RUNNING_LARGE_JOBS: int = 1  # 클러스터 전체 대형 작업 동시 실행 상한 (나머지 슬롯은 작은 작업용)
+    BACKUP_QUEUE_STATS_WINDOW_MINUTES: int = 60  # 대기 시간 통계 집계 구간
+
+    # Backup Progress (SSE)
+    PROGRESS_PUBLISH_SECONDS: float = 0.5  # 실행 중 진행 상황 발행 간격 (변경이 있을 때만)
+    PROGRESS_STREAM_KEEPALIVE_SECONDS: float = 15.0
+    PROGRESS_STREAM_MAX_SECONDS: int = 3600  # 스트림 최대 유지 시간 (클라이언트가 다시 연결)
+    PROGRESS_SHARED: bool = True  # REDIS_URL이 있으면 워커 → 웹 프로세스로 pub/sub 전달
+    PROGRESS_DB_POLL_SECONDS: float = 3.0  # pub/sub 공유가 없을 때 SSE 스트림이 DB 백업 상태를 확인하는 간격
+
+    # Auto Backup Scheduler (워커 프로세스에서 실행, 여러 노드에서 동시에 실행해도 안전)
+    BACKUP_SCHEDULER_ENABLED: bool = True
+    BACKUP_SCHEDULER_TICK_SECONDS: float = 60.0
+    BACKUP_SCHEDULER_BATCH_SIZE: int = 100  # tick당 최대 예약 사용자 수
+    AUTO_BACKUP_DEFAULT_INTERVAL_HOURS: int = 24
+    AUTO_BACKUP_MIN_INTERVAL_HOURS: int = 6
+    AUTO_BACKUP_MAX_INTERVAL_HOURS: int = 24 * 30
+    AUTO_BACKUP_JITTER_RATIO: float = 0.1  # 다음 실행 시각을 주기의 ±10% 범위로 분산
+
+    # Image Download (ZIP 내보내기/GitHub 동기화/process_images에서 포스트의 이미지를 동시에 다운로드)
+    IMAGE_DOWNLOAD_PER_HOST: int = 6  # 호스트별 동시 요청 수
+    IMAGE_DOWNLOAD_MAX_INFLIGHT_BYTES: int = 64 * 1024 * 1024  # 동시에 받는 중인 이미지 바이트 상한
+    IMAGE_DOWNLOAD_DEFAULT_RESERVE_BYTES: int = 1024 * 1024  # Content-Length가 없을 때 잡아둘 크기
+    IMAGE_DOWNLOAD_TIMEOUT_SECONDS: float = 30.0  # 이미지 하나의 전체 다운로드 시간 상한
+    IMAGE_DOWNLOAD_MAX_BYTES: int = 20 * 1024 * 1024  # 이미지 하나의 크기 상한 (넘으면 원본 URL 유지)
+    IMAGE_DOWNLOAD_MAX_JOB_BYTES: int = 1024 * 1024 * 1024  # ZIP 내보내기/GitHub 동기화 한 번에 받는 이미지 합계 상한
+    IMAGE_DOWNLOAD_CHUNK_BYTES: int = 64 * 1024  # 본문을 디스크에 쓰는 단위
+
+    # Image Cache (ZIP 내보내기/GitHub 동기화가 공유하는 로컬 이미지 저장소)
+    IMAGE_CACHE_ENABLED: bool = True
+    IMAGE_CACHE_DIR: Optional[str] = None  # 미설정 시 시스템 임시 디렉터리
+    IMAGE_CACHE_MAX_BYTES: int = 1024 * 1024 * 1024  # 넘으면 오래 안 쓴 이미지부터 삭제 (LRU)
+    IMAGE_CACHE_REVALIDATE_HOURS: Optional[int] = None  # 설정 시 이 시간이 지난 항목은 ETag로 재검증
+
+    # Image Optimization (사용자 설정 image_optimization_enabled - ZIP 내보내기/GitHub 동기화 전에 재압축, Pillow 필요)
+    IMAGE_OPTIMIZE_WORKERS: int = 2  # 프로세스 풀 크기 (CPU 작업을 이벤트 루프 밖에서)
+    IMAGE_OPTIMIZE_MAX_DIMENSION: int = 1920  # 긴 변 상한 (넘으면 비율 유지 축소, 애니메이션 제외)
+    IMAGE_OPTIMIZE_WEBP: bool = True  # PNG/GIF를 WebP(무손실)로 변환
+    IMAGE_OPTIMIZE_JPEG_QUALITY: int = 85
+    IMAGE_OPTIMIZE_MIN_BYTES: int = 100 * 1024  # 이보다 작은 이미지는 그대로
+    IMAGE_OPTIMIZE_TIMEOUT_SECONDS: float = 60.0  # 이미지 하나 변환 시간 상한 (풀 작업자를 잡은 뒤부터, 넘으면 원본 사용)
+
+    # Metrics (Prometheus, GET /metrics)
+    # 여러 프로세스(gunicorn 워커, 같은 호스트의 백업 워커)는 PROMETHEUS_MULTIPROC_DIR 환경 변수로 합산
+    METRICS_ENABLED: bool = True
+    METRICS_TOKEN: Optional[str] = None  # 설정 시 Authorization: Bearer <token> 필요 (production은 미설정 시 /metrics 비활성)
+    METRICS_LOOP_LAG_INTERVAL_SECONDS: float = 1.0  # 이벤트 루프 지연 측정 간격
+    # 백업 워커(python -m app.worker)의 /metrics 포트 - 미설정 시 워커 메트릭은
+    # 같은 호스트에서 PROMETHEUS_MULTIPROC_DIR을 공유하는 웹 프로세스로만 노출 (별도 서비스면 노출 안 됨)
+    METRICS_WORKER_PORT: Optional[int] = None
+
     # Resend (Email notifications)
     RESEND_API_KEY: Optional[str] = None
+    EMAIL_OUTBOX_BATCH_SIZE: int = 50  # 한 번에 발송할 메일 수 (Resend 배치 API 상한 100)
+    EMAIL_OUTBOX_POLL_SECONDS: float = 5.0  # 대기열이 비었을 때 재조회 간격
+    EMAIL_OUTBOX_MAX_ATTEMPTS: int = 5
+    EMAIL_OUTBOX_BACKOFF_SECONDS: float = 30.0  # 재시도 지연 (시도마다 2배)
+    EMAIL_OUTBOX_LEASE_SECONDS: int = 60  # 발송 중 워커가 죽으면 이 시간 뒤 다시 발송
+    EMAIL_OUTBOX_RETENTION_DAYS: int = 7  # 발송 완료/실패 행 보관 기간 (중복 방지 기간)
 
     # CORS
     FRONTEND_URL: str = "https://velog-backup.vercel.app"
@@ -1,7 +1,8 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from app.core.config import settings
+from app.core.metrics import DB_POOL_CHECKED_OUT, InstrumentedQueuePool
 
 # Supabase PostgreSQL 연결
 engine = create_engine(
@@ -9,8 +10,11 @@ engine = create_engine(
     pool_pre_ping=True,  # 연결 상태 체크
     pool_recycle=3600,   # 1시간마다 연결 재생성
     pool_size=10,
-    max_overflow=20
+    max_overflow=20,
+    poolclass=InstrumentedQueuePool,  # 체크아웃 대기 시간 → /metrics
 )
+event.listen(engine, "checkout", lambda *args: DB_POOL_CHECKED_OUT.inc())
+event.listen(engine, "checkin", lambda *args: DB_POOL_CHECKED_OUT.dec())
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
@@ -28,7 +32,7 @@ def get_db():
 
 def init_db():
     """데이터베이스 초기화"""
-    from app.models import user, post, backup
+    from app.models import user, post, backup, job, email
 
     # 테이블 생성
     Base.metadata.create_all(bind=engine)
@@ -0,0 +1,105 @@
+import logging
+from typing import Dict
+
+import httpx
+
+from app.core.metrics import httpx_event_hooks
+
+logger = logging.getLogger(__name__)
+
+
+# 업스트림별 커넥션 풀 설정
+# - velog: GraphQL 단일 호스트 (v2.velog.io)
+# - github: REST API (api.github.com, github.com OAuth)
+# - images: Velog CDN 등 다수 호스트, 리다이렉트 허용
+# - resend: 이메일 발송
+UPSTREAMS: Dict[str, dict] = {
+    "velog": {
+        "timeout": 30.0,
+        "max_connections": 20,
+        "max_keepalive_connections": 20,
+        "follow_redirects": False,
+    },
+    "github": {
+        "timeout": 30.0,
+        "max_connections": 10,
+        "max_keepalive_connections": 10,
+        "follow_redirects": False,
+    },
+    "images": {
+        "timeout": 30.0,
+        "max_connections": 32,
+        "max_keepalive_connections": 16,
+        "follow_redirects": True,
+    },
+    "resend": {
+        "timeout": 10.0,
+        "max_connections": 4,
+        "max_keepalive_connections": 4,
+        "follow_redirects": False,
+    },
+}
+
+KEEPALIVE_EXPIRY = 60.0
+
+
+def _build_client(name: str) -> httpx.AsyncClient:
+    """업스트림 설정으로 keep-alive 풀을 가진 AsyncClient 생성 (HTTP/2는 ALPN 협상)"""
+    config = UPSTREAMS[name]
+    return httpx.AsyncClient(
+        http2=True,
+        timeout=config["timeout"],
+        follow_redirects=config["follow_redirects"],
+        event_hooks=httpx_event_hooks(name),
+        limits=httpx.Limits(
+            max_connections=config["max_connections"],
+            max_keepalive_connections=config["max_keepalive_connections"],
+            keepalive_expiry=KEEPALIVE_EXPIRY,
+        ),
+    )
+
+
+class HTTPClientRegistry:
+    """업스트림별 장기 유지 httpx.AsyncClient 레지스트리
+
+    FastAPI lifespan(또는 워커 프로세스)에서 start()/aclose()로 관리한다.
+    start() 전에 get()이 호출되면 (스크립트, 테스트 등) 해당 클라이언트를 지연 생성한다.
+    """
+
+    def __init__(self):
+        self._clients: Dict[str, httpx.AsyncClient] = {}
+
+    def start(self):
+        """모든 업스트림 클라이언트 생성"""
+        for name in UPSTREAMS:
+            self.get(name)
+        logger.info(f"HTTP client pools started: {', '.join(self._clients)}")
+
+    def get(self, name: str) -> httpx.AsyncClient:
+        """업스트림 이름으로 공유 클라이언트 반환"""
+        client = self._clients.get(name)
+        if client is None or client.is_closed:
+            if name not in UPSTREAMS:
+                raise KeyError(f"Unknown upstream: {name}")
+            client = _build_client(name)
+            self._clients[name] = client
+        return client
+
+    def register(self, name: str, client: httpx.AsyncClient):
+        """클라이언트 교체 (테스트용 transport 주입 등)"""
+        self._clients[name] = client
+
+    async def aclose(self):
+        """모든 풀 종료"""
+        clients, self._clients = self._clients, {}
+        for name, client in clients.items():
+            try:
+                await client.aclose()
+            except Exception as e:
+                logger.warning(f"Failed to close HTTP client '{name}': {e}")
+        if clients:
+            logger.info("HTTP client pools closed")
+
+
+# 싱글톤 인스턴스
+http_clients = HTTPClientRegistry()
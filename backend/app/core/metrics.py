@@ -0,0 +1,206 @@
+"""Prometheus 메트릭
+
+PROMETHEUS_MULTIPROC_DIR 환경 변수가 있으면 프로세스마다 값을 파일로 기록하고
+/metrics에서 MultiProcessCollector로 합산한다 (gunicorn 워커 여러 개, 같은 호스트의 백업 워커).
+없으면 프로세스 기본 레지스트리를 그대로 노출한다.
+"""
+import asyncio
+import os
+import secrets
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional, Tuple
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+from sqlalchemy.pool import QueuePool
+
+from app.core.config import settings
+
+# 백업 단계/실행 시간은 수 초~수십 분
+BACKUP_BUCKETS = (0.1, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300, 600, 1800, 3600)
+# 이벤트 루프 지연, 풀 대기는 대부분 ms 단위
+FAST_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+HTTP_REQUEST_SECONDS = Histogram(
+    "http_request_duration_seconds", "API 요청 처리 시간", ["method", "route", "status"]
+)
+UPSTREAM_REQUEST_SECONDS = Histogram(
+    "upstream_request_duration_seconds", "외부 HTTP 요청 응답 헤더까지의 시간", ["upstream", "status"]
+)
+BACKUP_PHASE_SECONDS = Histogram(
+    "backup_phase_duration_seconds", "백업 단계별 소요 시간", ["phase"], buckets=BACKUP_BUCKETS
+)
+BACKUP_RUN_SECONDS = Histogram(
+    "backup_duration_seconds", "백업 실행 전체 소요 시간", ["status"], buckets=BACKUP_BUCKETS
+)
+DB_POOL_WAIT_SECONDS = Histogram(
+    "db_pool_checkout_wait_seconds", "DB 커넥션 풀 체크아웃 대기 시간", buckets=FAST_BUCKETS
+)
+DB_POOL_CHECKED_OUT = Gauge(
+    "db_pool_checked_out_connections", "사용 중인 DB 커넥션 수", multiprocess_mode="livesum"
+)
+BACKUP_QUEUE_JOBS = Gauge(
+    "backup_queue_jobs", "백업 작업 큐 작업 수", ["job_class", "state"], multiprocess_mode="mostrecent"
+)
+BACKUP_QUEUE_OLDEST_WAIT_SECONDS = Gauge(
+    "backup_queue_oldest_wait_seconds", "가장 오래 기다린 대기 작업의 대기 시간", ["job_class"],
+    multiprocess_mode="mostrecent",
+)
+VELOG_RATE_LIMIT_FALLBACK = Gauge(
+    "velog_rate_limiter_local_fallback", "Redis 오류로 프로세스 로컬 요청률 예산을 쓰는 중이면 1",
+    multiprocess_mode="livemax",
+)
+IMAGE_OPTIMIZE_SAVED_BYTES = Counter(
+    "image_optimize_saved_bytes", "이미지 최적화로 줄인 바이트 (GitHub 동기화, ZIP 내보내기)", ["source"]
+)
+EVENT_LOOP_LAG_SECONDS = Histogram(
+    "event_loop_lag_seconds", "이벤트 루프 지연 (예정 시각 대비 늦게 깨어난 시간)", buckets=FAST_BUCKETS
+)
+
+
+def render_metrics() -> Tuple[bytes, str]:
+    """Prometheus 텍스트 포맷 (본문, Content-Type)"""
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    return generate_latest(registry), CONTENT_TYPE_LATEST
+
+
+def metrics_exposed() -> bool:
+    """/metrics 노출 여부 (production은 METRICS_TOKEN이 있어야 노출)"""
+    if not settings.METRICS_ENABLED:
+        return False
+    return settings.ENVIRONMENT != "production" or bool(settings.METRICS_TOKEN)
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path.split("?", 1)[0] != "/metrics":
+            self.send_error(404)
+            return
+        if settings.METRICS_TOKEN and not secrets.compare_digest(
+            self.headers.get("Authorization", ""), f"Bearer {settings.METRICS_TOKEN}"
+        ):
+            self.send_error(401)
+            return
+        body, content_type = render_metrics()
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_metrics_server(port: int, host: str = "0.0.0.0") -> ThreadingHTTPServer:
+    """웹 서버가 없는 프로세스(백업 워커)용 GET /metrics 서버 (데몬 스레드, /metrics와 같은 토큰 규칙)"""
+    server = ThreadingHTTPServer((host, port), _MetricsHandler)
+    threading.Thread(target=server.serve_forever, name="metrics-http", daemon=True).start()
+    return server
+
+
+class MetricsMiddleware:
+    """요청 처리 시간을 라우트 템플릿(/api/v1/backup/logs 등) 기준으로 기록하는 ASGI 미들웨어
+
+    매칭되지 않은 경로는 "unmatched"로 묶어 라벨 수가 늘어나지 않게 한다.
+    스트리밍 응답(SSE)은 연결이 끝날 때까지의 시간이 기록된다.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        status = 500
+
+        async def send_with_status(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            route = getattr(scope.get("route"), "path", None) or "unmatched"
+            HTTP_REQUEST_SECONDS.labels(scope["method"], route, str(status)).observe(
+                time.perf_counter() - started
+            )
+
+
+def httpx_event_hooks(upstream: str) -> Dict[str, list]:
+    """업스트림별 요청 시간/상태 코드를 기록하는 httpx event hooks"""
+
+    async def on_request(request):
+        request.extensions["metrics_started"] = time.perf_counter()
+
+    async def on_response(response):
+        started = response.request.extensions.get("metrics_started")
+        if started is not None:
+            UPSTREAM_REQUEST_SECONDS.labels(upstream, str(response.status_code)).observe(
+                time.perf_counter() - started
+            )
+
+    return {"request": [on_request], "response": [on_response]}
+
+
+class InstrumentedQueuePool(QueuePool):
+    """체크아웃 대기 시간을 기록하는 QueuePool (풀이 비어 새 연결을 맺는 시간 포함)"""
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            DB_POOL_WAIT_SECONDS.observe(time.perf_counter() - started)
+
+
+def observe_backup_run(status: str, metrics: dict):
+    """백업 실행 한 번의 단계별 시간 기록 (BackupLog.metrics 형식)"""
+    for phase, entry in metrics.get("phases", {}).items():
+        BACKUP_PHASE_SECONDS.labels(phase).observe(entry.get("seconds", 0.0))
+    if metrics.get("total_seconds") is not None:
+        BACKUP_RUN_SECONDS.labels(status).observe(metrics["total_seconds"])
+    if metrics.get("images"):
+        observe_image_optimization("github_sync", metrics["images"])
+
+
+def observe_image_optimization(source: str, stats: dict):
+    """이미지 최적화로 줄인 바이트 (ImageOptimizer.to_dict() 형식)"""
+    IMAGE_OPTIMIZE_SAVED_BYTES.labels(source).inc(max(0, stats.get("bytes_saved", 0)))
+
+
+def record_queue_stats(stats: Dict[str, dict]):
+    """BackupJobQueue.stats() 결과를 큐 게이지에 반영"""
+    for job_class, entry in stats.items():
+        BACKUP_QUEUE_JOBS.labels(job_class, "queued").set(entry["queued"])
+        BACKUP_QUEUE_JOBS.labels(job_class, "running").set(entry["running"])
+        BACKUP_QUEUE_OLDEST_WAIT_SECONDS.labels(job_class).set(entry["oldest_wait_seconds"])
+
+
+async def monitor_event_loop_lag(interval: Optional[float] = None):
+    """interval마다 깨어나 예정보다 늦어진 시간을 기록 (취소될 때까지)"""
+    interval = interval or settings.METRICS_LOOP_LAG_INTERVAL_SECONDS
+    loop = asyncio.get_running_loop()
+    while True:
+        started = loop.time()
+        await asyncio.sleep(interval)
+        EVENT_LOOP_LAG_SECONDS.observe(max(0.0, loop.time() - started - interval))
@@ -1,13 +1,24 @@
+import asyncio
+import secrets
 from contextlib import asynccontextmanager
-from fastapi import FastAPI, Request
+from fastapi import FastAPI, Request, Depends, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 from pydantic import ValidationError
 from sqlalchemy import text
+from sqlalchemy.orm import Session
 import logging
 
 from app.core.config import settings
-from app.core.database import init_db, SessionLocal
+from app.core.database import init_db, SessionLocal, get_db
+from app.core.http import http_clients
+from app.core.metrics import (
+    MetricsMiddleware, metrics_exposed, monitor_event_loop_lag, record_queue_stats, render_metrics,
+)
+from app.services.image_optimizer import shutdown_pool as shutdown_image_pool
+from app.services.job_queue import BackupJobQueue
+from app.services.rate_limit import velog_rate_limiter
+from app.services.progress import progress_bus
 from app.api import auth, user, backup
 
 # 로깅 설정
@@ -39,7 +50,29 @@ async def lifespan(app: FastAPI):
         logger.warning(f"Startup tasks: {e}")
     finally:
         db.close()
-    yield
+
+    # 업스트림별 공유 HTTP 커넥션 풀
+    http_clients.start()
+    lag_task = asyncio.create_task(monitor_event_loop_lag()) if settings.METRICS_ENABLED else None
+
+    # 단일 인스턴스 배포용: 웹 프로세스 안에서 백업 워커 실행 (기본은 별도 python -m app.worker)
+    worker_task = None
+    if settings.BACKUP_EMBEDDED_WORKER:
+        from app.worker import BackupWorker
+        embedded_worker = BackupWorker()
+        worker_task = asyncio.create_task(embedded_worker.run())
+    try:
+        yield
+    finally:
+        if worker_task:
+            embedded_worker.stop()
+            await worker_task
+        if lag_task:
+            lag_task.cancel()
+        await http_clients.aclose()
+        await velog_rate_limiter.aclose()
+        await progress_bus.aclose()
+        shutdown_image_pool()
 
 
 # FastAPI 앱 생성
@@ -60,6 +93,10 @@ app.add_middleware(
     allow_headers=["Authorization", "Content-Type", "Accept"],
 )
 
+# 라우트별 요청 처리 시간 (/metrics)
+if settings.METRICS_ENABLED:
+    app.add_middleware(MetricsMiddleware)
+
 # 전역 예외 핸들러
 @app.exception_handler(ValidationError)
 async def validation_exception_handler(request: Request, exc: ValidationError):
@@ -103,6 +140,29 @@ def health_check():
     return {"status": "healthy"}
 
 
+@app.get("/metrics", include_in_schema=False)
+def metrics(request: Request, db: Session = Depends(get_db)):
+    """Prometheus 메트릭 (METRICS_TOKEN 설정 시 Bearer 토큰 필요)
+
+    production에서는 METRICS_TOKEN 없이 공개하지 않는다 (404).
+    """
+    if not metrics_exposed():
+        raise HTTPException(status_code=404, detail="Not Found")
+    if settings.METRICS_TOKEN:
+        authorization = request.headers.get("Authorization", "")
+        if not secrets.compare_digest(authorization, f"Bearer {settings.METRICS_TOKEN}"):
+            raise HTTPException(status_code=401, detail="Unauthorized")
+
+    # 큐 상태는 스크레이프 시점에 조회
+    try:
+        record_queue_stats(BackupJobQueue.stats(db))
+    except Exception as e:
+        logger.warning(f"Failed to collect backup queue metrics: {e}")
+
+    body, content_type = render_metrics()
+    return Response(content=body, media_type=content_type)
+
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=8000)
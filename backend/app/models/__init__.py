@@ -1,5 +1,8 @@
 from app.models.user import User
 from app.models.post import PostCache
 from app.models.backup import BackupLog, BackupStatus
+from app.models.job import BackupJob, JobClass, JobStatus
+from app.models.email import EmailOutbox, EmailStatus
 
-__all__ = ["User", "PostCache", "BackupLog", "BackupStatus"]
+__all__ = ["User", "PostCache", "BackupLog", "BackupStatus", "BackupJob", "JobClass", "JobStatus",
+           "EmailOutbox", "EmailStatus"]
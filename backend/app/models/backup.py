@@ -9,6 +9,7 @@ class BackupStatus(str, enum.Enum):
     SUCCESS = "success"
     FAILED = "failed"
     IN_PROGRESS = "in_progress"
+    RESUMED = "resumed"  # 중단된 뒤 다음 실행이 체크포인트에서 이어받음
 
 
 class BackupLog(Base):
@@ -25,10 +26,20 @@ class BackupLog(Base):
     posts_updated = Column(Integer, default=0)
     posts_skipped = Column(Integer, default=0)
     posts_failed = Column(Integer, default=0)
+    posts_resumed = Column(Integer, default=0)  # 이전 실행 체크포인트에서 이어받아 다시 조회하지 않은 포스트 수
+
+    # Listing (full: 전체 목록, incremental: 워터마크 이후만)
+    listing_mode = Column(String, nullable=True)
+    velog_watermark = Column(DateTime(timezone=True), nullable=True)  # 이번 실행에서 본 가장 최신 released_at/updated_at
+
+    # Checkpoint (JSON: 목록 커서, 처리 완료 slug - 중단 시 다음 실행이 이어서 진행)
+    checkpoint = Column(Text, nullable=True)
+    resumed_from_id = Column(Integer, ForeignKey("backup_logs.id", ondelete="SET NULL"), nullable=True)
 
     # Details
     message = Column(Text, nullable=True)
     error_details = Column(Text, nullable=True)
+    metrics = Column(Text, nullable=True)  # JSON: Velog 동시성/지연/스로틀 통계
 
     # Timing
     started_at = Column(DateTime(timezone=True), server_default=func.now())
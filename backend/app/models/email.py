@@ -0,0 +1,42 @@
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text, Enum, Index
+from sqlalchemy.sql import func
+import enum
+from app.core.database import Base
+
+
+class EmailStatus(str, enum.Enum):
+    PENDING = "pending"
+    SENDING = "sending"
+    SENT = "sent"
+    FAILED = "failed"
+
+
+class EmailOutbox(Base):
+    """이메일 발송 대기열 (백업은 행만 추가하고, 워커의 발송 루프가 배치로 발송)"""
+    __tablename__ = "email_outbox"
+    __table_args__ = (
+        Index("ix_email_outbox_claim", "status", "next_attempt_at"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=True, index=True)
+    dedupe_key = Column(String, unique=True, nullable=False)  # 같은 알림 중복 추가 방지 (예: backup:12:success)
+
+    # Message
+    to_email = Column(String, nullable=False)
+    subject = Column(String, nullable=False)
+    html = Column(Text, nullable=False)
+
+    # Delivery State
+    status = Column(Enum(EmailStatus), default=EmailStatus.PENDING, nullable=False)
+    attempts = Column(Integer, default=0, nullable=False)
+    next_attempt_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)  # 재시도 지연
+    locked_until = Column(DateTime(timezone=True), nullable=True)  # 발송 중 lease (만료되면 다시 발송)
+    last_error = Column(Text, nullable=True)
+
+    # Timing
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    sent_at = Column(DateTime(timezone=True), nullable=True)
+
+    def __repr__(self):
+        return f"<EmailOutbox {self.id} - {self.status}>"
@@ -0,0 +1,60 @@
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey, Text, Enum, Index
+from sqlalchemy.sql import func
+import enum
+from app.core.database import Base
+
+
+class JobStatus(str, enum.Enum):
+    QUEUED = "queued"
+    RUNNING = "running"
+    DONE = "done"
+    FAILED = "failed"
+
+
+class JobClass(str, enum.Enum):
+    """작업 우선순위 클래스 (MANUAL이 SCHEDULED보다 먼저 실행)"""
+    MANUAL = "manual"
+    SCHEDULED = "scheduled"
+
+
+# 클래스별 우선순위 (작을수록 먼저)
+JOB_PRIORITY = {JobClass.MANUAL: 0, JobClass.SCHEDULED: 10}
+
+
+class BackupJob(Base):
+    """백업 작업 큐 (워커 프로세스가 FOR UPDATE SKIP LOCKED로 가져가 lease를 잡고 실행)"""
+    __tablename__ = "backup_jobs"
+    __table_args__ = (
+        Index("ix_backup_jobs_claim", "status", "priority", "run_after"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
+    force = Column(Boolean, default=False, nullable=False)
+
+    # Scheduling (우선순위 클래스, 예상 작업량 = 추가 시점의 백업된 포스트 수)
+    job_class = Column(Enum(JobClass), default=JobClass.MANUAL, nullable=False)
+    priority = Column(Integer, default=0, nullable=False)
+    cost = Column(Integer, default=0, nullable=False)
+
+    # Queue State
+    status = Column(Enum(JobStatus), default=JobStatus.QUEUED, nullable=False)
+    attempts = Column(Integer, default=0, nullable=False)
+    run_after = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)  # 재시도 지연
+
+    # Lease (워커가 heartbeat로 연장, 만료되면 다른 워커가 회수)
+    locked_by = Column(String, nullable=True)
+    lease_expires_at = Column(DateTime(timezone=True), nullable=True)
+    heartbeat_at = Column(DateTime(timezone=True), nullable=True)
+
+    # Result
+    backup_log_id = Column(Integer, ForeignKey("backup_logs.id", ondelete="SET NULL"), nullable=True)
+    error = Column(Text, nullable=True)
+
+    # Timing
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    started_at = Column(DateTime(timezone=True), nullable=True)
+    finished_at = Column(DateTime(timezone=True), nullable=True)
+
+    def __repr__(self):
+        return f"<BackupJob {self.id} - {self.status}>"
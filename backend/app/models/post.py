@@ -22,8 +22,11 @@ class PostCache(Base):
     thumbnail = Column(String, nullable=True)
     tags = Column(Text, nullable=True)  # JSON string
 
-    # Metadata
+    # Metadata (Velog 목록 조회 결과 - 본문 조회 없이 변경 감지에 사용)
+    velog_post_id = Column(String, nullable=True)
+    short_description = Column(Text, nullable=True)
     velog_published_at = Column(DateTime(timezone=True), nullable=True)
+    velog_updated_at = Column(DateTime(timezone=True), nullable=True)
     last_backed_up = Column(DateTime(timezone=True), nullable=True)
 
     created_at = Column(DateTime(timezone=True), server_default=func.now())
@@ -19,10 +19,16 @@ class User(Base):
     github_repo = Column(String, nullable=True)
     github_sync_enabled = Column(Boolean, default=False)
     github_installation_id = Column(Integer, nullable=True)  # GitHub App installation
+    image_optimization_enabled = Column(Boolean, default=False)  # ZIP/GitHub 동기화 이미지 재압축
 
     # Notification
     email_notification_enabled = Column(Boolean, default=True)
 
+    # Auto Backup (스케줄러가 next_auto_backup_at이 지나면 작업 큐에 추가)
+    auto_backup_enabled = Column(Boolean, default=True, nullable=False)
+    auto_backup_interval_hours = Column(Integer, default=24)
+    next_auto_backup_at = Column(DateTime(timezone=True), nullable=True, index=True)
+
     is_active = Column(Boolean, default=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
@@ -0,0 +1,100 @@
+import json
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional
+
+from app.services.velog import VelogService
+
+# 체크포인트에 기록하는 결과 상태 (failed도 기록 - 재개 시 다시 조회하지 않고 실패로 집계)
+FINAL_STATUSES = ("new", "updated", "skipped", "failed")
+
+
+class _Page:
+    __slots__ = ("next_cursor", "count", "pending")
+
+    def __init__(self, next_cursor: Optional[str], count: int, pending: set):
+        self.next_cursor = next_cursor
+        self.count = count
+        self.pending = pending
+
+
+class BackupCheckpoint:
+    """백업 진행 상황 (BackupLog.checkpoint에 JSON으로 저장)
+
+    - done: 저장이 커밋된 포스트 {slug: status}
+    - cursor: 이 커서까지의 목록 페이지는 모든 포스트가 done → 재개 시 다음 페이지부터 목록 조회
+    - listed: cursor까지 페이지의 포스트 수 (posts_total 이어서 집계)
+    - watermark: 이번 실행이 사용한 증분 조회 워터마크 (재개 시 같은 기준으로 목록 조회)
+    - seen: 지금까지 본 가장 최신 released_at/updated_at (다음 워터마크 후보)
+    페이지는 목록 순서대로 add_page()하고, 커밋된 결과를 record()하면
+    앞쪽부터 모든 포스트가 끝난 페이지만큼 cursor가 전진한다.
+    """
+
+    def __init__(
+        self,
+        force: bool = False,
+        watermark: Optional[datetime] = None,
+        cursor: Optional[str] = None,
+        listed: int = 0,
+        seen: Optional[datetime] = None,
+        done: Optional[Dict[str, str]] = None,
+    ):
+        self.force = force
+        self.watermark = watermark
+        self.cursor = cursor
+        self.listed = listed
+        self.seen = seen
+        self.done: Dict[str, str] = dict(done or {})
+        self._pages: List[_Page] = []
+
+    @classmethod
+    def from_json(cls, raw: Optional[str]) -> Optional["BackupCheckpoint"]:
+        if not raw:
+            return None
+        try:
+            data = json.loads(raw)
+        except ValueError:
+            return None
+        return cls(
+            force=bool(data.get("force")),
+            watermark=VelogService.parse_datetime(data.get("watermark")),
+            cursor=data.get("cursor"),
+            listed=data.get("listed", 0),
+            seen=VelogService.parse_datetime(data.get("seen")),
+            done=data.get("done"),
+        )
+
+    def to_json(self) -> str:
+        return json.dumps({
+            "force": self.force,
+            "watermark": self.watermark.isoformat() if self.watermark else None,
+            "cursor": self.cursor,
+            "listed": self.listed,
+            "seen": self.seen.isoformat() if self.seen else None,
+            "done": self.done,
+        })
+
+    def add_page(self, next_cursor: Optional[str], posts: List[dict]):
+        """목록 페이지 등록 (next_cursor: 이 페이지 다음 커서)"""
+        timestamps = [ts for ts in (VelogService.latest_timestamp(p) for p in posts) if ts]
+        if timestamps:
+            self.seen = max(timestamps + ([self.seen] if self.seen else []))
+        pending = {p["url_slug"] for p in posts} - self.done.keys()
+        self._pages.append(_Page(next_cursor, len(posts), pending))
+        self._advance()
+
+    def record(self, results: Iterable[dict]):
+        """커밋된 포스트 결과 반영"""
+        for result in results:
+            slug = result.get("slug")
+            if not slug or result.get("status") not in FINAL_STATUSES:
+                continue
+            self.done[slug] = result["status"]
+            for page in self._pages:
+                page.pending.discard(slug)
+        self._advance()
+
+    def _advance(self):
+        while self._pages and not self._pages[0].pending:
+            page = self._pages.pop(0)
+            self.cursor = page.next_cursor
+            self.listed += page.count
@@ -0,0 +1,170 @@
+import asyncio
+import logging
+import math
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Deque, List, Optional
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+def percentile(values: List[float], pct: float) -> Optional[float]:
+    """정렬되지 않은 값 목록의 백분위수 (nearest-rank)"""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+class AdaptiveLimiter:
+    """AIMD 기반 적응형 동시성 제한기
+
+    - 정상 응답: 현재 한도만큼 연속 성공하면 한도 +1 (additive increase)
+    - 429 / 5xx / 네트워크 오류 / 지연 목표 초과: 한도 절반 (multiplicative decrease)
+      감소 직후 cooldown 동안은 추가 감소하지 않음 (이미 보낸 요청들의 중복 신호 무시)
+    """
+
+    def __init__(
+        self,
+        initial: Optional[int] = None,
+        min_limit: Optional[int] = None,
+        max_limit: Optional[int] = None,
+        latency_target: Optional[float] = None,
+        decrease_cooldown: float = 1.0,
+    ):
+        self.min_limit = max(1, min_limit or settings.VELOG_CONCURRENCY_MIN)
+        self.max_limit = max(self.min_limit, max_limit or settings.VELOG_CONCURRENCY_MAX)
+        self.limit = min(self.max_limit, max(self.min_limit, initial or settings.VELOG_CONCURRENCY_INITIAL))
+        self.latency_target = latency_target or settings.VELOG_LATENCY_TARGET_SECONDS
+        self.decrease_cooldown = decrease_cooldown
+
+        self.in_flight = 0
+        self._waiters: Deque[asyncio.Future] = deque()
+        self._successes = 0
+        self._last_decrease = 0.0
+
+        # 실행 통계
+        self.latencies: List[float] = []
+        self.limit_samples: List[int] = []
+        self.requests = 0
+        self.throttle_events = 0
+        self.error_events = 0
+        self.slow_events = 0
+        self.decreases = 0
+        self.peak_limit = self.limit
+
+    async def acquire(self):
+        """슬롯 확보 (한도에 도달하면 대기)"""
+        while self.in_flight >= self.limit:
+            future = asyncio.get_running_loop().create_future()
+            self._waiters.append(future)
+            try:
+                await future
+            except asyncio.CancelledError:
+                if future in self._waiters:
+                    self._waiters.remove(future)
+                raise
+        self.in_flight += 1
+
+    def release(self, latency: float, status: Optional[int]):
+        """슬롯 반환 + 응답 결과로 한도 조정
+
+        status: HTTP 상태 코드 (네트워크 오류로 응답이 없으면 None)
+        """
+        self.in_flight = max(0, self.in_flight - 1)
+        self.requests += 1
+        self.latencies.append(latency)
+
+        if status == 429:
+            self.throttle_events += 1
+            self._decrease("throttled (429)")
+        elif status is None or status >= 500:
+            self.error_events += 1
+            self._decrease(f"upstream error ({status or 'network'})")
+        elif latency > self.latency_target:
+            self.slow_events += 1
+            self._decrease(f"latency {latency:.2f}s > {self.latency_target:.2f}s")
+        else:
+            self._successes += 1
+            if self._successes >= self.limit and self.limit < self.max_limit:
+                self._successes = 0
+                self.limit += 1
+                self.peak_limit = max(self.peak_limit, self.limit)
+
+        self.limit_samples.append(self.limit)
+        self._wake()
+
+    def _decrease(self, reason: str):
+        self._successes = 0
+        now = time.monotonic()
+        if now - self._last_decrease < self.decrease_cooldown:
+            return
+        self._last_decrease = now
+        new_limit = max(self.min_limit, self.limit // 2)
+        if new_limit < self.limit:
+            logger.info(f"Velog concurrency {self.limit} -> {new_limit}: {reason}")
+            self.limit = new_limit
+            self.decreases += 1
+
+    def _wake(self):
+        """여유 슬롯만큼 대기 중인 요청 깨우기"""
+        available = self.limit - self.in_flight
+        while available > 0 and self._waiters:
+            future = self._waiters.popleft()
+            if not future.done():
+                future.set_result(None)
+                available -= 1
+
+    def snapshot(self) -> dict:
+        """백업 실행 기록용 통계"""
+        def ms(value: Optional[float]) -> Optional[int]:
+            return round(value * 1000) if value is not None else None
+
+        return {
+            "concurrency": {
+                "final": self.limit,
+                "peak": self.peak_limit,
+                "min": self.min_limit,
+                "max": self.max_limit,
+                "avg": round(sum(self.limit_samples) / len(self.limit_samples), 2) if self.limit_samples else self.limit,
+            },
+            "latency_ms": {
+                "p50": ms(percentile(self.latencies, 50)),
+                "p90": ms(percentile(self.latencies, 90)),
+                "p99": ms(percentile(self.latencies, 99)),
+            },
+            "requests": self.requests,
+            "throttle_events": self.throttle_events,
+            "error_events": self.error_events,
+            "slow_events": self.slow_events,
+            "decreases": self.decreases,
+        }
+
+
+class ByteBudget:
+    """동시에 받는 중인 바이트 상한 (넘으면 다른 작업이 반납할 때까지 대기)
+
+    상한보다 큰 요청은 상한만큼 잡아 혼자 진행하게 한다.
+    """
+
+    def __init__(self, limit: int):
+        self.limit = max(1, limit)
+        self.in_use = 0
+        self._cond = asyncio.Condition()
+
+    @asynccontextmanager
+    async def reserve(self, size: int) -> AsyncIterator[None]:
+        size = min(max(0, size), self.limit)
+        async with self._cond:
+            await self._cond.wait_for(lambda: self.in_use + size <= self.limit)
+            self.in_use += size
+        try:
+            yield
+        finally:
+            async with self._cond:
+                self.in_use -= size
+                self._cond.notify_all()
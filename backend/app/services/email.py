@@ -1,13 +1,18 @@
-import httpx
 import logging
-from typing import Optional
+from typing import List, Optional, Tuple
 from datetime import datetime, timezone
 
+from sqlalchemy.orm import Session
+
 from app.core.config import settings
+from app.core.http import http_clients
+from app.models.email import EmailOutbox
 
 logger = logging.getLogger(__name__)
 
 RESEND_API_URL = "https://api.resend.com/emails"
+RESEND_BATCH_URL = "https://api.resend.com/emails/batch"
+EMAIL_FROM = "Velog Backup <onboarding@resend.dev>"
 
 
 class EmailService:
@@ -49,7 +54,9 @@ class EmailService:
                     </div>"""
 
     @staticmethod
-    def send_backup_notification(
+    def queue_backup_notification(
+        db: Session,
+        dedupe_key: str,
         to_email: str,
         username: str,
         posts_new: int,
@@ -59,14 +66,32 @@ class EmailService:
         status: str = "success",
         error_message: Optional[str] = None,
         github_repo_url: Optional[str] = None,
-    ):
-        """백업 완료/실패 알림 이메일 발송 (Resend API)"""
-        api_key = settings.RESEND_API_KEY
-
-        if not api_key:
+        user_id: Optional[int] = None,
+    ) -> Optional[EmailOutbox]:
+        """백업 완료/실패 알림을 발송 대기열에 추가 (발송은 워커가 배치로)"""
+        if not settings.RESEND_API_KEY:
             logger.warning("RESEND_API_KEY not configured, skipping email notification")
-            return
+            return None
 
+        from app.services.email_outbox import EmailOutboxQueue
+        subject, html = EmailService.render_backup_notification(
+            username, posts_new, posts_updated, posts_failed, total_posts,
+            status=status, error_message=error_message, github_repo_url=github_repo_url,
+        )
+        return EmailOutboxQueue.enqueue(db, to_email, subject, html, dedupe_key, user_id=user_id)
+
+    @staticmethod
+    def render_backup_notification(
+        username: str,
+        posts_new: int,
+        posts_updated: int,
+        posts_failed: int,
+        total_posts: int,
+        status: str = "success",
+        error_message: Optional[str] = None,
+        github_repo_url: Optional[str] = None,
+    ) -> Tuple[str, str]:
+        """백업 알림 제목/HTML 생성"""
         now = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M UTC")
         links_html = EmailService._build_links_html(username, github_repo_url)
 
@@ -131,22 +156,21 @@ class EmailService:
             </div>
             """
 
-        try:
-            response = httpx.post(
-                RESEND_API_URL,
-                headers={
-                    "Authorization": f"Bearer {api_key}",
-                    "Content-Type": "application/json",
-                },
-                json={
-                    "from": "Velog Backup <onboarding@resend.dev>",
-                    "to": [to_email],
-                    "subject": subject,
-                    "html": html,
-                },
-                timeout=10,
-            )
-            response.raise_for_status()
-            logger.info(f"Backup notification email sent to {to_email}")
-        except Exception as e:
-            logger.error(f"Failed to send email to {to_email}: {e}")
+        return subject, html
+
+    @staticmethod
+    async def send_batch(messages: List[dict], idempotency_key: Optional[str] = None):
+        """Resend로 발송 (messages: to/subject/html). 2개 이상이면 배치 API로 한 번에 보낸다.
+
+        실패하면 httpx 예외를 그대로 올린다 (재시도는 호출자가 결정).
+        """
+        payload = [{"from": EMAIL_FROM, **message} for message in messages]
+        headers = {"Authorization": f"Bearer {settings.RESEND_API_KEY}"}
+        if idempotency_key:
+            headers["Idempotency-Key"] = idempotency_key
+        client = http_clients.get("resend")
+        if len(payload) == 1:
+            response = await client.post(RESEND_API_URL, headers=headers, json=payload[0])
+        else:
+            response = await client.post(RESEND_BATCH_URL, headers=headers, json=payload)
+        response.raise_for_status()
@@ -0,0 +1,185 @@
+import hashlib
+import logging
+import time
+from datetime import datetime, timezone, timedelta
+from typing import Awaitable, Callable, List, Optional
+
+import httpx
+from sqlalchemy import and_, or_
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.email import EmailOutbox, EmailStatus
+from app.services.email import EmailService
+
+logger = logging.getLogger(__name__)
+
+# 보관 기간이 지난 발송 완료/실패 행 정리 간격
+PURGE_INTERVAL_SECONDS = 3600
+
+
+def is_retryable(error: Exception) -> bool:
+    """일시적 오류(네트워크, 429, 5xx)인지 - 그 외 4xx는 다시 보내도 실패"""
+    if isinstance(error, httpx.HTTPStatusError):
+        status = error.response.status_code
+        return status == 429 or status >= 500
+    return True
+
+
+class EmailOutboxQueue:
+    """Postgres 기반 이메일 발송 대기열 (outbox)
+
+    - enqueue: 백업 작업이 행만 추가 (dedupe_key가 같은 알림은 한 번만)
+    - claim: 발송 루프가 FOR UPDATE SKIP LOCKED로 최대 EMAIL_OUTBOX_BATCH_SIZE개를 가져가 lease 획득
+      (lease가 만료된 SENDING 행도 회수 - 발송 중 워커 크래시 대비)
+    - deliver: 가져온 메일을 Resend 배치 API로 한 번에 발송, 일시적 오류는 지수 백오프로 재시도
+    """
+
+    _last_purge = 0.0
+
+    @staticmethod
+    def enqueue(
+        db: Session,
+        to_email: str,
+        subject: str,
+        html: str,
+        dedupe_key: str,
+        user_id: Optional[int] = None,
+        commit: bool = True,
+    ) -> Optional[EmailOutbox]:
+        """메일 추가 (같은 dedupe_key가 이미 있으면 None)"""
+        if db.query(EmailOutbox.id).filter(EmailOutbox.dedupe_key == dedupe_key).first():
+            logger.info(f"Email '{dedupe_key}' already queued, skipping")
+            return None
+        email = EmailOutbox(
+            user_id=user_id,
+            dedupe_key=dedupe_key,
+            to_email=to_email,
+            subject=subject,
+            html=html,
+            status=EmailStatus.PENDING,
+            next_attempt_at=datetime.now(timezone.utc),
+        )
+        db.add(email)
+        if commit:
+            db.commit()
+            db.refresh(email)
+        else:
+            db.flush()
+        return email
+
+    @staticmethod
+    def claim(db: Session, limit: Optional[int] = None) -> List[dict]:
+        """발송할 메일을 가져와 lease 획득 (세션 밖에서 쓰도록 dict로 반환)"""
+        now = datetime.now(timezone.utc)
+        rows = db.query(EmailOutbox).filter(
+            or_(
+                and_(EmailOutbox.status == EmailStatus.PENDING, EmailOutbox.next_attempt_at <= now),
+                and_(EmailOutbox.status == EmailStatus.SENDING, EmailOutbox.locked_until < now),
+            )
+        ).order_by(EmailOutbox.id).limit(
+            limit or settings.EMAIL_OUTBOX_BATCH_SIZE
+        ).with_for_update(skip_locked=True).all()
+
+        claimed = []
+        for row in rows:
+            if row.status == EmailStatus.SENDING and row.attempts >= settings.EMAIL_OUTBOX_MAX_ATTEMPTS:
+                row.status = EmailStatus.FAILED
+                row.last_error = row.last_error or "Send lease expired"
+                row.locked_until = None
+                continue
+            row.status = EmailStatus.SENDING
+            row.attempts = (row.attempts or 0) + 1
+            row.locked_until = now + timedelta(seconds=settings.EMAIL_OUTBOX_LEASE_SECONDS)
+            claimed.append({
+                "id": row.id,
+                "dedupe_key": row.dedupe_key,
+                "message": {"to": [row.to_email], "subject": row.subject, "html": row.html},
+            })
+        db.commit()
+        return claimed
+
+    @staticmethod
+    def mark_sent(db: Session, ids: List[int]):
+        db.query(EmailOutbox).filter(EmailOutbox.id.in_(ids)).update({
+            EmailOutbox.status: EmailStatus.SENT,
+            EmailOutbox.sent_at: datetime.now(timezone.utc),
+            EmailOutbox.locked_until: None,
+            EmailOutbox.last_error: None,
+        }, synchronize_session=False)
+        db.commit()
+
+    @staticmethod
+    def mark_failed(db: Session, ids: List[int], error: str, retry: bool = True):
+        """발송 실패 기록 (retry=True면 시도 횟수가 남은 경우 지연 후 재발송)"""
+        now = datetime.now(timezone.utc)
+        for row in db.query(EmailOutbox).filter(EmailOutbox.id.in_(ids)).all():
+            row.last_error = error
+            row.locked_until = None
+            if retry and row.attempts < settings.EMAIL_OUTBOX_MAX_ATTEMPTS:
+                row.status = EmailStatus.PENDING
+                row.next_attempt_at = now + timedelta(
+                    seconds=settings.EMAIL_OUTBOX_BACKOFF_SECONDS * 2 ** (row.attempts - 1)
+                )
+            else:
+                row.status = EmailStatus.FAILED
+                logger.error(f"Giving up on email {row.id} ({row.dedupe_key}) after {row.attempts} attempt(s): {error}")
+        db.commit()
+
+    @staticmethod
+    def purge(db: Session) -> int:
+        """보관 기간이 지난 발송 완료/실패 행 삭제"""
+        cutoff = datetime.now(timezone.utc) - timedelta(days=settings.EMAIL_OUTBOX_RETENTION_DAYS)
+        deleted = db.query(EmailOutbox).filter(
+            EmailOutbox.status.in_([EmailStatus.SENT, EmailStatus.FAILED]),
+            EmailOutbox.created_at < cutoff,
+        ).delete(synchronize_session=False)
+        db.commit()
+        return deleted
+
+    @staticmethod
+    async def deliver(db_call: Callable[..., Awaitable]) -> int:
+        """대기 중인 메일 한 배치 발송. Returns: 발송 성공한 메일 수
+
+        db_call(fn, *args): fn(db, *args)를 별도 세션에서 실행하는 코루틴 (워커의 _db_call)
+        """
+        if time.monotonic() - EmailOutboxQueue._last_purge >= PURGE_INTERVAL_SECONDS:
+            EmailOutboxQueue._last_purge = time.monotonic()
+            await db_call(EmailOutboxQueue.purge)
+
+        batch = await db_call(EmailOutboxQueue.claim)
+        if not batch:
+            return 0
+        sent = await EmailOutboxQueue._send(db_call, batch)
+        if sent is not None:
+            return len(batch) if sent else 0
+
+        # 한 메일(잘못된 주소 등) 때문에 배치 전체가 거부된 경우 - 하나씩 다시 발송
+        count = 0
+        for item in batch:
+            count += bool(await EmailOutboxQueue._send(db_call, [item]))
+        return count
+
+    @staticmethod
+    async def _send(db_call: Callable[..., Awaitable], batch: List[dict]) -> Optional[bool]:
+        """Resend 발송 후 결과 기록 (성공 True, 실패 False)
+
+        여러 통짜리 배치가 재시도해도 실패할 오류로 거부되면 기록하지 않고 None (호출자가 하나씩 다시 발송)
+        """
+        ids = [item["id"] for item in batch]
+        # 같은 배치를 재발송할 때 Resend가 중복 발송하지 않도록
+        idempotency_key = hashlib.sha256(
+            "|".join(item["dedupe_key"] for item in batch).encode()
+        ).hexdigest()
+        try:
+            await EmailService.send_batch([item["message"] for item in batch], idempotency_key)
+        except Exception as e:
+            retry = is_retryable(e)
+            if not retry and len(batch) > 1:
+                return None
+            logger.warning(f"Failed to send {len(batch)} email(s): {e}")
+            await db_call(EmailOutboxQueue.mark_failed, ids, str(e)[:500], retry)
+            return False
+        await db_call(EmailOutboxQueue.mark_sent, ids)
+        logger.info(f"Sent {len(batch)} notification email(s)")
+        return True
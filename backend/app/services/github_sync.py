@@ -1,11 +1,15 @@
 import httpx
 import base64
 import logging
-from typing import List, Optional
+import os
+from typing import AsyncIterator, BinaryIO, List, Optional, Tuple, Union
 from datetime import datetime, timezone
 
+from app.core.config import settings
+from app.core.http import http_clients
 from app.services.markdown import MarkdownService
-from app.services.image import ImageService
+from app.services.image import ImageQuota, ImageService
+from app.services.image_optimizer import ImageOptimizer
 
 logger = logging.getLogger(__name__)
 
@@ -35,77 +39,108 @@ class GitHubSyncService:
 
     async def _get_authenticated_user(self) -> str:
         """인증된 GitHub 사용자명 반환 (user token 전용)"""
-        async with httpx.AsyncClient() as client:
-            resp = await client.get(f"{self.API_BASE}/user", headers=self.headers)
-            resp.raise_for_status()
-            return resp.json()["login"]
+        client = http_clients.get("github")
+        resp = await client.get(f"{self.API_BASE}/user", headers=self.headers)
+        resp.raise_for_status()
+        return resp.json()["login"]
 
     async def _ensure_repo_exists(self, repo_name: str, owner: str) -> bool:
         """Repository가 존재하는지 확인하고, 없으면 생성 (user token 전용)"""
-        async with httpx.AsyncClient() as client:
-            resp = await client.get(
-                f"{self.API_BASE}/repos/{owner}/{repo_name}",
-                headers=self.headers
-            )
-            if resp.status_code == 200:
-                return True
-
-            resp = await client.post(
-                f"{self.API_BASE}/user/repos",
-                headers=self.headers,
-                json={
-                    "name": repo_name,
-                    "description": "Velog Backup - 자동 백업된 블로그 포스트",
-                    "private": True,
-                    "auto_init": True,
-                }
-            )
-            resp.raise_for_status()
+        client = http_clients.get("github")
+        resp = await client.get(
+            f"{self.API_BASE}/repos/{owner}/{repo_name}",
+            headers=self.headers
+        )
+        if resp.status_code == 200:
             return True
 
+        resp = await client.post(
+            f"{self.API_BASE}/user/repos",
+            headers=self.headers,
+            json={
+                "name": repo_name,
+                "description": "Velog Backup - 자동 백업된 블로그 포스트",
+                "private": True,
+                "auto_init": True,
+            }
+        )
+        resp.raise_for_status()
+        return True
+
     async def _verify_repo_accessible(self, owner: str, repo_name: str) -> bool:
         """Repository 접근 가능 여부 확인 (installation token용)"""
-        async with httpx.AsyncClient() as client:
-            resp = await client.get(
-                f"{self.API_BASE}/repos/{owner}/{repo_name}",
-                headers=self.headers
-            )
-            return resp.status_code == 200
+        client = http_clients.get("github")
+        resp = await client.get(
+            f"{self.API_BASE}/repos/{owner}/{repo_name}",
+            headers=self.headers
+        )
+        return resp.status_code == 200
 
     async def _get_default_branch_sha(self, owner: str, repo: str) -> Optional[str]:
         """기본 브랜치의 최신 커밋 SHA 조회"""
-        async with httpx.AsyncClient() as client:
-            resp = await client.get(
-                f"{self.API_BASE}/repos/{owner}/{repo}/git/ref/heads/main",
-                headers=self.headers
-            )
-            if resp.status_code == 200:
-                return resp.json()["object"]["sha"]
+        client = http_clients.get("github")
+        resp = await client.get(
+            f"{self.API_BASE}/repos/{owner}/{repo}/git/ref/heads/main",
+            headers=self.headers
+        )
+        if resp.status_code == 200:
+            return resp.json()["object"]["sha"]
 
-            # main이 없으면 master 시도
-            resp = await client.get(
-                f"{self.API_BASE}/repos/{owner}/{repo}/git/ref/heads/master",
-                headers=self.headers
-            )
-            if resp.status_code == 200:
-                return resp.json()["object"]["sha"]
+        # main이 없으면 master 시도
+        resp = await client.get(
+            f"{self.API_BASE}/repos/{owner}/{repo}/git/ref/heads/master",
+            headers=self.headers
+        )
+        if resp.status_code == 200:
+            return resp.json()["object"]["sha"]
 
-            return None
+        return None
 
-    async def _create_blob(self, client: httpx.AsyncClient, owner: str, repo: str, content: bytes, encoding: str = "base64") -> str:
-        """Blob 생성 후 SHA 반환"""
-        resp = await client.post(
-            f"{self.API_BASE}/repos/{owner}/{repo}/git/blobs",
-            headers=self.headers,
-            json={
-                "content": base64.b64encode(content).decode("utf-8"),
-                "encoding": encoding,
-            },
-            timeout=30.0
-        )
+    async def _create_blob(
+        self, client: httpx.AsyncClient, owner: str, repo: str, content: Union[bytes, BinaryIO], encoding: str = "base64"
+    ) -> str:
+        """Blob 생성 후 SHA 반환 (파일 핸들은 조각씩 base64 인코딩해 요청 본문으로 스트리밍)"""
+        url = f"{self.API_BASE}/repos/{owner}/{repo}/git/blobs"
+        if isinstance(content, bytes):
+            resp = await client.post(
+                url,
+                headers=self.headers,
+                json={
+                    "content": base64.b64encode(content).decode("utf-8"),
+                    "encoding": encoding,
+                },
+                timeout=30.0
+            )
+        else:
+            body, length = self._blob_body(content)
+            resp = await client.post(
+                url,
+                headers={**self.headers, "Content-Type": "application/json", "Content-Length": str(length)},
+                content=body,
+                timeout=30.0
+            )
         resp.raise_for_status()
         return resp.json()["sha"]
 
+    @staticmethod
+    def _blob_body(f: BinaryIO) -> Tuple[AsyncIterator[bytes], int]:
+        """파일 내용을 담은 Blob 요청 JSON 본문 (조각 단위 생성기, 전체 길이)"""
+        f.seek(0, os.SEEK_END)
+        size = f.tell()
+        f.seek(0)
+        head = b'{"encoding": "base64", "content": "'
+        tail = b'"}'
+        # 3바이트 배수로 읽으면 조각별 base64를 이어 붙여도 전체 인코딩과 같다
+        chunk_size = 3 * settings.IMAGE_DOWNLOAD_CHUNK_BYTES
+
+        async def body() -> AsyncIterator[bytes]:
+            yield head
+            while chunk := f.read(chunk_size):
+                yield base64.b64encode(chunk)
+            yield tail
+
+        return body(), len(head) + 4 * ((size + 2) // 3) + len(tail)
+
     async def _create_tree(self, client: httpx.AsyncClient, owner: str, repo: str, base_tree_sha: str, tree_items: list) -> str:
         """Git Tree 생성 후 SHA 반환"""
         resp = await client.post(
@@ -152,11 +187,13 @@ class GitHubSyncService:
         velog_username: str,
         changed_slugs: set = None,
         owner: str = None,
+        optimizer: Optional[ImageOptimizer] = None,
     ) -> str:
         """포스트를 GitHub Repository에 단일 커밋으로 동기화.
 
         owner: GitHub 사용자명. 미지정 시 /user API로 조회 (user token 전용).
         changed_slugs: 주어지면 해당 포스트만 blob 생성.
+        optimizer: 주어지면 업로드 전에 이미지 최적화 (절약한 바이트는 optimizer에 집계)
         """
         if not owner:
             owner = await self._get_authenticated_user()
@@ -175,87 +212,85 @@ class GitHubSyncService:
         tree_items = []
         synced = 0
 
-        async with httpx.AsyncClient() as client:
-            # 1. 변경된 포스트의 Blob만 생성 (changed_slugs가 None이면 전체)
-            for post in posts:
-                # changed_slugs가 주어졌고, 이 포스트가 변경 대상이 아니면 스킵
-                if changed_slugs is not None and post.slug not in changed_slugs:
-                    continue
+        client = http_clients.get("github")
+        quota = ImageQuota()
+        # 1. 변경된 포스트의 Blob만 생성 (changed_slugs가 None이면 전체)
+        for post in posts:
+            # changed_slugs가 주어졌고, 이 포스트가 변경 대상이 아니면 스킵
+            if changed_slugs is not None and post.slug not in changed_slugs:
+                continue
+            try:
+                folder_name = MarkdownService.generate_folder_name(post.title)
+
+                if folder_name in folder_names:
+                    folder_names[folder_name] += 1
+                    folder_name = f"{folder_name} ({folder_names[folder_name]})"
+                else:
+                    folder_names[folder_name] = 1
+
+                content = post.content or ""
+
+                # 이미지 처리: URL 추출 → Blob 생성 → 경로 치환
+                images = ImageService.scan_images(content)
+                files = await ImageService.download_images([image.url for image in images], quota=quota)
+
+                uploaded = []
+                downloaded = [(image, f) for image, f in zip(images, files) if f is not None]
                 try:
-                    folder_name = MarkdownService.generate_folder_name(post.title)
-
-                    if folder_name in folder_names:
-                        folder_names[folder_name] += 1
-                        folder_name = f"{folder_name} ({folder_names[folder_name]})"
-                    else:
-                        folder_names[folder_name] = 1
-
-                    content = post.content or ""
-
-                    # 이미지 처리: URL 추출 → Blob 생성 → 경로 치환
-                    images = ImageService.extract_image_urls(content)
-                    processed_content = content
-
-                    for index, (full_match, alt_text, url) in enumerate(images, 1):
+                    if optimizer:
+                        downloaded = await optimizer.optimize_all(downloaded)
+                    for image, f in downloaded:
                         try:
-                            img_data = await ImageService.download_image(url)
-                            if img_data:
-                                img_filename = ImageService.get_image_filename(url, index)
-                                img_path = f"posts/{folder_name}/images/{img_filename}"
-
-                                img_blob_sha = await self._create_blob(client, owner, repo_name, img_data)
-                                tree_items.append({
-                                    "path": img_path,
-                                    "mode": "100644",
-                                    "type": "blob",
-                                    "sha": img_blob_sha,
-                                })
-
-                                # 마크다운 내 이미지 경로 치환
-                                relative_path = f"./images/{img_filename}"
-                                if full_match.startswith('!['):
-                                    new_ref = f"![{alt_text}]({relative_path})"
-                                    processed_content = processed_content.replace(full_match, new_ref, 1)
-                                elif full_match.startswith('<img'):
-                                    new_ref = full_match.replace(url, relative_path)
-                                    processed_content = processed_content.replace(full_match, new_ref, 1)
+                            img_blob_sha = await self._create_blob(client, owner, repo_name, f)
+                            tree_items.append({
+                                "path": f"posts/{folder_name}/images/{image.filename}",
+                                "mode": "100644",
+                                "type": "blob",
+                                "sha": img_blob_sha,
+                            })
+                            uploaded.append(image)
                         except Exception as e:
                             logger.warning(f"Failed to process image for {post.title}: {e}")
+                finally:
+                    ImageService.close_images(files + [f for _, f in downloaded])
+
+                # 업로드한 이미지만 마크다운 내 경로 치환
+                processed_content, _ = ImageService.rewrite_images(content, uploaded)
+
+                # 마크다운 Blob 생성
+                md_blob_sha = await self._create_blob(client, owner, repo_name, processed_content.encode("utf-8"))
+                tree_items.append({
+                    "path": f"posts/{folder_name}/index.md",
+                    "mode": "100644",
+                    "type": "blob",
+                    "sha": md_blob_sha,
+                })
+
+                synced += 1
+
+            except Exception as e:
+                logger.error(f"Failed to prepare post {post.title}: {e}")
+
+        # README Blob 생성
+        readme_content = self._generate_readme(posts, velog_username, synced)
+        readme_blob_sha = await self._create_blob(client, owner, repo_name, readme_content.encode("utf-8"))
+        tree_items.append({
+            "path": "README.md",
+            "mode": "100644",
+            "type": "blob",
+            "sha": readme_blob_sha,
+        })
+
+        # 2. Tree 생성 (단일)
+        new_tree_sha = await self._create_tree(client, owner, repo_name, base_sha, tree_items)
+
+        # 3. 커밋 생성 (단일)
+        now = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M UTC")
+        commit_message = f"backup: {synced}개 포스트 동기화 ({now})"
+        new_commit_sha = await self._create_commit(client, owner, repo_name, new_tree_sha, base_sha, commit_message)
 
-                    # 마크다운 Blob 생성
-                    md_blob_sha = await self._create_blob(client, owner, repo_name, processed_content.encode("utf-8"))
-                    tree_items.append({
-                        "path": f"posts/{folder_name}/index.md",
-                        "mode": "100644",
-                        "type": "blob",
-                        "sha": md_blob_sha,
-                    })
-
-                    synced += 1
-
-                except Exception as e:
-                    logger.error(f"Failed to prepare post {post.title}: {e}")
-
-            # README Blob 생성
-            readme_content = self._generate_readme(posts, velog_username, synced)
-            readme_blob_sha = await self._create_blob(client, owner, repo_name, readme_content.encode("utf-8"))
-            tree_items.append({
-                "path": "README.md",
-                "mode": "100644",
-                "type": "blob",
-                "sha": readme_blob_sha,
-            })
-
-            # 2. Tree 생성 (단일)
-            new_tree_sha = await self._create_tree(client, owner, repo_name, base_sha, tree_items)
-
-            # 3. 커밋 생성 (단일)
-            now = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M UTC")
-            commit_message = f"backup: {synced}개 포스트 동기화 ({now})"
-            new_commit_sha = await self._create_commit(client, owner, repo_name, new_tree_sha, base_sha, commit_message)
-
-            # 4. ref 업데이트 → 끝
-            await self._update_ref(client, owner, repo_name, new_commit_sha)
+        # 4. ref 업데이트 → 끝
+        await self._update_ref(client, owner, repo_name, new_commit_sha)
 
         logger.info(f"GitHub sync complete: {synced}/{len(posts)} posts in single commit to {owner}/{repo_name}")
 
@@ -1,11 +1,20 @@
 import re
-import httpx
+import asyncio
 import hashlib
 import logging
-from typing import List, Tuple
+import tempfile
+from contextlib import nullcontext
+from typing import BinaryIO, Dict, List, NamedTuple, Optional, Tuple
 from urllib.parse import urlparse, unquote
 import os
 
+import httpx
+
+from app.core.config import settings
+from app.core.http import http_clients
+from app.services.concurrency import ByteBudget
+from app.services.image_cache import image_cache
+
 logger = logging.getLogger(__name__)
 
 # Velog 이미지 URL 패턴
@@ -20,32 +29,110 @@ HTML_IMG_PATTERN = re.compile(
     re.IGNORECASE
 )
 
+# 두 패턴을 한 번에 훑기 위한 결합 패턴 (group 1·2: 마크다운 alt·URL, group 3: img src)
+IMAGE_TOKEN_PATTERN = re.compile(f"{IMAGE_PATTERN.pattern}|{HTML_IMG_PATTERN.pattern}", re.IGNORECASE)
+
+HTML_IMG_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.gif', '.webp', '.svg', '.bmp')
+
+
+class ImageTooLarge(Exception):
+    """이미지 하나 또는 작업 전체의 이미지 크기 상한 초과"""
+
+
+class ImageQuota:
+    """한 작업(ZIP 내보내기, GitHub 동기화 한 번)이 받는 이미지 바이트 합계 (IMAGE_DOWNLOAD_MAX_JOB_BYTES)
+
+    상한을 넘으면 나머지 이미지는 받지 않는다 (원본 URL 유지).
+    """
+
+    def __init__(self, max_bytes: Optional[int] = None):
+        self.max_bytes = settings.IMAGE_DOWNLOAD_MAX_JOB_BYTES if max_bytes is None else max_bytes
+        self.used = 0
+
+    def charge(self, size: int):
+        if self.used + size > self.max_bytes:
+            raise ImageTooLarge(f"job image limit of {self.max_bytes} bytes reached")
+        self.used += size
+
+    def refund(self, size: int):
+        self.used -= size
+
+
+class ImageRef(NamedTuple):
+    """본문 속 이미지 참조 하나 (index: 파일명 번호, start/end: 원문 위치)"""
+    index: int
+    start: int
+    end: int
+    source: str  # 원본 전체 매치
+    alt_text: str
+    url: str
+    name: Optional[str] = None  # 파일명 지정 (최적화로 형식이 바뀐 경우)
+
+    @property
+    def is_html(self) -> bool:
+        return self.source.startswith('<')
+
+    @property
+    def filename(self) -> str:
+        return self.name or ImageService.get_image_filename(self.url, self.index)
+
+    def replacement(self, relative_path: str) -> str:
+        if self.is_html:
+            return self.source.replace(self.url, relative_path)
+        return f"![{self.alt_text}]({relative_path})"
+
 
 class ImageService:
     """이미지 다운로드 및 마크다운 내 URL 치환 서비스"""
 
     @staticmethod
-    def extract_image_urls(content: str) -> List[Tuple[str, str, str]]:
-        """마크다운 콘텐츠에서 이미지 URL 추출
-        Returns: [(원본_전체_매치, alt_text, url), ...]
+    def scan_images(content: str) -> List[ImageRef]:
+        """본문을 한 번 훑어 이미지 참조 목록 반환 (index 순)
+
+        번호는 기존 파일명과 같도록 마크다운 이미지 → HTML img 순으로 매긴다.
         """
-        images = []
+        markdown, html = [], []
+        for match in IMAGE_TOKEN_PATTERN.finditer(content):
+            if match.group(2):
+                markdown.append((match, match.group(1), match.group(2)))
+            elif match.group(3).lower().endswith(HTML_IMG_EXTENSIONS):
+                html.append((match, '', match.group(3)))
+        return [
+            ImageRef(index, match.start(), match.end(), match.group(0), alt_text, url)
+            for index, (match, alt_text, url) in enumerate(markdown + html, 1)
+        ]
+
+    @staticmethod
+    def rewrite_images(
+        content: str,
+        images: Optional[List[ImageRef]] = None,
+        prefix: str = "./images/",
+    ) -> Tuple[str, List[ImageRef]]:
+        """이미지 URL을 prefix + 파일명으로 치환 (원문 위치 순으로 조각을 이어 붙여 한 번에 생성)
 
-        # 마크다운 이미지: ![alt](url)
-        for match in IMAGE_PATTERN.finditer(content):
-            full_match = match.group(0)
-            alt_text = match.group(1)
-            url = match.group(2)
-            images.append((full_match, alt_text, url))
+        images: 치환할 참조 (scan_images 결과 중 일부, 기본 전체). 나머지는 원본 URL 유지
+        Returns: (치환된_마크다운, 치환한 이미지 목록 - index 순)
+        """
+        if images is None:
+            images = ImageService.scan_images(content)
+        if not images:
+            return content, []
 
-        # HTML img 태그: <img src="url" />
-        for match in HTML_IMG_PATTERN.finditer(content):
-            url = match.group(1)
-            if any(url.lower().endswith(ext) for ext in ('.png', '.jpg', '.jpeg', '.gif', '.webp', '.svg', '.bmp')):
-                full_match = match.group(0)
-                images.append((full_match, '', url))
+        parts = []
+        pos = 0
+        for image in sorted(images, key=lambda image: image.start):
+            parts.append(content[pos:image.start])
+            parts.append(image.replacement(f"{prefix}{image.filename}"))
+            pos = image.end
+        parts.append(content[pos:])
+        return "".join(parts), sorted(images, key=lambda image: image.index)
 
-        return images
+    @staticmethod
+    def extract_image_urls(content: str) -> List[Tuple[str, str, str]]:
+        """마크다운 콘텐츠에서 이미지 URL 추출
+        Returns: [(원본_전체_매치, alt_text, url), ...]
+        """
+        return [(image.source, image.alt_text, image.url) for image in ImageService.scan_images(content)]
 
     @staticmethod
     def get_image_filename(url: str, index: int) -> str:
@@ -68,17 +155,141 @@ class ImageService:
         return f"{index}_{safe_name}"
 
     @staticmethod
-    async def download_image(url: str, timeout: float = 30.0) -> bytes | None:
-        """이미지 URL에서 바이너리 다운로드"""
+    async def download_image(
+        url: str,
+        timeout: float = 30.0,
+        budget: Optional[ByteBudget] = None,
+        quota: Optional[ImageQuota] = None,
+    ) -> Optional[BinaryIO]:
+        """이미지를 받아 처음부터 읽는 파일 핸들 반환 (실패/크기 초과 시 None, 호출자가 close)
+
+        본문은 청크 단위로 캐시 디렉터리(캐시를 끄면 익명 임시 파일)에 쓰고 메모리에 모으지 않는다.
+        로컬 이미지 캐시에 있으면 네트워크 요청 없음.
+        budget: 본문을 받는 동안 Content-Length만큼 잡아둘 바이트 예산 (download_images)
+        quota: 작업 전체 이미지 크기 상한
+        """
+        cached = None
+        if settings.IMAGE_CACHE_ENABLED:
+            cached = await asyncio.to_thread(image_cache.lookup, url)
+            if cached and not image_cache.is_stale(cached):
+                f = await asyncio.to_thread(image_cache.open, cached)
+                if f is not None:
+                    return ImageService._charge_cached(url, f, cached.size, quota)
+                cached = None
         try:
-            async with httpx.AsyncClient(follow_redirects=True) as client:
-                response = await client.get(url, timeout=timeout)
+            client = http_clients.get("images")
+            headers = {"If-None-Match": cached.etag} if cached and cached.etag else None
+            async with client.stream("GET", url, timeout=timeout, headers=headers) as response:
+                if response.status_code == 304 and cached:
+                    f = await asyncio.to_thread(image_cache.open, cached)
+                    if f is None:  # 재검증 사이 파일이 삭제됨 - 다시 받음
+                        return await ImageService.download_image(url, timeout, budget, quota)
+                    await asyncio.to_thread(image_cache.touch, url)
+                    return ImageService._charge_cached(url, f, cached.size, quota)
                 response.raise_for_status()
-                return response.content
+                length = int(response.headers.get("Content-Length") or 0)
+                if length > settings.IMAGE_DOWNLOAD_MAX_BYTES:
+                    raise ImageTooLarge(f"{length} bytes exceeds {settings.IMAGE_DOWNLOAD_MAX_BYTES}")
+                async with budget.reserve(length or settings.IMAGE_DOWNLOAD_DEFAULT_RESERVE_BYTES) if budget else nullcontext():
+                    return await ImageService._save(url, response, quota)
         except Exception as e:
             logger.warning(f"Failed to download image {url}: {e}")
             return None
 
+    @staticmethod
+    def _charge_cached(url: str, f: BinaryIO, size: int, quota: Optional[ImageQuota]) -> Optional[BinaryIO]:
+        try:
+            if quota:
+                quota.charge(size)
+        except ImageTooLarge as e:
+            f.close()
+            logger.warning(f"Skipping image {url}: {e}")
+            return None
+        return f
+
+    @staticmethod
+    async def _save(url: str, response: httpx.Response, quota: Optional[ImageQuota]) -> BinaryIO:
+        """응답 본문을 청크 단위로 파일에 쓰고 캐시에 등록 (크기 상한을 넘으면 ImageTooLarge)"""
+        if settings.IMAGE_CACHE_ENABLED:
+            f, tmp_path = await asyncio.to_thread(image_cache.temp_file)
+        else:
+            f, tmp_path = tempfile.TemporaryFile(), None
+        digest = hashlib.sha256()
+        size = 0
+        try:
+            async for chunk in response.aiter_bytes(settings.IMAGE_DOWNLOAD_CHUNK_BYTES):
+                if size + len(chunk) > settings.IMAGE_DOWNLOAD_MAX_BYTES:
+                    raise ImageTooLarge(f"larger than {settings.IMAGE_DOWNLOAD_MAX_BYTES} bytes")
+                if quota:
+                    quota.charge(len(chunk))
+                size += len(chunk)
+                digest.update(chunk)
+                f.write(chunk)
+            f.flush()
+        except BaseException:
+            if quota:
+                quota.refund(size)
+            f.close()
+            if tmp_path:
+                os.unlink(tmp_path)
+            raise
+
+        if tmp_path:
+            try:
+                await asyncio.to_thread(
+                    image_cache.store_file, url, tmp_path, digest.hexdigest(), size, response.headers.get("ETag")
+                )
+            except Exception as e:
+                logger.warning(f"Failed to cache image {url}: {e}")
+            except BaseException:
+                # 취소/시간 초과 - 임시 파일은 store_file이 옮기거나 지우므로 핸들만 닫음
+                if quota:
+                    quota.refund(size)
+                f.close()
+                raise
+        f.seek(0)
+        return f
+
+    @staticmethod
+    async def download_images(
+        urls: List[str],
+        timeout: Optional[float] = None,
+        quota: Optional[ImageQuota] = None,
+    ) -> List[Optional[BinaryIO]]:
+        """여러 이미지를 동시에 다운로드 (결과는 urls 순서 그대로, 실패한 이미지는 None)
+
+        - 호스트별 동시 요청 IMAGE_DOWNLOAD_PER_HOST개
+        - 받는 중인 바이트 합계 IMAGE_DOWNLOAD_MAX_INFLIGHT_BYTES 이하
+        - 이미지 하나당 전체 시간 timeout (기본 IMAGE_DOWNLOAD_TIMEOUT_SECONDS)
+        같은 URL은 한 번만 받아 같은 핸들을 돌려주므로 읽기 전에 seek(0). 다 쓰면 close_images로 닫는다.
+        """
+        timeout = timeout or settings.IMAGE_DOWNLOAD_TIMEOUT_SECONDS
+        budget = ByteBudget(settings.IMAGE_DOWNLOAD_MAX_INFLIGHT_BYTES)
+        host_limits: Dict[str, asyncio.Semaphore] = {}
+
+        async def fetch(url: str) -> Optional[BinaryIO]:
+            host = urlparse(url).netloc
+            limit = host_limits.setdefault(host, asyncio.Semaphore(settings.IMAGE_DOWNLOAD_PER_HOST))
+            async with limit:
+                try:
+                    return await asyncio.wait_for(
+                        ImageService.download_image(url, timeout=timeout, budget=budget, quota=quota), timeout
+                    )
+                except asyncio.TimeoutError:
+                    logger.warning(f"Timed out downloading image {url} after {timeout:.0f}s")
+                    return None
+
+        unique = list(dict.fromkeys(urls))
+        results = dict(zip(unique, await asyncio.gather(*(fetch(url) for url in unique))))
+        return [results[url] for url in urls]
+
+    @staticmethod
+    def close_images(files: List[Optional[BinaryIO]]):
+        """download_images가 돌려준 핸들 닫기"""
+        for f in files:
+            if f is not None:
+                f.close()
+
     @staticmethod
     async def process_images(content: str) -> Tuple[str, List[Tuple[str, bytes]]]:
         """마크다운 콘텐츠의 이미지를 다운로드하고 경로를 치환
@@ -86,31 +297,22 @@ class ImageService:
         Returns:
             (치환된_마크다운, [(파일명, 바이너리), ...])
         """
-        images = ImageService.extract_image_urls(content)
+        images = ImageService.scan_images(content)
         if not images:
             return content, []
 
-        downloaded_images = []
-        processed_content = content
-
-        for index, (full_match, alt_text, url) in enumerate(images, 1):
-            image_data = await ImageService.download_image(url)
-            if image_data is None:
-                # 다운로드 실패 시 원본 URL 유지
-                logger.warning(f"Keeping original URL for image {index}: {url}")
-                continue
-
-            filename = ImageService.get_image_filename(url, index)
-            relative_path = f"./images/{filename}"
-
-            # 마크다운 이미지 경로 치환
-            if full_match.startswith('!['):
-                new_ref = f"![{alt_text}]({relative_path})"
-                processed_content = processed_content.replace(full_match, new_ref, 1)
-            elif full_match.startswith('<img'):
-                new_ref = full_match.replace(url, relative_path)
-                processed_content = processed_content.replace(full_match, new_ref, 1)
-
-            downloaded_images.append((filename, image_data))
+        files = await ImageService.download_images([image.url for image in images])
+        downloaded = []
+        try:
+            for image, f in zip(images, files):
+                if f is None:
+                    # 다운로드 실패 시 원본 URL 유지
+                    logger.warning(f"Keeping original URL for image {image.index}: {image.url}")
+                    continue
+                f.seek(0)
+                downloaded.append((image, f.read()))
+        finally:
+            ImageService.close_images(files)
 
-        return processed_content, downloaded_images
+        processed_content, _ = ImageService.rewrite_images(content, [image for image, _ in downloaded])
+        return processed_content, [(image.filename, image_data) for image, image_data in downloaded]
@@ -0,0 +1,274 @@
+import hashlib
+import logging
+import os
+import sqlite3
+import tempfile
+import time
+from contextlib import closing
+from typing import BinaryIO, NamedTuple, Optional, Tuple
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS blobs (
+    digest TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    last_access REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS ix_blobs_last_access ON blobs (last_access);
+CREATE TABLE IF NOT EXISTS urls (
+    url_key TEXT PRIMARY KEY,
+    url TEXT NOT NULL,
+    digest TEXT NOT NULL,
+    etag TEXT,
+    fetched_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS ix_urls_digest ON urls (digest);
+CREATE TABLE IF NOT EXISTS variants (
+    source_digest TEXT NOT NULL,
+    variant TEXT NOT NULL,
+    digest TEXT,
+    ext TEXT,
+    PRIMARY KEY (source_digest, variant)
+);
+CREATE INDEX IF NOT EXISTS ix_variants_digest ON variants (digest);
+"""
+
+
+class CachedImage(NamedTuple):
+    path: str
+    digest: str
+    size: int
+    etag: Optional[str]
+    fetched_at: float
+
+
+class CachedVariant(NamedTuple):
+    entry: Optional[CachedImage]  # None: 변환해도 줄지 않는 이미지 (원본 사용)
+    ext: Optional[str]
+
+
+class ImageCache:
+    """내용 주소 기반 로컬 이미지 저장소 (ZIP 내보내기, GitHub 동기화, process_images 공용)
+
+    - 파일: root/<sha256 앞 2자리>/<sha256> (같은 이미지는 URL이 달라도 한 번만 저장)
+    - 인덱스: root/index.sqlite3
+      urls(sha256(URL) → 콘텐츠 해시, ETag, 조회 시각), blobs(콘텐츠 해시 → 크기, 마지막 접근 시각),
+      variants(원본 해시 + 변환 설정 → 최적화 결과 해시, 확장자)
+    - 전체 크기가 max_bytes를 넘으면 마지막 접근이 오래된 파일부터 삭제 (LRU)
+    파일은 임시 파일에 쓴 뒤 rename하고 인덱스는 SQLite 트랜잭션으로 갱신하므로,
+    같은 호스트의 여러 프로세스(gunicorn 워커, 백업 워커)가 같은 디렉터리를 공유해도 된다.
+    """
+
+    def __init__(self, root: str, max_bytes: int):
+        self.root = root
+        self.max_bytes = max_bytes
+        self._ready = False
+
+    def _connect(self) -> sqlite3.Connection:
+        if not self._ready:
+            os.makedirs(self.root, exist_ok=True)
+        conn = sqlite3.connect(os.path.join(self.root, "index.sqlite3"), timeout=10.0)
+        if not self._ready:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(SCHEMA)
+            self._ready = True
+        return conn
+
+    @staticmethod
+    def url_key(url: str) -> str:
+        return hashlib.sha256(url.encode()).hexdigest()
+
+    def path_for(self, digest: str) -> str:
+        return os.path.join(self.root, digest[:2], digest)
+
+    def lookup(self, url: str) -> Optional[CachedImage]:
+        """URL의 캐시 항목 (파일이 지워졌으면 None). 조회 시 LRU 접근 시각 갱신"""
+        with closing(self._connect()) as conn, conn:
+            row = conn.execute(
+                "SELECT u.digest, b.size, u.etag, u.fetched_at FROM urls u JOIN blobs b ON b.digest = u.digest "
+                "WHERE u.url_key = ?",
+                (self.url_key(url),),
+            ).fetchone()
+            if row is None:
+                return None
+            digest, size, etag, fetched_at = row
+            path = self.path_for(digest)
+            if not os.path.exists(path):
+                conn.execute("DELETE FROM blobs WHERE digest = ?", (digest,))
+                conn.execute("DELETE FROM urls WHERE digest = ?", (digest,))
+                return None
+            conn.execute("UPDATE blobs SET last_access = ? WHERE digest = ?", (time.time(), digest))
+        return CachedImage(path, digest, size, etag, fetched_at)
+
+    def open(self, entry: CachedImage) -> Optional[BinaryIO]:
+        """캐시 파일 읽기 핸들 (다른 프로세스가 방금 삭제했으면 None)
+
+        연 뒤에는 LRU 삭제로 파일이 지워져도 핸들로 끝까지 읽을 수 있다.
+        """
+        try:
+            return open(entry.path, "rb")
+        except FileNotFoundError:
+            return None
+
+    def read(self, entry: CachedImage) -> Optional[bytes]:
+        """캐시 파일 내용 (다른 프로세스가 방금 삭제했으면 None)"""
+        f = self.open(entry)
+        if f is None:
+            return None
+        with f:
+            return f.read()
+
+    def temp_file(self) -> Tuple[BinaryIO, str]:
+        """캐시 디렉터리 안의 쓰기용 임시 파일 (다운로드를 청크 단위로 쓴 뒤 store_file로 등록)"""
+        os.makedirs(self.root, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.root, prefix=".tmp-")
+        return os.fdopen(fd, "w+b"), tmp_path
+
+    def store(self, url: str, data: bytes, etag: Optional[str] = None) -> CachedImage:
+        """이미지 저장 후 URL 연결 (같은 내용이 이미 있으면 파일은 재사용)"""
+        f, tmp_path = self.temp_file()
+        try:
+            with f:
+                f.write(data)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+        return self.store_file(url, tmp_path, hashlib.sha256(data).hexdigest(), len(data), etag)
+
+    def store_file(self, url: str, tmp_path: str, digest: str, size: int, etag: Optional[str] = None) -> CachedImage:
+        """temp_file에 다 쓴 파일을 내용 해시 경로로 옮기고 URL 연결 (같은 내용이 이미 있으면 임시 파일 삭제)
+
+        임시 파일을 연 핸들은 옮긴 뒤에도 그대로 쓸 수 있다.
+        """
+        path = self._adopt(tmp_path, digest)
+        now = time.time()
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "INSERT INTO blobs (digest, size, last_access) VALUES (?, ?, ?) "
+                "ON CONFLICT(digest) DO UPDATE SET last_access = excluded.last_access",
+                (digest, size, now),
+            )
+            conn.execute(
+                "INSERT INTO urls (url_key, url, digest, etag, fetched_at) VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT(url_key) DO UPDATE SET digest = excluded.digest, etag = excluded.etag, "
+                "fetched_at = excluded.fetched_at",
+                (self.url_key(url), url, digest, etag, now),
+            )
+        self.evict()
+        return CachedImage(path, digest, size, etag, now)
+
+    def _adopt(self, tmp_path: str, digest: str) -> str:
+        """다 쓴 임시 파일을 내용 해시 경로로 이동 (같은 내용이 이미 있으면 임시 파일 삭제)"""
+        path = self.path_for(digest)
+        try:
+            if os.path.exists(path):
+                os.unlink(tmp_path)
+            else:
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+        return path
+
+    def lookup_variant(self, source_digest: str, variant: str) -> Optional[CachedVariant]:
+        """원본 해시의 변환 결과 (기록이 없거나 결과 파일이 지워졌으면 None)"""
+        with closing(self._connect()) as conn, conn:
+            row = conn.execute(
+                "SELECT v.digest, v.ext, b.size FROM variants v LEFT JOIN blobs b ON b.digest = v.digest "
+                "WHERE v.source_digest = ? AND v.variant = ?",
+                (source_digest, variant),
+            ).fetchone()
+            if row is None:
+                return None
+            digest, ext, size = row
+            if digest is None:
+                return CachedVariant(None, None)
+            path = self.path_for(digest)
+            if size is None or not os.path.exists(path):
+                conn.execute(
+                    "DELETE FROM variants WHERE source_digest = ? AND variant = ?", (source_digest, variant)
+                )
+                return None
+            now = time.time()
+            conn.execute("UPDATE blobs SET last_access = ? WHERE digest = ?", (now, digest))
+        return CachedVariant(CachedImage(path, digest, size, None, now), ext)
+
+    def store_variant(
+        self,
+        source_digest: str,
+        variant: str,
+        tmp_path: Optional[str] = None,
+        digest: Optional[str] = None,
+        size: int = 0,
+        ext: Optional[str] = None,
+    ) -> CachedVariant:
+        """변환 결과 저장 (tmp_path 없이 호출하면 '줄지 않음'으로 기록)"""
+        path = self._adopt(tmp_path, digest) if tmp_path else None
+        now = time.time()
+        with closing(self._connect()) as conn, conn:
+            if path:
+                conn.execute(
+                    "INSERT INTO blobs (digest, size, last_access) VALUES (?, ?, ?) "
+                    "ON CONFLICT(digest) DO UPDATE SET last_access = excluded.last_access",
+                    (digest, size, now),
+                )
+            conn.execute(
+                "INSERT INTO variants (source_digest, variant, digest, ext) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT(source_digest, variant) DO UPDATE SET digest = excluded.digest, ext = excluded.ext",
+                (source_digest, variant, digest if path else None, ext if path else None),
+            )
+        if not path:
+            return CachedVariant(None, None)
+        self.evict()
+        return CachedVariant(CachedImage(path, digest, size, None, now), ext)
+
+    def touch(self, url: str):
+        """재검증(304) 후 조회 시각 갱신"""
+        with closing(self._connect()) as conn, conn:
+            conn.execute("UPDATE urls SET fetched_at = ? WHERE url_key = ?", (time.time(), self.url_key(url)))
+
+    def total_bytes(self) -> int:
+        with closing(self._connect()) as conn:
+            return conn.execute("SELECT COALESCE(SUM(size), 0) FROM blobs").fetchone()[0]
+
+    def evict(self) -> int:
+        """max_bytes를 넘는 만큼 오래된 파일부터 삭제. Returns: 삭제한 파일 수"""
+        evicted = 0
+        with closing(self._connect()) as conn, conn:
+            total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM blobs").fetchone()[0]
+            if total <= self.max_bytes:
+                return 0
+            for digest, size in conn.execute(
+                "SELECT digest, size FROM blobs ORDER BY last_access"
+            ).fetchall():
+                if total <= self.max_bytes:
+                    break
+                try:
+                    os.unlink(self.path_for(digest))
+                except FileNotFoundError:
+                    pass
+                conn.execute("DELETE FROM blobs WHERE digest = ?", (digest,))
+                conn.execute("DELETE FROM urls WHERE digest = ?", (digest,))
+                conn.execute("DELETE FROM variants WHERE digest = ?", (digest,))
+                total -= size
+                evicted += 1
+        if evicted:
+            logger.info(f"Image cache evicted {evicted} file(s), {total} bytes remain")
+        return evicted
+
+    def is_stale(self, entry: CachedImage) -> bool:
+        """IMAGE_CACHE_REVALIDATE_HOURS가 지나 서버에 재검증할 항목인지 (설정 없으면 항상 fresh)"""
+        hours = settings.IMAGE_CACHE_REVALIDATE_HOURS
+        return bool(hours) and time.time() - entry.fetched_at > hours * 3600
+
+
+# 싱글톤 인스턴스 (IMAGE_CACHE_DIR 미설정 시 시스템 임시 디렉터리)
+image_cache = ImageCache(
+    settings.IMAGE_CACHE_DIR or os.path.join(tempfile.gettempdir(), "velog_backup_images"),
+    settings.IMAGE_CACHE_MAX_BYTES,
+)
@@ -0,0 +1,274 @@
+import asyncio
+import hashlib
+import logging
+import multiprocessing
+import os
+import shutil
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import BinaryIO, Dict, List, Optional, Tuple
+
+from app.core.config import settings
+from app.services.image import ImageRef
+from app.services.image_cache import image_cache
+
+try:
+    from PIL import Image, ImageOps
+except ImportError:  # 선택 의존성 - 없으면 최적화 단계를 건너뜀
+    Image = ImageOps = None
+
+logger = logging.getLogger(__name__)
+
+_pool: Optional[ProcessPoolExecutor] = None
+_slots: Optional[asyncio.Semaphore] = None
+
+
+def _file_digest(f: BinaryIO) -> str:
+    f.seek(0)
+    digest = hashlib.sha256()
+    while chunk := f.read(settings.IMAGE_DOWNLOAD_CHUNK_BYTES):
+        digest.update(chunk)
+    f.seek(0)
+    return digest.hexdigest()
+
+
+def optimize_file(src: str, dst: str, max_dimension: int, webp: bool, jpeg_quality: int) -> Optional[Tuple[Optional[str], int, str]]:
+    """(프로세스 풀에서 실행) src 이미지를 변환해 dst에 저장
+
+    Returns: (바뀐 확장자 - 형식이 그대로면 None, 크기, sha256). 원본보다 작아지지 않으면 None
+    """
+    with Image.open(src) as img:
+        fmt = img.format
+        ext = None
+        if getattr(img, "is_animated", False):
+            # 애니메이션은 프레임을 그대로 두고 GIF → WebP 변환만
+            if not (webp and fmt == "GIF"):
+                return None
+            img.save(dst, "WEBP", save_all=True, lossless=True)
+            ext = ".webp"
+        else:
+            if fmt == "JPEG":
+                img = ImageOps.exif_transpose(img)  # 저장 시 EXIF 회전 정보가 빠지므로 미리 적용
+            if max(img.size) > max_dimension:
+                img.thumbnail((max_dimension, max_dimension), Image.Resampling.LANCZOS)
+            if webp and fmt in ("PNG", "GIF"):
+                has_alpha = img.mode in ("RGBA", "LA", "PA") or "transparency" in img.info
+                img.convert("RGBA" if has_alpha else "RGB").save(dst, "WEBP", lossless=True, method=4)
+                ext = ".webp"
+            elif fmt == "PNG":
+                img.save(dst, "PNG", optimize=True)
+            elif fmt == "JPEG":
+                img.convert("RGB").save(dst, "JPEG", quality=jpeg_quality, optimize=True, progressive=True)
+            else:
+                return None
+
+    size = os.path.getsize(dst)
+    if size >= os.path.getsize(src):
+        return None
+    with open(dst, "rb") as f:
+        return ext, size, _file_digest(f)
+
+
+def get_pool() -> ProcessPoolExecutor:
+    """이미지 변환용 프로세스 풀 (처음 쓸 때 생성)
+
+    웹/워커 프로세스는 스레드(asyncio.to_thread 등)를 쓰므로 fork 대신 spawn으로 자식 프로세스 생성
+    """
+    global _pool
+    if _pool is None:
+        _pool = ProcessPoolExecutor(
+            max_workers=settings.IMAGE_OPTIMIZE_WORKERS,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _pool
+
+
+def conversion_slots() -> asyncio.Semaphore:
+    """프로세스 풀 작업자 수만큼의 변환 슬롯
+
+    풀에 넣기 전에 슬롯을 잡아 풀 대기열에서 보내는 시간이 변환 시간 상한에 포함되지 않게 한다.
+    """
+    global _slots
+    if _slots is None:
+        _slots = asyncio.Semaphore(settings.IMAGE_OPTIMIZE_WORKERS)
+    return _slots
+
+
+def shutdown_pool():
+    global _pool, _slots
+    if _pool is not None:
+        _pool.shutdown(wait=False, cancel_futures=True)
+        _pool = None
+    _slots = None
+
+
+def _remove_files(*paths: Optional[str]):
+    for path in paths:
+        if path:
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
+
+
+class ImageOptimizer:
+    """ZIP 내보내기/GitHub 동기화 전 이미지 재압축 (사용자 설정 image_optimization_enabled)
+
+    - 긴 변이 IMAGE_OPTIMIZE_MAX_DIMENSION을 넘으면 축소, PNG/GIF는 무손실 WebP로 변환 (IMAGE_OPTIMIZE_WEBP)
+    - 변환은 프로세스 풀에서 실행하고, 결과는 원본 내용 해시로 이미지 캐시에 저장 (다음 백업에서 재사용)
+    - 원본보다 작아지지 않거나 변환에 실패하면 원본 사용
+    Pillow가 설치되지 않았으면 아무것도 하지 않는다.
+    """
+
+    def __init__(self):
+        self.variant = (
+            f"v1:{settings.IMAGE_OPTIMIZE_MAX_DIMENSION}:{int(settings.IMAGE_OPTIMIZE_WEBP)}:"
+            f"{settings.IMAGE_OPTIMIZE_JPEG_QUALITY}"
+        )
+        self.images = 0
+        self.optimized = 0
+        self.bytes_before = 0
+        self.bytes_after = 0
+
+    @staticmethod
+    def available() -> bool:
+        return Image is not None
+
+    def to_dict(self) -> dict:
+        return {
+            "images": self.images,
+            "optimized": self.optimized,
+            "bytes_before": self.bytes_before,
+            "bytes_after": self.bytes_after,
+            "bytes_saved": self.bytes_before - self.bytes_after,
+        }
+
+    async def optimize_all(self, downloaded: List[Tuple[ImageRef, BinaryIO]]) -> List[Tuple[ImageRef, BinaryIO]]:
+        """받은 이미지를 최적화 결과로 교체 (형식이 바뀌면 파일명 확장자도 변경)
+
+        새로 연 핸들도 결과에 들어 있으므로 호출자가 원본 핸들과 함께 close
+        """
+        if not self.available():
+            return downloaded
+        unique: Dict[int, BinaryIO] = {id(f): f for _, f in downloaded}
+        results = dict(zip(unique, await asyncio.gather(*(self._optimize(f) for f in unique.values()))))
+
+        optimized = []
+        for image, f in downloaded:
+            result = results[id(f)]
+            if result is None:
+                optimized.append((image, f))
+                continue
+            ext, out = result
+            if ext:
+                image = image._replace(name=os.path.splitext(image.filename)[0] + ext)
+            optimized.append((image, out))
+        return optimized
+
+    async def _optimize(self, f: BinaryIO) -> Optional[Tuple[Optional[str], BinaryIO]]:
+        """(바뀐 확장자, 최적화된 파일 핸들). 원본을 쓸 경우 None"""
+        size = os.fstat(f.fileno()).st_size
+        self.images += 1
+        self.bytes_before += size
+        result = None
+        if size >= settings.IMAGE_OPTIMIZE_MIN_BYTES:
+            try:
+                result = await self._convert(f)
+            except Exception as e:
+                logger.warning(f"Image optimization failed, keeping original: {e!r}")
+        if result is None:
+            self.bytes_after += size
+            return None
+        ext, out = result
+        self.optimized += 1
+        self.bytes_after += os.fstat(out.fileno()).st_size
+        return ext, out
+
+    async def _convert(self, f: BinaryIO) -> Optional[Tuple[Optional[str], BinaryIO]]:
+        use_cache = settings.IMAGE_CACHE_ENABLED
+        source_digest = await asyncio.to_thread(_file_digest, f)
+        if use_cache:
+            cached = await asyncio.to_thread(image_cache.lookup_variant, source_digest, self.variant)
+            if cached is not None:
+                if cached.entry is None:
+                    return None
+                out = await asyncio.to_thread(image_cache.open, cached.entry)
+                if out is not None:
+                    return cached.ext, out
+
+        result = await self._run_in_pool(f, use_cache)
+        if result is None:
+            if use_cache:
+                await asyncio.to_thread(image_cache.store_variant, source_digest, self.variant)
+            return None
+
+        ext, size, digest, dst_path = result
+        if use_cache:
+            cached = await asyncio.to_thread(
+                image_cache.store_variant, source_digest, self.variant, dst_path, digest, size, ext
+            )
+            out = await asyncio.to_thread(image_cache.open, cached.entry)
+            return (ext, out) if out is not None else None
+        out = open(dst_path, "rb")
+        os.unlink(dst_path)  # 연 핸들로만 읽음 (닫으면 삭제)
+        return ext, out
+
+    async def _run_in_pool(self, f: BinaryIO, use_cache: bool) -> Optional[Tuple[Optional[str], int, str, str]]:
+        """변환 슬롯을 잡고 프로세스 풀에서 optimize_file 실행 (시간 상한은 슬롯을 잡은 뒤부터)
+
+        Returns: (바뀐 확장자, 크기, sha256, 결과 파일 경로). 작아지지 않으면 None
+        시간 초과/취소되어도 자식 프로세스는 계속 실행되므로, 슬롯 반환과 임시 파일 정리는 변환이 실제로 끝난 뒤에 한다.
+        """
+        slots = conversion_slots()
+        await slots.acquire()
+        src_path = tmp_src = dst_path = None
+        try:
+            # 캐시 파일은 경로를 그대로 넘기고, 익명 임시 파일은 자식 프로세스가 열 수 있도록 복사
+            src_path = f.name if isinstance(getattr(f, "name", None), str) else None
+            if src_path is None:
+                tmp_src = src_path = await asyncio.to_thread(self._copy_to_temp, f)
+            if use_cache:
+                out, dst_path = await asyncio.to_thread(image_cache.temp_file)
+                out.close()
+            else:
+                fd, dst_path = tempfile.mkstemp(prefix="velog-opt-")
+                os.close(fd)
+            future = asyncio.get_running_loop().run_in_executor(
+                get_pool(), optimize_file, src_path, dst_path,
+                settings.IMAGE_OPTIMIZE_MAX_DIMENSION, settings.IMAGE_OPTIMIZE_WEBP,
+                settings.IMAGE_OPTIMIZE_JPEG_QUALITY,
+            )
+        except BaseException:
+            slots.release()
+            _remove_files(tmp_src, dst_path)
+            raise
+        future.add_done_callback(lambda _: slots.release())
+
+        try:
+            result = await asyncio.wait_for(asyncio.shield(future), settings.IMAGE_OPTIMIZE_TIMEOUT_SECONDS)
+        except BaseException as e:
+            if isinstance(e, BrokenProcessPool):
+                shutdown_pool()  # 자식 프로세스가 죽으면 다음 호출에서 새 풀 생성
+
+            def cleanup(done: asyncio.Future):
+                if not done.cancelled():
+                    done.exception()  # 시간 초과 뒤의 변환 오류는 버림
+                _remove_files(tmp_src, dst_path)
+
+            future.add_done_callback(cleanup)
+            raise
+        _remove_files(tmp_src)
+        if result is None:
+            _remove_files(dst_path)
+            return None
+        return (*result, dst_path)
+
+    @staticmethod
+    def _copy_to_temp(f: BinaryIO) -> str:
+        fd, path = tempfile.mkstemp(prefix="velog-src-")
+        f.seek(0)
+        with os.fdopen(fd, "wb") as dst:
+            shutil.copyfileobj(f, dst, settings.IMAGE_DOWNLOAD_CHUNK_BYTES)
+        f.seek(0)
+        return path
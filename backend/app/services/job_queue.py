@@ -0,0 +1,258 @@
+import logging
+from datetime import datetime, timezone, timedelta
+from typing import Dict, Optional
+
+from sqlalchemy import and_, func, or_, text
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.backup import BackupLog, BackupStatus
+from app.models.job import BackupJob, JobClass, JobStatus, JOB_PRIORITY
+from app.models.post import PostCache
+
+logger = logging.getLogger(__name__)
+
+# 예외로 끝난 작업의 재시도 지연 (시도 횟수마다 2배)
+RETRY_DELAY_SECONDS = 30
+
+# 대형 작업 claim을 직렬화하는 advisory lock 키 (임의의 고정값)
+LARGE_CLAIM_LOCK_KEY = 0x76656C6F
+
+
+class BackupJobQueue:
+    """Postgres 기반 백업 작업 큐
+
+    - enqueue: 웹 프로세스/스케줄러가 작업 추가 (클래스별 우선순위, 예상 작업량 기록)
+    - claim: 워커가 SELECT ... FOR UPDATE SKIP LOCKED로 작업 하나를 가져가 lease 획득
+      (lease가 만료된 RUNNING 작업도 회수 대상 - 워커 크래시/배포 중단 대비)
+      우선순위 → run_after 순으로 가져가되, 이미 실행 중인 사용자의 작업은 건너뛰고
+      대형 작업은 BACKUP_MAX_RUNNING_LARGE_JOBS개까지만 동시에 실행 (작은 계정이 밀리지 않도록)
+      상한 아래일 때는 pg_advisory_xact_lock으로 대형 작업 claim을 직렬화하고 잠금 후 다시 센다
+    - heartbeat: 실행 중 lease 연장 (다른 워커가 회수했으면 False)
+    - complete / release: 종료 기록, 셧다운 시 큐로 반환
+    """
+
+    @staticmethod
+    def enqueue(
+        db: Session,
+        user_id: int,
+        force: bool = False,
+        commit: bool = True,
+        job_class: JobClass = JobClass.MANUAL,
+    ) -> BackupJob:
+        """작업 추가 (commit=False면 호출자의 트랜잭션에 포함)"""
+        cost = db.query(func.count(PostCache.id)).filter(PostCache.user_id == user_id).scalar() or 0
+        job = BackupJob(
+            user_id=user_id,
+            force=force,
+            job_class=job_class,
+            priority=JOB_PRIORITY[job_class],
+            cost=cost,
+            status=JobStatus.QUEUED,
+            run_after=datetime.now(timezone.utc),
+        )
+        db.add(job)
+        if commit:
+            db.commit()
+            db.refresh(job)
+        else:
+            db.flush()
+        logger.info(f"Enqueued {job_class.value} backup job {job.id} for user {user_id} (cost {cost})")
+        return job
+
+    @staticmethod
+    def promote(db: Session, job: BackupJob, force: bool = False) -> BackupJob:
+        """대기 중인 예약 작업을 수동 작업으로 승격 (사용자가 직접 백업을 요청한 경우)"""
+        job.job_class = JobClass.MANUAL
+        job.priority = JOB_PRIORITY[JobClass.MANUAL]
+        job.force = job.force or force
+        db.commit()
+        db.refresh(job)
+        logger.info(f"Promoted backup job {job.id} to manual priority")
+        return job
+
+    @staticmethod
+    def active_job(db: Session, user_id: int) -> Optional[BackupJob]:
+        """대기 중이거나 실행 중인 작업"""
+        return db.query(BackupJob).filter(
+            BackupJob.user_id == user_id,
+            BackupJob.status.in_([JobStatus.QUEUED, JobStatus.RUNNING])
+        ).first()
+
+    @staticmethod
+    def claim(db: Session, worker_id: str) -> Optional[BackupJob]:
+        """실행할 작업 하나를 가져와 lease 획득 (없으면 None)"""
+        while True:
+            now = datetime.now(timezone.utc)
+            live = and_(BackupJob.status == JobStatus.RUNNING, BackupJob.lease_expires_at >= now)
+            queued = [
+                BackupJob.status == JobStatus.QUEUED,
+                BackupJob.run_after <= now,
+                # 사용자당 동시 실행 1개
+                BackupJob.user_id.notin_(db.query(BackupJob.user_id).filter(live)),
+            ]
+            large = BackupJob.cost >= settings.BACKUP_LARGE_ACCOUNT_POSTS
+            running_large = db.query(func.count(BackupJob.id)).filter(live, large).scalar()
+            if running_large < settings.BACKUP_MAX_RUNNING_LARGE_JOBS and BackupJobQueue._lock_large_claims(db):
+                # 다른 워커가 같은 시점에 센 뒤 대형 작업을 가져갔을 수 있으므로 잠금(커밋까지 유지) 후 다시 확인
+                running_large = db.query(func.count(BackupJob.id)).filter(live, large).scalar()
+            if running_large >= settings.BACKUP_MAX_RUNNING_LARGE_JOBS:
+                queued.append(BackupJob.cost < settings.BACKUP_LARGE_ACCOUNT_POSTS)
+
+            job = db.query(BackupJob).filter(
+                or_(
+                    and_(*queued),
+                    and_(BackupJob.status == JobStatus.RUNNING, BackupJob.lease_expires_at < now),
+                )
+            ).order_by(
+                BackupJob.priority, BackupJob.run_after, BackupJob.id
+            ).with_for_update(skip_locked=True).first()
+
+            if job is None:
+                db.rollback()
+                return None
+
+            if job.status == JobStatus.RUNNING:
+                logger.warning(f"Reclaiming backup job {job.id}: lease of {job.locked_by} expired")
+                BackupJobQueue._abandon_log(db, job, "워커 중단으로 작업이 회수됨")
+                if job.attempts >= settings.BACKUP_JOB_MAX_ATTEMPTS:
+                    job.status = JobStatus.FAILED
+                    job.error = f"Lease expired after {job.attempts} attempt(s)"
+                    job.locked_by = None
+                    job.finished_at = now
+                    db.commit()
+                    continue
+
+            job.status = JobStatus.RUNNING
+            job.locked_by = worker_id
+            job.attempts = (job.attempts or 0) + 1
+            job.lease_expires_at = now + timedelta(seconds=settings.BACKUP_JOB_LEASE_SECONDS)
+            job.heartbeat_at = now
+            job.started_at = now
+            db.commit()
+            db.refresh(job)
+            return job
+
+    @staticmethod
+    def _lock_large_claims(db: Session) -> bool:
+        """트랜잭션 advisory lock 획득 (PostgreSQL만 - SQLite는 쓰기가 이미 직렬화됨)"""
+        if db.get_bind().dialect.name != "postgresql":
+            return False
+        db.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": LARGE_CLAIM_LOCK_KEY})
+        return True
+
+    @staticmethod
+    def heartbeat(db: Session, job_id: int, worker_id: str) -> bool:
+        """lease 연장. Returns: lease를 여전히 보유하면 True"""
+        now = datetime.now(timezone.utc)
+        updated = db.query(BackupJob).filter(
+            BackupJob.id == job_id,
+            BackupJob.locked_by == worker_id,
+            BackupJob.status == JobStatus.RUNNING,
+        ).update({
+            BackupJob.lease_expires_at: now + timedelta(seconds=settings.BACKUP_JOB_LEASE_SECONDS),
+            BackupJob.heartbeat_at: now,
+        }, synchronize_session=False)
+        db.commit()
+        return updated == 1
+
+    @staticmethod
+    def complete(db: Session, job_id: int, worker_id: str, error: Optional[str] = None, retry: bool = False):
+        """작업 종료 기록 (retry=True면 시도 횟수가 남은 경우 지연 후 재실행)"""
+        job = BackupJobQueue._owned(db, job_id, worker_id)
+        if job is None:
+            return
+        now = datetime.now(timezone.utc)
+        job.error = error
+        job.locked_by = None
+        job.lease_expires_at = None
+        if retry and job.attempts < settings.BACKUP_JOB_MAX_ATTEMPTS:
+            job.status = JobStatus.QUEUED
+            job.run_after = now + timedelta(seconds=RETRY_DELAY_SECONDS * 2 ** (job.attempts - 1))
+            logger.warning(f"Backup job {job.id} failed (attempt {job.attempts}), retrying: {error}")
+        else:
+            job.status = JobStatus.FAILED if error else JobStatus.DONE
+            job.finished_at = now
+        db.commit()
+
+    @staticmethod
+    def release(db: Session, job_id: int, worker_id: str):
+        """셧다운으로 중단한 작업을 큐로 반환 (시도 횟수 차감)"""
+        job = BackupJobQueue._owned(db, job_id, worker_id)
+        if job is None:
+            return
+        BackupJobQueue._abandon_log(db, job, "워커 종료로 중단됨 - 다시 대기열에 추가")
+        job.status = JobStatus.QUEUED
+        job.attempts = max(0, (job.attempts or 0) - 1)
+        job.locked_by = None
+        job.lease_expires_at = None
+        job.run_after = datetime.now(timezone.utc)
+        db.commit()
+        logger.info(f"Released backup job {job.id} back to the queue")
+
+    @staticmethod
+    def stats(db: Session) -> Dict[str, dict]:
+        """클래스별 큐 상태
+
+        queued/running: 작업 수, oldest_wait_seconds: 가장 오래 기다린 대기 작업,
+        avg_wait_seconds: 최근 BACKUP_QUEUE_STATS_WINDOW_MINUTES 동안 시작된 작업의 평균 대기 시간
+        """
+        now = datetime.now(timezone.utc)
+        stats = {
+            job_class.value: {"queued": 0, "running": 0, "oldest_wait_seconds": 0.0, "avg_wait_seconds": None}
+            for job_class in JobClass
+        }
+
+        rows = db.query(
+            BackupJob.job_class, BackupJob.status, func.count(BackupJob.id), func.min(BackupJob.created_at)
+        ).filter(
+            BackupJob.status.in_([JobStatus.QUEUED, JobStatus.RUNNING])
+        ).group_by(BackupJob.job_class, BackupJob.status).all()
+        for job_class, status, count, oldest in rows:
+            entry = stats[job_class.value]
+            entry[status.value] = count
+            if status == JobStatus.QUEUED and oldest:
+                entry["oldest_wait_seconds"] = round((now - _as_utc(oldest)).total_seconds(), 1)
+
+        window_start = now - timedelta(minutes=settings.BACKUP_QUEUE_STATS_WINDOW_MINUTES)
+        waits: Dict[str, list] = {}
+        started = db.query(BackupJob.job_class, BackupJob.created_at, BackupJob.started_at).filter(
+            BackupJob.started_at >= window_start
+        ).all()
+        for job_class, created_at, started_at in started:
+            waits.setdefault(job_class.value, []).append(
+                (_as_utc(started_at) - _as_utc(created_at)).total_seconds()
+            )
+        for name, values in waits.items():
+            stats[name]["avg_wait_seconds"] = round(sum(values) / len(values), 1)
+        return stats
+
+    @staticmethod
+    def _owned(db: Session, job_id: int, worker_id: str) -> Optional[BackupJob]:
+        job = db.query(BackupJob).filter(
+            BackupJob.id == job_id,
+            BackupJob.locked_by == worker_id,
+            BackupJob.status == JobStatus.RUNNING,
+        ).with_for_update().first()
+        if job is None:
+            logger.warning(f"Backup job {job_id} is no longer leased by {worker_id}")
+        return job
+
+    @staticmethod
+    def _abandon_log(db: Session, job: BackupJob, message: str):
+        """중단된 실행의 IN_PROGRESS 로그를 실패로 마감"""
+        if not job.backup_log_id:
+            return
+        log = db.query(BackupLog).filter(
+            BackupLog.id == job.backup_log_id,
+            BackupLog.status == BackupStatus.IN_PROGRESS,
+        ).first()
+        if log:
+            log.status = BackupStatus.FAILED
+            log.message = message
+            log.completed_at = datetime.now(timezone.utc)
+
+
+def _as_utc(value: datetime) -> datetime:
+    """SQLite는 naive datetime을 반환"""
+    return value.replace(tzinfo=timezone.utc) if value.tzinfo is None else value
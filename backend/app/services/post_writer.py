@@ -0,0 +1,208 @@
+import asyncio
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set
+
+from sqlalchemy import update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.sql import func
+
+from app.core.config import settings
+from app.models.post import PostCache
+
+logger = logging.getLogger(__name__)
+
+# upsert 충돌 시 덮어쓰지 않는 컬럼 (식별자/생성 시각)
+IMMUTABLE_COLUMNS = {"id", "user_id", "slug", "created_at"}
+
+
+class PostCacheWriter:
+    """PostCache 일괄 쓰기
+
+    - upsert(): 신규/변경 포스트를 모아 batch_size마다
+      INSERT ... ON CONFLICT (user_id, slug) DO UPDATE 한 문장으로 기록 후 커밋
+    - touch(): 본문이 같은 포스트의 메타데이터만 id 기준 일괄 UPDATE
+    PostgreSQL은 uq_post_cache_user_slug 제약조건, SQLite(테스트)는 (user_id, slug) 인덱스로 충돌 판정.
+    배치 쓰기에 실패하면 롤백하고 해당 slug를 failed에 기록한다.
+    """
+
+    def __init__(self, db: Session, batch_size: Optional[int] = None):
+        self.db = db
+        self.batch_size = max(1, batch_size or settings.BACKUP_WRITE_BATCH_SIZE)
+        self.failed: Set[str] = set()
+        self.written = 0
+        self.batches = 0
+        self._rows: Dict[str, dict] = {}  # slug -> 행 (같은 slug는 마지막 값만)
+        self._touches: List[dict] = []
+
+    @property
+    def pending(self) -> int:
+        return len(self._rows) + len(self._touches)
+
+    def upsert(self, row: dict):
+        """신규/변경 포스트 행 추가 (user_id, slug 필수)"""
+        self._rows[row["slug"]] = row
+        if self.pending >= self.batch_size:
+            self.flush()
+
+    def touch(self, post_id: int, slug: str, values: dict):
+        """기존 행의 메타데이터만 갱신 (content는 건드리지 않음)"""
+        self._touches.append({"id": post_id, "_slug": slug, **values})
+        if self.pending >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        """대기 중인 행을 기록하고 커밋"""
+        if not self.pending:
+            return
+        rows, self._rows = list(self._rows.values()), {}
+        touches, self._touches = self._touches, []
+        try:
+            if rows:
+                self.db.execute(self._upsert_statement(rows))
+            if touches:
+                self.db.execute(
+                    update(PostCache),
+                    [{k: v for k, v in t.items() if k != "_slug"} for t in touches],
+                )
+            self.db.commit()
+            self.written += len(rows) + len(touches)
+            self.batches += 1
+        except Exception as e:
+            self.db.rollback()
+            slugs = [r["slug"] for r in rows] + [t["_slug"] for t in touches]
+            self.failed.update(slugs)
+            logger.error(f"PostCache batch write failed ({len(slugs)} rows): {e}")
+
+    def _upsert_statement(self, rows: List[dict]):
+        dialect = self.db.get_bind().dialect.name
+        if dialect == "postgresql":
+            stmt = postgresql.insert(PostCache).values(rows)
+            conflict = {"constraint": "uq_post_cache_user_slug"}
+        elif dialect == "sqlite":
+            stmt = sqlite.insert(PostCache).values(rows)
+            conflict = {"index_elements": ["user_id", "slug"]}
+        else:
+            raise NotImplementedError(f"Upsert not supported for dialect: {dialect}")
+
+        columns = {key for row in rows for key in row} - IMMUTABLE_COLUMNS
+        set_ = {column: stmt.excluded[column] for column in columns}
+        set_["updated_at"] = func.now()
+        return stmt.on_conflict_do_update(set_=set_, **conflict)
+
+
+class PostWriteStage:
+    """백업 파이프라인의 단일 writer 단계
+
+    fetch 코루틴들은 put()으로 결과를 bounded 큐에 넣기만 하고,
+    writer 태스크(run) 하나가 큐를 배치로 비우며 handle(writer, item)과 DB 쓰기를 수행한다.
+    DB I/O는 전용 스레드 1개(run_db)에서만 실행되어 이벤트 루프를 막지 않고,
+    네트워크 조회와 저장이 겹쳐 진행된다. writer 세션은 호출자 세션과 분리된 별도 세션.
+    on_checkpoint가 주어지면 checkpoint_seconds마다(그리고 종료 시) writer를 flush한 뒤
+    그 사이 커밋된 결과로 호출한다 (진행 상황 체크포인트 기록용).
+    """
+
+    def __init__(
+        self,
+        bind,
+        handle: Callable[[PostCacheWriter, Any], dict],
+        batch_size: Optional[int] = None,
+        queue_size: Optional[int] = None,
+        on_checkpoint: Optional[Callable[[List[dict]], Awaitable[None]]] = None,
+        checkpoint_seconds: Optional[float] = None,
+    ):
+        self.batch_size = max(1, batch_size or settings.BACKUP_WRITE_BATCH_SIZE)
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size or self.batch_size * 2)
+        self.handle = handle
+        self.on_checkpoint = on_checkpoint
+        self.checkpoint_seconds = (
+            settings.BACKUP_CHECKPOINT_SECONDS if checkpoint_seconds is None else checkpoint_seconds
+        )
+        self.db_seconds = 0.0  # DB 스레드 점유 시간 (단계별 소요 시간 기록용)
+        self.db_calls = 0
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="backup-db")
+        self._session = sessionmaker(bind=bind, autoflush=False)()
+        self.writer = PostCacheWriter(self._session, batch_size=self.batch_size)
+
+    async def run_db(self, fn: Callable, *args):
+        """DB 작업을 writer 전용 스레드에서 실행 (다른 세션의 커밋도 여기서 직렬화)"""
+        return await asyncio.get_running_loop().run_in_executor(self._executor, self._timed, fn, *args)
+
+    def _timed(self, fn: Callable, *args):
+        started = time.monotonic()
+        try:
+            return fn(*args)
+        finally:
+            self.db_seconds += time.monotonic() - started
+            self.db_calls += 1
+
+    async def put(self, item):
+        """fetch 결과 투입 (큐가 가득 차면 writer가 따라잡을 때까지 대기)"""
+        await self.queue.put(item)
+
+    async def finish(self):
+        """더 이상 투입할 결과가 없음을 알림"""
+        await self.queue.put(None)
+
+    async def run(self) -> List[dict]:
+        """finish()까지 큐를 배치 단위로 비우며 기록. Returns: handle 결과 목록"""
+        results = []
+        checkpointed = 0
+        last_checkpoint = time.monotonic()
+        done = False
+        while not done:
+            item = await self.queue.get()
+            if item is None:
+                break
+            items = [item]
+            while len(items) < self.batch_size:
+                try:
+                    item = self.queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    break
+                if item is None:
+                    done = True
+                    break
+                items.append(item)
+            try:
+                results.extend(await self.run_db(self._write_batch, items))
+            except Exception as e:
+                logger.error(f"Backup writer failed on {len(items)} items: {e}")
+                results.extend({'status': 'failed', 'error': str(e)} for _ in items)
+            if self.on_checkpoint and time.monotonic() - last_checkpoint >= self.checkpoint_seconds:
+                if await self._checkpoint(results[checkpointed:]):
+                    checkpointed = len(results)
+                last_checkpoint = time.monotonic()
+
+        await self._checkpoint(results[checkpointed:])
+        return results
+
+    async def _checkpoint(self, results: List[dict]) -> bool:
+        """대기 중인 쓰기를 커밋하고 결과 확정 (배치 실패분은 failed로)
+
+        체크포인트 기록에 실패해도 writer는 계속 진행 (실패분은 다음 체크포인트에 다시 포함).
+        Returns: 성공 여부
+        """
+        try:
+            await self.run_db(self.writer.flush)
+            for result in results:
+                if result.get('slug') in self.writer.failed:
+                    result['status'] = 'failed'
+            if self.on_checkpoint:
+                await self.on_checkpoint(results)
+        except Exception as e:
+            logger.error(f"Backup checkpoint failed ({len(results)} results): {e}")
+            return False
+        return True
+
+    def _write_batch(self, items: List) -> List[dict]:
+        return [self.handle(self.writer, item) for item in items]
+
+    async def aclose(self):
+        """writer 세션/스레드 정리"""
+        try:
+            await self.run_db(self._session.close)
+        finally:
+            self._executor.shutdown(wait=False)
@@ -0,0 +1,240 @@
+import asyncio
+import json
+import logging
+import threading
+import time
+from collections import Counter
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, Optional, Set
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# 백업이 끝났음을 나타내는 이벤트 status (스트림 종료)
+TERMINAL_STATUSES = {"success", "failed", "idle"}
+
+# 구독자별 버퍼 (가득 차면 오래된 이벤트부터 버림 - 최신 상태만 중요)
+SUBSCRIBER_QUEUE_SIZE = 16
+
+
+class ProgressBus:
+    """사용자별 백업 진행 상황 pub/sub
+
+    - 기본: 프로세스 내 구독자 큐로 바로 전달 (웹 프로세스 안에서 워커 실행 시)
+    - REDIS_URL 설정 시: 발행은 Redis 채널로, 웹 프로세스는 채널을 패턴 구독해 로컬 구독자에게 fan-out
+      (워커가 별도 프로세스/호스트여도 전달). 진행 중인 마지막 이벤트는 키로 보관해 늦게 연결한 구독자에게 전달.
+    Redis 오류 시 로컬 전달로 폴백한다.
+    """
+
+    PREFIX = "velog_backup:progress:"
+    LAST_TTL_SECONDS = 3600
+
+    def __init__(self, redis_url: Optional[str] = None):
+        self.redis_url = redis_url
+        self._subscribers: Dict[int, Set[asyncio.Queue]] = {}
+        self._last: Dict[int, dict] = {}
+        self._redis = None
+        self._listener: Optional[asyncio.Task] = None
+
+    @property
+    def shared(self) -> bool:
+        """다른 프로세스(별도 워커)의 발행도 받는지 여부"""
+        return self._get_redis() is not None
+
+    def _get_redis(self):
+        if self._redis is None and self.redis_url:
+            try:
+                import redis.asyncio as redis
+                self._redis = redis.from_url(self.redis_url)
+            except Exception as e:
+                logger.warning(f"Redis progress bus unavailable, using local delivery: {e}")
+                self.redis_url = None
+        return self._redis
+
+    async def publish(self, user_id: int, event: dict):
+        """진행 이벤트 발행"""
+        redis = self._get_redis()
+        if redis is not None:
+            try:
+                payload = json.dumps(event, default=str)
+                pipe = redis.pipeline()
+                # 완료 이벤트는 보관하지 않음 (로컬 전달과 동일 - 다음 실행에 늦게 연결한 구독자가 받지 않도록)
+                if event.get("status") in TERMINAL_STATUSES:
+                    pipe.delete(f"{self.PREFIX}last:{user_id}")
+                else:
+                    pipe.set(f"{self.PREFIX}last:{user_id}", payload, ex=self.LAST_TTL_SECONDS)
+                pipe.publish(f"{self.PREFIX}{user_id}", payload)
+                await pipe.execute()
+                return
+            except Exception as e:
+                logger.warning(f"Redis progress publish failed, delivering locally: {e}")
+        self._deliver(user_id, event)
+
+    def _deliver(self, user_id: int, event: dict):
+        if event.get("status") in TERMINAL_STATUSES:
+            self._last.pop(user_id, None)
+        else:
+            self._last[user_id] = event
+        for queue in self._subscribers.get(user_id, ()):
+            if queue.full():
+                queue.get_nowait()
+            queue.put_nowait(event)
+
+    async def last_event(self, user_id: int) -> Optional[dict]:
+        """가장 최근 이벤트 (없으면 None)"""
+        redis = self._get_redis()
+        if redis is not None:
+            try:
+                payload = await redis.get(f"{self.PREFIX}last:{user_id}")
+                return json.loads(payload) if payload else None
+            except Exception as e:
+                logger.warning(f"Redis progress lookup failed: {e}")
+        return self._last.get(user_id)
+
+    @asynccontextmanager
+    async def subscribe(self, user_id: int) -> AsyncIterator[asyncio.Queue]:
+        """사용자 진행 이벤트 구독 (마지막 이벤트가 있으면 먼저 전달)"""
+        if self._get_redis() is not None and (self._listener is None or self._listener.done()):
+            self._listener = asyncio.create_task(self._listen())
+
+        queue: asyncio.Queue = asyncio.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
+        self._subscribers.setdefault(user_id, set()).add(queue)
+        last = await self.last_event(user_id)
+        if last and queue.empty():
+            queue.put_nowait(last)
+        try:
+            yield queue
+        finally:
+            subscribers = self._subscribers.get(user_id)
+            if subscribers is not None:
+                subscribers.discard(queue)
+                if not subscribers:
+                    del self._subscribers[user_id]
+
+    async def _listen(self):
+        """Redis 채널 → 로컬 구독자 fan-out (연결이 끊기면 재연결)"""
+        while True:
+            pubsub = self._redis.pubsub()
+            try:
+                await pubsub.psubscribe(f"{self.PREFIX}*")
+                async for message in pubsub.listen():
+                    if message.get("type") != "pmessage":
+                        continue
+                    channel = message["channel"]
+                    if isinstance(channel, bytes):
+                        channel = channel.decode()
+                    try:
+                        user_id = int(channel.rsplit(":", 1)[1])
+                    except ValueError:
+                        continue
+                    if user_id in self._subscribers:
+                        self._deliver(user_id, json.loads(message["data"]))
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Progress subscription lost, reconnecting: {e}")
+                await asyncio.sleep(1.0)
+            finally:
+                await pubsub.aclose()
+
+    async def aclose(self):
+        if self._listener is not None:
+            self._listener.cancel()
+            try:
+                await self._listener
+            except asyncio.CancelledError:
+                pass
+            self._listener = None
+        if self._redis is not None:
+            await self._redis.aclose()
+            self._redis = None
+
+
+class BackupProgress:
+    """백업 실행 한 번의 진행 상황 (단계, 처리 카운터, ETA)
+
+    record()는 writer 스레드에서도 호출되므로 잠금으로 보호하고,
+    발행은 run() 태스크가 PROGRESS_PUBLISH_SECONDS마다 변경이 있을 때만 한다.
+    """
+
+    def __init__(self, user_id: int, log_id: int, bus: Optional[ProgressBus] = None):
+        self.user_id = user_id
+        self.log_id = log_id
+        self.bus = bus or progress_bus
+        self.phase = "starting"
+        self.total = 0
+        self.resumed = 0
+        self.counts: Counter = Counter()
+        self.fetched = 0  # 이번 실행에서 본문을 조회해 처리한 포스트 수 (ETA 계산용)
+        self._lock = threading.Lock()
+        self._started = time.monotonic()
+        self._version = 0
+        self._published = -1
+
+    def record(self, status: str, fetched: bool = True):
+        with self._lock:
+            self.counts[status] += 1
+            if fetched:
+                self.fetched += 1
+            self._version += 1
+
+    def add_total(self, count: int):
+        with self._lock:
+            self.total += count
+            self._version += 1
+
+    def set_phase(self, phase: str):
+        self.phase = phase
+        self._version += 1
+
+    @property
+    def processed(self) -> int:
+        return sum(self.counts.values())
+
+    def eta_seconds(self) -> Optional[float]:
+        """남은 포스트 / 이번 실행의 처리 속도 (목록 조회 중이면 지금까지 본 목록 기준)"""
+        remaining = max(0, self.total - self.processed)
+        if remaining == 0:
+            return 0.0
+        elapsed = time.monotonic() - self._started
+        if not self.fetched or elapsed <= 0:
+            return None
+        return round(remaining / (self.fetched / elapsed), 1)
+
+    def snapshot(self, status: str = "in_progress", message: Optional[str] = None) -> dict:
+        with self._lock:
+            event = {
+                "log_id": self.log_id,
+                "status": status,
+                "phase": self.phase,
+                "total": self.total,
+                "processed": self.processed,
+                "new": self.counts["new"],
+                "updated": self.counts["updated"],
+                "skipped": self.counts["skipped"],
+                "failed": self.counts["failed"],
+                "resumed": self.resumed,
+                "eta_seconds": self.eta_seconds() if status == "in_progress" else None,
+            }
+        if message:
+            event["message"] = message
+        return event
+
+    async def publish(self, status: str = "in_progress", message: Optional[str] = None):
+        self._published = self._version
+        try:
+            await self.bus.publish(self.user_id, self.snapshot(status, message))
+        except Exception as e:
+            logger.warning(f"Failed to publish backup progress: {e}")
+
+    async def run(self):
+        """변경이 있을 때만 주기적으로 발행 (취소될 때까지)"""
+        while True:
+            if self._version != self._published:
+                await self.publish()
+            await asyncio.sleep(settings.PROGRESS_PUBLISH_SECONDS)
+
+
+# 싱글톤 인스턴스 (REDIS_URL이 있으면 프로세스 간 공유)
+progress_bus = ProgressBus(settings.REDIS_URL if settings.PROGRESS_SHARED else None)
@@ -0,0 +1,204 @@
+import asyncio
+import logging
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+from app.core.config import settings
+from app.core.metrics import VELOG_RATE_LIMIT_FALLBACK
+
+logger = logging.getLogger(__name__)
+
+# (버킷 키, 초당 보충량, 최대 토큰)
+BucketSpec = Tuple[str, float, float]
+
+# 이 시간(초) 안에 요청한 사용자를 활성 사용자로 보고 예산을 나눈다
+ACTIVE_WINDOW_SECONDS = 10.0
+
+
+class LocalTokenBucketStore:
+    """프로세스 내 토큰 버킷 상태 (단일 워커 또는 Redis 미설정 시)"""
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic):
+        self.clock = clock
+        self._buckets: Dict[str, Tuple[float, float]] = {}  # key -> (tokens, updated_at)
+        self._active: Dict[str, float] = {}
+
+    async def take(self, buckets: List[BucketSpec]) -> float:
+        """모든 버킷에서 토큰 1개씩 원자적으로 차감 (하나라도 부족하면 차감 없이 대기 시간 반환)"""
+        now = self.clock()
+        levels = []
+        wait = 0.0
+        for key, rate, burst in buckets:
+            tokens, updated_at = self._buckets.get(key, (burst, now))
+            tokens = min(burst, tokens + (now - updated_at) * rate)
+            levels.append(tokens)
+            if tokens < 1:
+                wait = max(wait, (1 - tokens) / rate)
+        for (key, _, _), tokens in zip(buckets, levels):
+            self._buckets[key] = (tokens - 1 if wait == 0 else tokens, now)
+        return wait
+
+    async def active_users(self, user_key: str) -> int:
+        """user_key를 활성으로 표시하고 현재 활성 사용자 수 반환"""
+        now = self.clock()
+        self._active[user_key] = now
+        cutoff = now - ACTIVE_WINDOW_SECONDS
+        for key in [k for k, seen in self._active.items() if seen < cutoff]:
+            del self._active[key]
+        return len(self._active)
+
+    async def aclose(self):
+        pass
+
+
+# KEYS: 버킷 키들, ARGV: 버킷별 (rate, burst) 반복
+# 모든 버킷에 토큰이 있으면 1개씩 차감하고 0, 아니면 차감 없이 대기 초 반환
+TAKE_SCRIPT = """
+local t = redis.call('TIME')
+local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+local wait = 0
+local levels = {}
+for i = 1, #KEYS do
+    local rate = tonumber(ARGV[2 * i - 1])
+    local burst = tonumber(ARGV[2 * i])
+    local state = redis.call('HMGET', KEYS[i], 'tokens', 'ts')
+    local tokens = tonumber(state[1]) or burst
+    local ts = tonumber(state[2]) or now
+    tokens = math.min(burst, tokens + math.max(0, now - ts) * rate)
+    levels[i] = tokens
+    if tokens < 1 then
+        wait = math.max(wait, (1 - tokens) / rate)
+    end
+end
+for i = 1, #KEYS do
+    local rate = tonumber(ARGV[2 * i - 1])
+    local burst = tonumber(ARGV[2 * i])
+    local tokens = levels[i]
+    if wait == 0 then
+        tokens = tokens - 1
+    end
+    redis.call('HSET', KEYS[i], 'tokens', tokens, 'ts', now)
+    redis.call('EXPIRE', KEYS[i], math.ceil(burst / rate) + 60)
+end
+return tostring(wait)
+"""
+
+
+class RedisTokenBucketStore:
+    """Redis 공유 토큰 버킷 상태 (여러 워커/호스트가 같은 예산을 공유)"""
+
+    PREFIX = "velog_backup:{velog_rate}:"
+
+    def __init__(self, redis_url: str):
+        import redis.asyncio as redis
+
+        self._redis = redis.from_url(redis_url)
+        self._take = self._redis.register_script(TAKE_SCRIPT)
+
+    async def take(self, buckets: List[BucketSpec]) -> float:
+        keys = [f"{self.PREFIX}{key}" for key, _, _ in buckets]
+        args = []
+        for _, rate, burst in buckets:
+            args.extend([rate, burst])
+        result = await self._take(keys=keys, args=args)
+        return float(result)
+
+    async def active_users(self, user_key: str) -> int:
+        key = f"{self.PREFIX}active"
+        now = time.time()
+        pipe = self._redis.pipeline()
+        pipe.zadd(key, {user_key: now})
+        pipe.zremrangebyscore(key, 0, now - ACTIVE_WINDOW_SECONDS)
+        pipe.zcard(key)
+        pipe.expire(key, int(ACTIVE_WINDOW_SECONDS * 2))
+        _, _, count, _ = await pipe.execute()
+        return max(1, int(count))
+
+    async def aclose(self):
+        await self._redis.aclose()
+
+
+class VelogRateLimiter:
+    """프로세스/클러스터 전역 Velog 요청 토큰 버킷
+
+    - 전역 버킷: 모든 작업을 합친 요청률을 rate(초당)로 제한
+    - 사용자별 버킷: 활성 사용자 n명이 rate/n씩 나눠 써서 한 사용자가 예산을 독점하지 못함
+    두 버킷에서 동시에 토큰을 얻어야 요청 가능. REDIS_URL이 있으면 상태를 Redis에 두어
+    여러 워커 프로세스가 같은 예산을 공유한다.
+    """
+
+    def __init__(
+        self,
+        rate: Optional[float] = None,
+        burst: Optional[float] = None,
+        store=None,
+    ):
+        self.rate = rate or settings.VELOG_RATE_LIMIT_PER_SECOND
+        self.burst = max(1.0, burst or settings.VELOG_RATE_LIMIT_BURST)
+        self._store = store
+        # Redis 오류 시 잠시 쓰는 프로세스 로컬 상태 (_fallback_until이 지나면 Redis 재시도)
+        self._local: Optional[LocalTokenBucketStore] = None
+        self._fallback_until: Optional[float] = None
+
+    def _get_store(self):
+        if self._store is None:
+            self._store = LocalTokenBucketStore()
+            if settings.REDIS_URL and settings.VELOG_RATE_LIMIT_SHARED:
+                try:
+                    self._store = RedisTokenBucketStore(settings.REDIS_URL)
+                    logger.info("Velog rate limiter using shared Redis state")
+                except Exception as e:
+                    logger.warning(f"Redis rate limiter unavailable, using local state: {e}")
+        if self._fallback_until is not None and time.monotonic() < self._fallback_until:
+            if self._local is None:
+                self._local = LocalTokenBucketStore()
+            return self._local
+        return self._store
+
+    def _fall_back(self, error: Exception):
+        """Redis 오류 - VELOG_RATE_LIMIT_REDIS_RETRY_SECONDS 동안 로컬 예산 사용"""
+        retry = settings.VELOG_RATE_LIMIT_REDIS_RETRY_SECONDS
+        if self._fallback_until is None:
+            logger.warning(f"Redis rate limiter failed, using local state for {retry:.0f}s: {error}")
+            VELOG_RATE_LIMIT_FALLBACK.set(1)
+        else:
+            logger.warning(f"Redis rate limiter still failing, retrying in {retry:.0f}s: {error}")
+        self._fallback_until = time.monotonic() + retry
+
+    def _recovered(self):
+        logger.info("Redis rate limiter recovered, using shared state again")
+        VELOG_RATE_LIMIT_FALLBACK.set(0)
+        self._fallback_until = None
+
+    async def acquire(self, user_key: str = "anonymous") -> float:
+        """토큰을 얻을 때까지 대기. Returns: 대기한 시간(초)"""
+        waited = 0.0
+        while True:
+            store = self._get_store()
+            try:
+                active = await store.active_users(user_key)
+                share = self.rate / max(1, active)
+                wait = await store.take([
+                    ("global", self.rate, self.burst),
+                    (f"user:{user_key}", share, max(1.0, self.burst / max(1, active))),
+                ])
+            except Exception as e:
+                if isinstance(store, LocalTokenBucketStore):
+                    raise
+                self._fall_back(e)
+                continue
+            if self._fallback_until is not None and store is self._store:
+                self._recovered()
+            if wait <= 0:
+                return waited
+            waited += wait
+            await asyncio.sleep(wait)
+
+    async def aclose(self):
+        if self._store is not None:
+            await self._store.aclose()
+            self._store = None
+
+
+# 싱글톤 인스턴스 (모든 백업 작업이 공유)
+velog_rate_limiter = VelogRateLimiter()
@@ -0,0 +1,122 @@
+import asyncio
+import logging
+import random
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Optional
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# 재시도 대상 HTTP 상태 코드
+RETRYABLE_STATUS = {429, 500, 502, 503, 504}
+
+
+class CircuitOpenError(RuntimeError):
+    """서킷이 열린 상태로 대기 한도를 넘겼을 때 발생"""
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Retry-After 헤더(초 또는 HTTP-date)를 대기 초로 변환"""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+def backoff_delay(attempt: int, base: Optional[float] = None, cap: Optional[float] = None) -> float:
+    """지수 백오프 + full jitter (attempt는 0부터)"""
+    base = settings.VELOG_BACKOFF_BASE_SECONDS if base is None else base
+    cap = settings.VELOG_BACKOFF_MAX_SECONDS if cap is None else cap
+    return random.uniform(0, min(cap, base * (2 ** attempt)))
+
+
+class CircuitBreaker:
+    """프로세스 전역 서킷 브레이커
+
+    - closed: 정상. 연속 실패가 failure_threshold에 도달하면 open
+    - open: reset_timeout 동안 모든 호출자가 요청을 보내지 않고 대기 (진행 중인 백업 일시정지)
+    - half_open: 하나의 probe 요청만 통과. 성공하면 closed, 실패하면 다시 open
+    호출자는 최대 max_wait초까지 기다리고, 넘기면 CircuitOpenError.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: Optional[int] = None,
+        reset_timeout: Optional[float] = None,
+        max_wait: Optional[float] = None,
+    ):
+        self.name = name
+        self.failure_threshold = failure_threshold or settings.VELOG_CIRCUIT_FAILURE_THRESHOLD
+        self.reset_timeout = reset_timeout or settings.VELOG_CIRCUIT_RESET_SECONDS
+        self.max_wait = max_wait or settings.VELOG_CIRCUIT_MAX_WAIT_SECONDS
+
+        self.state = "closed"
+        self.failures = 0
+        self.opened_at = 0.0
+        self._probe_in_flight = False
+
+    async def wait_until_available(self, max_wait: Optional[float] = None):
+        """요청 가능 상태가 될 때까지 대기 (probe 권한을 얻으면 즉시 반환)
+
+        max_wait: 이 호출의 최대 대기 시간 (0이면 대기 없이 즉시 판단)
+        """
+        deadline = time.monotonic() + (self.max_wait if max_wait is None else max_wait)
+        while True:
+            if self.state == "closed":
+                return
+
+            now = time.monotonic()
+            if self.state == "open" and now >= self.opened_at + self.reset_timeout:
+                self.state = "half_open"
+                logger.info(f"Circuit '{self.name}' half-open: sending probe request")
+            if self.state == "half_open" and not self._probe_in_flight:
+                self._probe_in_flight = True
+                return
+
+            if self.state == "open":
+                wait = self.opened_at + self.reset_timeout - now
+            else:
+                wait = min(1.0, self.reset_timeout)
+            if now + wait > deadline:
+                raise CircuitOpenError(f"Circuit '{self.name}' is open")
+            await asyncio.sleep(wait)
+
+    def record_success(self):
+        """요청 성공 (엔드포인트 응답 정상)"""
+        if self.state != "closed":
+            logger.info(f"Circuit '{self.name}' closed")
+        self.state = "closed"
+        self.failures = 0
+        self._probe_in_flight = False
+
+    def record_failure(self):
+        """엔드포인트 장애로 판단되는 실패 (네트워크 오류, 5xx)"""
+        self.failures += 1
+        self._probe_in_flight = False
+        if self.state == "half_open" or self.failures >= self.failure_threshold:
+            if self.state != "open":
+                logger.warning(f"Circuit '{self.name}' opened after {self.failures} failure(s)")
+            self.state = "open"
+            self.opened_at = time.monotonic()
+
+    def release_probe(self):
+        """probe 요청이 결과 없이 끝난 경우 (취소 등) 다른 호출자가 probe할 수 있게 해제"""
+        self._probe_in_flight = False
+
+
+# Velog GraphQL 엔드포인트용 (프로세스 내 모든 백업 작업이 공유)
+velog_breaker = CircuitBreaker("velog")
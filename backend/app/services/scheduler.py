@@ -0,0 +1,73 @@
+import logging
+import random
+from datetime import datetime, timezone, timedelta
+from typing import List, Optional, Tuple
+
+from sqlalchemy import or_
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.job import JobClass
+from app.models.user import User
+from app.services.job_queue import BackupJobQueue
+
+logger = logging.getLogger(__name__)
+
+
+class BackupScheduler:
+    """자동 백업 스케줄러
+
+    velog_username이 있고 자동 백업이 켜진 사용자의 next_auto_backup_at이 지나면 작업 큐에 추가한다.
+    - 최초 일정은 주기 안에서 무작위로, 이후 일정은 주기 ±AUTO_BACKUP_JITTER_RATIO로 분산해
+      모든 사용자가 같은 시각에 Velog를 호출하지 않게 한다.
+    - 대상 사용자 행을 FOR UPDATE SKIP LOCKED로 잠그고 같은 트랜잭션에서 다음 일정을 기록하므로
+      여러 노드에서 동시에 실행해도 같은 사용자를 두 번 예약하지 않는다.
+    """
+
+    @staticmethod
+    def interval_hours(user: User) -> int:
+        hours = user.auto_backup_interval_hours or settings.AUTO_BACKUP_DEFAULT_INTERVAL_HOURS
+        return min(settings.AUTO_BACKUP_MAX_INTERVAL_HOURS, max(settings.AUTO_BACKUP_MIN_INTERVAL_HOURS, hours))
+
+    @staticmethod
+    def next_run_at(interval_hours: int, now: Optional[datetime] = None) -> datetime:
+        """다음 실행 시각 (주기 ± jitter)"""
+        now = now or datetime.now(timezone.utc)
+        interval = timedelta(hours=interval_hours).total_seconds()
+        jitter = interval * settings.AUTO_BACKUP_JITTER_RATIO
+        return now + timedelta(seconds=interval + random.uniform(-jitter, jitter))
+
+    @staticmethod
+    def initial_run_at(interval_hours: int, now: Optional[datetime] = None) -> datetime:
+        """처음 예약하는 사용자의 실행 시각 (주기 안에서 균등 분산)"""
+        now = now or datetime.now(timezone.utc)
+        return now + timedelta(seconds=random.uniform(0, timedelta(hours=interval_hours).total_seconds()))
+
+    @staticmethod
+    def schedule_due(db: Session, limit: Optional[int] = None) -> List[Tuple[int, int]]:
+        """실행 시각이 된 사용자의 백업 작업 추가. Returns: 추가한 작업의 (user_id, job_id) 목록"""
+        now = datetime.now(timezone.utc)
+        users = db.query(User).filter(
+            User.velog_username.isnot(None),
+            User.is_active.is_(True),
+            User.auto_backup_enabled.is_(True),
+            or_(User.next_auto_backup_at.is_(None), User.next_auto_backup_at <= now),
+        ).order_by(
+            User.next_auto_backup_at.asc().nullsfirst(), User.id
+        ).limit(limit or settings.BACKUP_SCHEDULER_BATCH_SIZE).with_for_update(skip_locked=True).all()
+
+        enqueued = []
+        for user in users:
+            interval = BackupScheduler.interval_hours(user)
+            if user.next_auto_backup_at is None:
+                user.next_auto_backup_at = BackupScheduler.initial_run_at(interval, now)
+                continue
+            if not BackupJobQueue.active_job(db, user.id):
+                job = BackupJobQueue.enqueue(db, user.id, commit=False, job_class=JobClass.SCHEDULED)
+                enqueued.append((user.id, job.id))
+            user.next_auto_backup_at = BackupScheduler.next_run_at(interval, now)
+
+        db.commit()
+        if enqueued:
+            logger.info(f"Scheduler enqueued {len(enqueued)} automatic backup(s)")
+        return enqueued
@@ -0,0 +1,40 @@
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator
+
+
+class PhaseTimer:
+    """백업 단계별 소요 시간과 카운터
+
+    phase()로 감싼 구간의 경과 시간(초)을 단계 이름별로 합산하고,
+    record()로 요청 수/바이트/재시도 등 카운터를 함께 기록한다.
+    목록 조회/본문 조회/DB 쓰기는 파이프라인으로 겹쳐 진행되므로 단계 시간의 합은 전체 시간보다 클 수 있다.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic):
+        self.clock = clock
+        self.phases: Dict[str, dict] = {}
+        self._started = clock()
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        started = self.clock()
+        try:
+            yield
+        finally:
+            self.record(name, seconds=self.clock() - started)
+
+    def record(self, name: str, **counters):
+        """단계 카운터 누적 (seconds 포함)"""
+        entry = self.phases.setdefault(name, {"seconds": 0.0})
+        for key, value in counters.items():
+            entry[key] = entry.get(key, 0) + value
+
+    def to_dict(self) -> dict:
+        return {
+            "total_seconds": round(self.clock() - self._started, 3),
+            "phases": {
+                name: {k: round(v, 3) if isinstance(v, float) else v for k, v in entry.items()}
+                for name, entry in self.phases.items()
+            },
+        }
@@ -1,22 +1,215 @@
-import httpx
+import asyncio
 import hashlib
 import logging
-from typing import List, Optional, Dict
+import time
+from collections import Counter, defaultdict
+from datetime import datetime, timezone
+from typing import AsyncIterator, List, Optional, Dict, Tuple
+
+import httpx
+
+from app.core.config import settings
+from app.core.http import http_clients
+from app.services.concurrency import AdaptiveLimiter
+from app.services.rate_limit import velog_rate_limiter
+from app.services.resilience import (
+    RETRYABLE_STATUS, CircuitOpenError, velog_breaker, backoff_delay, parse_retry_after,
+)
 
 logger = logging.getLogger(__name__)
 
+# 포스트 본문 조회 시 가져오는 필드 (단건/일괄 조회 공통)
+POST_FIELDS = """
+                id
+                title
+                released_at
+                updated_at
+                body
+                short_description
+                thumbnail
+                tags
+                is_private
+                url_slug
+"""
+
+
+class PostBatchSizer:
+    """일괄 조회 배치 크기 관리
+
+    응답 크기를 관찰해 포스트당 평균 크기를 추정하고,
+    응답이 max_bytes를 넘지 않도록 배치 크기를 자동으로 줄인다 (최대 size까지 회복).
+    """
+
+    def __init__(self, size: Optional[int] = None, max_bytes: Optional[int] = None):
+        self.max_size = max(1, size or settings.VELOG_BATCH_SIZE)
+        self.max_bytes = max_bytes or settings.VELOG_BATCH_MAX_BYTES
+        self.size = self.max_size
+
+    def observe(self, batch_len: int, payload_bytes: int):
+        """배치 응답 크기로 다음 배치 크기 조정"""
+        if batch_len <= 0 or payload_bytes <= 0:
+            return
+        avg_bytes = payload_bytes / batch_len
+        fit = int(self.max_bytes // avg_bytes) if avg_bytes else self.max_size
+        new_size = max(1, min(self.max_size, fit))
+        if new_size < self.size:
+            logger.info(f"Velog batch size shrunk {self.size} -> {new_size} (payload {payload_bytes} bytes)")
+        self.size = new_size
+
+    def shrink(self):
+        """배치 실패 시 크기 절반으로 축소"""
+        self.size = max(1, self.size // 2)
+
 
 class VelogService:
-    """Velog GraphQL API 서비스"""
+    """Velog GraphQL API 서비스
+
+    limiter: 백업 작업 단위 적응형 동시성 제한기 (지정 시 모든 요청이 슬롯을 거침)
+    rate_key: 전역 요청률 예산을 나눠 쓰는 단위 (보통 사용자 ID)
+    """
+
+    GRAPHQL_ENDPOINT = settings.VELOG_GRAPHQL_URL
 
-    GRAPHQL_ENDPOINT = "https://v2.velog.io/graphql"
+    def __init__(self, limiter: Optional[AdaptiveLimiter] = None, rate_key: str = "anonymous"):
+        self.limiter = limiter
+        self.rate_key = rate_key
+        self.retries = 0
+        self.rate_limited_seconds = 0.0
+        self.list_cursor: Optional[str] = None  # 마지막으로 yield한 목록 페이지 다음 커서
+        # 요청 종류(op)별 통계: requests, bytes, retries, seconds (재시도/대기 포함 소요 시간)
+        self.op_stats: Dict[str, Counter] = defaultdict(Counter)
+
+    async def _post_graphql(
+        self,
+        query: str,
+        variables: Dict,
+        timeout: Optional[float] = None,
+        interactive: bool = False,
+        op: str = "other"
+    ) -> Tuple[Dict, int]:
+        """GraphQL 요청 전송 후 (응답 JSON, 응답 바이트 수) 반환
+
+        네트워크 오류/429/5xx는 jitter 지수 백오프로 재시도하고 Retry-After를 따른다.
+        엔드포인트 장애 시 공유 서킷 브레이커가 열려 모든 백업 작업이 함께 대기한다.
+        interactive: API 요청 처리 중 호출 - 재시도/서킷 대기 없이 즉시 실패
+        op: 요청 종류 (listing, fetch 등) - op_stats 집계 키
+        """
+        started = time.monotonic()
+        try:
+            return await self._post_graphql_with_retry(query, variables, timeout, interactive, op)
+        finally:
+            self.op_stats[op]["seconds"] += time.monotonic() - started
+
+    async def _post_graphql_with_retry(
+        self,
+        query: str,
+        variables: Dict,
+        timeout: Optional[float],
+        interactive: bool,
+        op: str
+    ) -> Tuple[Dict, int]:
+        stats = self.op_stats[op]
+        max_retries = 0 if interactive else settings.VELOG_MAX_RETRIES
+        attempt = 0
+        while True:
+            await velog_breaker.wait_until_available(max_wait=0 if interactive else None)
+            stats["requests"] += 1
+            try:
+                response = await self._send(query, variables, timeout)
+            except httpx.TransportError as e:
+                velog_breaker.record_failure()
+                error, retry_after = e, None
+            except BaseException:
+                velog_breaker.release_probe()
+                raise
+            else:
+                stats["bytes"] += len(response.content)
+                if response.status_code not in RETRYABLE_STATUS:
+                    # 4xx 등 재시도 불가 응답도 엔드포인트는 살아 있음
+                    velog_breaker.record_success()
+                    response.raise_for_status()
+                    return response.json(), len(response.content)
+                if response.status_code == 429:
+                    velog_breaker.release_probe()
+                else:
+                    velog_breaker.record_failure()
+                error = httpx.HTTPStatusError(
+                    f"Velog returned {response.status_code}", request=response.request, response=response
+                )
+                retry_after = parse_retry_after(response.headers.get("Retry-After"))
+
+            if attempt >= max_retries:
+                raise error
+            delay = min(
+                max(backoff_delay(attempt), retry_after or 0.0),
+                settings.VELOG_CIRCUIT_MAX_WAIT_SECONDS
+            )
+            attempt += 1
+            self.retries += 1
+            stats["retries"] += 1
+            logger.warning(f"Velog request failed ({error}), retry {attempt}/{max_retries} in {delay:.1f}s")
+            await asyncio.sleep(delay)
+
+    async def _send(self, query: str, variables: Dict, timeout: Optional[float]) -> httpx.Response:
+        """단일 HTTP 요청 (전역 요청률 토큰 → 동시성 슬롯 순으로 확보, 지연/상태 기록)"""
+        client = http_clients.get("velog")
+        kwargs = {"timeout": timeout} if timeout is not None else {}
+
+        self.rate_limited_seconds += await velog_rate_limiter.acquire(self.rate_key)
+        if self.limiter:
+            await self.limiter.acquire()
+        started = time.monotonic()
+        status = None
+        try:
+            response = await client.post(
+                VelogService.GRAPHQL_ENDPOINT,
+                json={"query": query, "variables": variables},
+                headers={"Content-Type": "application/json"},
+                **kwargs
+            )
+            status = response.status_code
+            return response
+        finally:
+            if self.limiter:
+                self.limiter.release(time.monotonic() - started, status)
 
     @staticmethod
-    async def get_user_posts(username: str) -> List[Dict]:
-        """사용자의 모든 포스트 목록 가져오기 (페이지네이션)"""
-        all_posts = []
-        cursor = None
+    def parse_datetime(value: Optional[str]) -> Optional[datetime]:
+        """Velog ISO 8601 시각 문자열을 timezone-aware datetime으로 변환"""
+        if not value:
+            return None
+        try:
+            parsed = datetime.fromisoformat(value.replace('Z', '+00:00'))
+        except (ValueError, AttributeError):
+            return None
+        if parsed.tzinfo is None:
+            parsed = parsed.replace(tzinfo=timezone.utc)
+        return parsed
+
+    @staticmethod
+    def latest_timestamp(post: Dict) -> Optional[datetime]:
+        """포스트의 released_at/updated_at 중 최신 시각"""
+        stamps = [
+            VelogService.parse_datetime(post.get("released_at")),
+            VelogService.parse_datetime(post.get("updated_at")),
+        ]
+        stamps = [s for s in stamps if s]
+        return max(stamps) if stamps else None
 
+    async def iter_user_post_pages(
+        self,
+        username: str,
+        since: Optional[datetime] = None,
+        cursor: Optional[str] = None
+    ) -> AsyncIterator[List[Dict]]:
+        """사용자의 포스트 목록을 페이지 단위로 스트리밍 (페이지가 도착하는 즉시 yield)
+
+        since(워터마크)가 주어지면 증분 모드: 목록은 released_at 최신순이므로
+        워터마크보다 오래된 포스트가 나온 페이지에서 조회를 멈추고,
+        워터마크 이후 발행/수정된 포스트만 반환한다.
+        cursor가 주어지면 해당 커서 다음 페이지부터 조회 (체크포인트 재개용).
+        yield 시점의 self.list_cursor는 다음 페이지 커서.
+        """
         query = """
         query GetPosts($username: String!, $cursor: ID) {
             posts(username: $username, cursor: $cursor, limit: 100) {
@@ -33,78 +226,162 @@ class VelogService:
         }
         """
 
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            page = 0
-            while True:
-                page += 1
-                response = await client.post(
-                    VelogService.GRAPHQL_ENDPOINT,
-                    json={"query": query, "variables": {"username": username, "cursor": cursor}},
-                    headers={"Content-Type": "application/json"}
-                )
-                response.raise_for_status()
-                data = response.json()
+        page = 0
+        total = 0
+        while True:
+            page += 1
+            data, _ = await self._post_graphql(query, {"username": username, "cursor": cursor}, op="listing")
 
-                if "data" in data and "posts" in data["data"]:
-                    posts = data["data"]["posts"]
-                    logger.info(f"Velog API page {page}: received {len(posts)} posts, cursor={cursor}")
+            if "data" in data and "posts" in data["data"]:
+                posts = data["data"]["posts"]
+                logger.info(f"Velog API page {page}: received {len(posts)} posts, cursor={cursor}")
 
-                    # 더 이상 포스트가 없으면 종료
-                    if not posts or len(posts) == 0:
-                        logger.info(f"No more posts. Total collected: {len(all_posts)}")
-                        break
+                # 더 이상 포스트가 없으면 종료
+                if not posts or len(posts) == 0:
+                    logger.info(f"No more posts. Total collected: {total}")
+                    break
 
-                    # 비공개 포스트 제외하고 추가
-                    public_posts = [p for p in posts if not p.get("is_private")]
-                    all_posts.extend(public_posts)
-                    logger.info(f"Public posts in this page: {len(public_posts)}, Total so far: {len(all_posts)}")
+                # 비공개 포스트 제외하고 추가
+                public_posts = [p for p in posts if not p.get("is_private")]
 
-                    # 다음 페이지를 위한 커서 설정
-                    cursor = posts[-1]["id"]
-                else:
-                    logger.warning(f"Unexpected response format: {data}")
+                reached_watermark = False
+                if since:
+                    public_posts = [
+                        p for p in public_posts
+                        if (VelogService.latest_timestamp(p) or since) >= since
+                    ]
+                    oldest_released = VelogService.parse_datetime(posts[-1].get("released_at"))
+                    reached_watermark = oldest_released is not None and oldest_released < since
+
+                total += len(public_posts)
+                logger.info(f"Public posts in this page: {len(public_posts)}, Total so far: {total}")
+
+                # 다음 페이지를 위한 커서 설정
+                cursor = posts[-1]["id"]
+                self.list_cursor = cursor
+                yield public_posts
+
+                if reached_watermark:
+                    logger.info(f"Reached watermark {since.isoformat()}. Stopping incremental listing.")
                     break
+            else:
+                logger.warning(f"Unexpected response format: {data}")
+                break
 
-            logger.info(f"Finished fetching posts for {username}. Total: {len(all_posts)}")
-            return all_posts
+        logger.info(f"Finished fetching posts for {username}. Total: {total}")
 
-    @staticmethod
-    async def get_post_content(username: str, slug: str) -> Optional[Dict]:
+    async def get_user_posts(self, username: str, since: Optional[datetime] = None) -> List[Dict]:
+        """사용자의 포스트 목록 전체를 리스트로 반환 (iter_user_post_pages 참고)"""
+        all_posts = []
+        async for page in self.iter_user_post_pages(username, since=since):
+            all_posts.extend(page)
+        return all_posts
+
+    async def get_post_content(self, username: str, slug: str) -> Optional[Dict]:
         """특정 포스트의 전체 내용 가져오기"""
-        query = """
-        query ReadPost($username: String!, $url_slug: String!) {
-            post(username: $username, url_slug: $url_slug) {
-                id
-                title
-                released_at
-                updated_at
-                body
-                short_description
-                thumbnail
-                tags
-                is_private
-                url_slug
-            }
-        }
+        query = f"""
+        query ReadPost($username: String!, $url_slug: String!) {{
+            post(username: $username, url_slug: $url_slug) {{{POST_FIELDS}            }}
+        }}
         """
 
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.post(
-                VelogService.GRAPHQL_ENDPOINT,
-                json={
-                    "query": query,
-                    "variables": {"username": username, "url_slug": slug}
-                },
-                headers={"Content-Type": "application/json"}
-            )
-            response.raise_for_status()
-            data = response.json()
+        data, _ = await self._post_graphql(query, {"username": username, "url_slug": slug}, op="fetch")
 
-            if "data" in data and "post" in data["data"]:
-                post = data["data"]["post"]
-                if not post.get("is_private"):
-                    return post
-            return None
+        if "data" in data and data["data"] and data["data"].get("post"):
+            post = data["data"]["post"]
+            if not post.get("is_private"):
+                return post
+        return None
+
+    @staticmethod
+    def build_batch_query(count: int) -> str:
+        """post(username, url_slug) 셀렉션 count개를 별칭(p0, p1, ...)으로 묶은 GraphQL 문서 생성"""
+        slug_vars = ", ".join(f"$s{i}: String!" for i in range(count))
+        selections = "".join(
+            f"""
+            p{i}: post(username: $username, url_slug: $s{i}) {{{POST_FIELDS}            }}"""
+            for i in range(count)
+        )
+        return f"""
+        query ReadPosts($username: String!, {slug_vars}) {{{selections}
+        }}
+        """
+
+    async def get_posts_content_batch(self, username: str, slugs: List[str]) -> Tuple[Dict[str, Optional[Dict]], List[str], int]:
+        """여러 포스트 본문을 단일 GraphQL 요청으로 조회
+
+        Returns:
+            ({slug: post 또는 None}, 오류로 응답이 비어 재시도가 필요한 slug 목록, 응답 바이트 수)
+        """
+        query = VelogService.build_batch_query(len(slugs))
+        variables = {"username": username}
+        variables.update({f"s{i}": slug for i, slug in enumerate(slugs)})
+
+        data, payload_bytes = await self._post_graphql(query, variables, op="fetch")
+
+        result = data.get("data")
+        if not isinstance(result, dict):
+            raise RuntimeError(f"Unexpected batch response: {str(data.get('errors'))[:200]}")
+
+        # 부분 오류: errors의 path로 실패한 별칭 식별
+        errored_aliases = set()
+        for error in data.get("errors") or []:
+            path = error.get("path") or []
+            if path:
+                errored_aliases.add(path[0])
+
+        posts = {}
+        retry = []
+        for i, slug in enumerate(slugs):
+            alias = f"p{i}"
+            post = result.get(alias)
+            if post is None and alias in errored_aliases:
+                retry.append(slug)
+                continue
+            posts[slug] = post if post and not post.get("is_private") else None
+        return posts, retry, payload_bytes
+
+    @staticmethod
+    def is_unavailable(error: BaseException) -> bool:
+        """Velog 장애로 인한 실패인지 (서킷 열림, 재시도를 소진한 네트워크 오류/429/5xx)"""
+        if isinstance(error, (CircuitOpenError, httpx.TransportError)):
+            return True
+        return isinstance(error, httpx.HTTPStatusError) and error.response.status_code in RETRYABLE_STATUS
+
+    async def get_posts_content(self, username: str, slugs: List[str], sizer: Optional[PostBatchSizer] = None) -> Dict[str, Optional[Dict]]:
+        """포스트 본문 일괄 조회 - 배치 실패 시 단건 조회로 폴백
+
+        Velog 장애(is_unavailable)로 실패하면 단건 조회도 같은 대기/재시도를 반복하므로 폴백하지 않고
+        남은 포스트를 모두 None으로 반환한다 (실패 처리 → 재개/다음 실행에서 재시도).
+        Returns: {slug: post} (조회 실패/비공개 포스트는 None)
+        """
+        posts: Dict[str, Optional[Dict]] = {}
+        retry = list(slugs)
+
+        if len(slugs) > 1:
+            try:
+                posts, retry, payload_bytes = await self.get_posts_content_batch(username, slugs)
+                if sizer:
+                    sizer.observe(len(slugs), payload_bytes)
+            except Exception as e:
+                if self.is_unavailable(e):
+                    logger.warning(f"Velog unavailable, skipping {len(slugs)} posts until the next run: {e}")
+                    return {slug: None for slug in slugs}
+                logger.warning(f"Velog batch fetch failed ({len(slugs)} posts), falling back to single fetches: {e}")
+                if sizer:
+                    sizer.shrink()
+
+        for i, slug in enumerate(retry):
+            try:
+                posts[slug] = await self.get_post_content(username, slug)
+            except Exception as e:
+                if self.is_unavailable(e):
+                    logger.warning(f"Velog unavailable, skipping {len(retry) - i} posts until the next run: {e}")
+                    posts.update({s: None for s in retry[i:]})
+                    break
+                logger.error(f"Error fetching post {slug}: {e}")
+                posts[slug] = None
+        return posts
 
     @staticmethod
     def compute_content_hash(content: str) -> str:
@@ -122,14 +399,9 @@ class VelogService:
         }
         """
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                response = await client.post(
-                    VelogService.GRAPHQL_ENDPOINT,
-                    json={"query": query, "variables": {"username": username}},
-                    headers={"Content-Type": "application/json"}
-                )
-                response.raise_for_status()
-                data = response.json()
-                return "data" in data and "posts" in data["data"]
+            data, _ = await VelogService()._post_graphql(
+                query, {"username": username}, timeout=10.0, interactive=True
+            )
+            return "data" in data and "posts" in data["data"]
         except Exception:
             return False
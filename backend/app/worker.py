@@ -0,0 +1,212 @@
+"""백업 워커 프로세스
+
+웹 프로세스는 backup_jobs 테이블에 작업을 넣기만 하고, 워커가 가져가 실행한다.
+FOR UPDATE SKIP LOCKED + lease/heartbeat로 한 호스트의 여러 프로세스, 여러 호스트에서 동시에 실행 가능.
+
+실행: python -m app.worker [--concurrency N]
+"""
+import argparse
+import asyncio
+import logging
+import os
+import signal
+import socket
+import uuid
+from typing import Callable, Dict, Optional, Set
+
+from app.core.config import settings
+from app.core.database import SessionLocal, init_db
+from app.core.http import http_clients
+from app.core.metrics import metrics_exposed, monitor_event_loop_lag, start_metrics_server
+from app.models.backup import BackupLog, BackupStatus
+from app.models.job import BackupJob
+from app.services.image_optimizer import shutdown_pool as shutdown_image_pool
+from app.services.job_queue import BackupJobQueue
+from app.services.email_outbox import EmailOutboxQueue
+from app.services.scheduler import BackupScheduler
+from app.services.rate_limit import velog_rate_limiter
+from app.services.progress import progress_bus
+
+logger = logging.getLogger(__name__)
+
+# SIGTERM 후 실행 중인 작업이 끝나길 기다리는 시간 (넘으면 중단 후 큐로 반환)
+SHUTDOWN_GRACE_SECONDS = 20.0
+
+
+class BackupWorker:
+    """backup_jobs 큐를 폴링해 최대 concurrency개 작업을 동시에 실행"""
+
+    def __init__(
+        self,
+        session_factory: Callable = SessionLocal,
+        worker_id: Optional[str] = None,
+        concurrency: Optional[int] = None,
+    ):
+        self.session_factory = session_factory
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:6]}"
+        self.concurrency = max(1, concurrency or settings.BACKUP_WORKER_CONCURRENCY)
+        self._tasks: Dict[int, asyncio.Task] = {}
+        self._lost_leases: Set[int] = set()
+        self._stop: Optional[asyncio.Event] = None
+
+    async def _db_call(self, fn: Callable, *args):
+        """큐 조작을 별도 세션/스레드에서 실행 (이벤트 루프를 막지 않음)"""
+        def call():
+            db = self.session_factory()
+            try:
+                return fn(db, *args)
+            finally:
+                db.close()
+        return await asyncio.to_thread(call)
+
+    async def run(self):
+        """stop()이 호출될 때까지 작업을 가져와 실행"""
+        self._stop = asyncio.Event()
+        logger.info(f"Backup worker {self.worker_id} started (concurrency={self.concurrency})")
+        scheduler = asyncio.create_task(self._run_scheduler()) if settings.BACKUP_SCHEDULER_ENABLED else None
+        email_sender = asyncio.create_task(self._run_email_sender()) if settings.RESEND_API_KEY else None
+        while not self._stop.is_set():
+            if len(self._tasks) < self.concurrency:
+                try:
+                    job = await self._db_call(BackupJobQueue.claim, self.worker_id)
+                except Exception as e:
+                    logger.error(f"Failed to claim backup job: {e}")
+                    job = None
+                if job is not None:
+                    task = asyncio.create_task(self.run_job(job.id, job.user_id, job.force))
+                    self._tasks[job.id] = task
+                    task.add_done_callback(lambda _, job_id=job.id: self._tasks.pop(job_id, None))
+                    continue
+            try:
+                await asyncio.wait_for(self._stop.wait(), timeout=settings.BACKUP_JOB_POLL_SECONDS)
+            except asyncio.TimeoutError:
+                pass
+        for task in (scheduler, email_sender):
+            if task:
+                task.cancel()
+        await self._drain()
+        logger.info(f"Backup worker {self.worker_id} stopped")
+
+    async def _run_scheduler(self):
+        """자동 백업 예약 (모든 워커에서 실행 - 사용자 행 잠금으로 중복 예약 방지)"""
+        while True:
+            try:
+                scheduled = await self._db_call(BackupScheduler.schedule_due)
+                for user_id, job_id in scheduled:
+                    # 대시보드가 직전 실행의 완료 이벤트 대신 대기 상태를 받도록
+                    await progress_bus.publish(user_id, {"status": "queued", "phase": "queued", "job_id": job_id})
+            except Exception as e:
+                logger.error(f"Backup scheduler tick failed: {e}")
+            await asyncio.sleep(settings.BACKUP_SCHEDULER_TICK_SECONDS)
+
+    async def _run_email_sender(self):
+        """이메일 대기열 배치 발송 (행 잠금으로 여러 워커에서 실행해도 메일마다 한 번만 발송)"""
+        while True:
+            sent = 0
+            try:
+                sent = await EmailOutboxQueue.deliver(self._db_call)
+            except Exception as e:
+                logger.error(f"Email sender tick failed: {e}")
+            if not sent:
+                await asyncio.sleep(settings.EMAIL_OUTBOX_POLL_SECONDS)
+
+    def stop(self):
+        """새 작업 수령 중단 (실행 중인 작업은 grace 기간 동안 마무리)"""
+        if self._stop is not None:
+            self._stop.set()
+
+    async def _drain(self):
+        tasks = list(self._tasks.values())
+        if not tasks:
+            return
+        logger.info(f"Waiting up to {SHUTDOWN_GRACE_SECONDS:.0f}s for {len(tasks)} running job(s)")
+        _, pending = await asyncio.wait(tasks, timeout=SHUTDOWN_GRACE_SECONDS)
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.wait(pending)
+
+    async def run_job(self, job_id: int, user_id: int, force: bool):
+        """작업 하나 실행 (heartbeat로 lease 유지, 결과를 큐에 기록)"""
+        from app.api.backup import perform_backup_task
+
+        job_task = asyncio.current_task()
+        heartbeat = asyncio.create_task(self._heartbeat(job_id, job_task))
+        db = self.session_factory()
+        error, retry = None, False
+        try:
+            await perform_backup_task(user_id, force, db, job_id=job_id)
+            job = db.get(BackupJob, job_id)
+            log = db.get(BackupLog, job.backup_log_id) if job and job.backup_log_id else None
+            if log and log.status == BackupStatus.FAILED:
+                error = log.error_details or log.message
+        except asyncio.CancelledError:
+            if job_id in self._lost_leases:
+                self._lost_leases.discard(job_id)
+            else:
+                await self._db_call(BackupJobQueue.release, job_id, self.worker_id)
+            raise
+        except Exception as e:
+            logger.error(f"Backup job {job_id} crashed: {e}", exc_info=True)
+            error, retry = str(e), True
+        finally:
+            heartbeat.cancel()
+            db.close()
+        await self._db_call(BackupJobQueue.complete, job_id, self.worker_id, error, retry)
+
+    async def _heartbeat(self, job_id: int, job_task: asyncio.Task):
+        """lease 연장 - 다른 워커가 회수했으면 실행 중단"""
+        while True:
+            await asyncio.sleep(settings.BACKUP_JOB_HEARTBEAT_SECONDS)
+            try:
+                held = await self._db_call(BackupJobQueue.heartbeat, job_id, self.worker_id)
+            except Exception as e:
+                logger.warning(f"Heartbeat failed for backup job {job_id}: {e}")
+                continue
+            if not held:
+                logger.warning(f"Lost lease on backup job {job_id}, cancelling")
+                self._lost_leases.add(job_id)
+                job_task.cancel()
+                return
+
+
+async def serve(concurrency: Optional[int] = None):
+    worker = BackupWorker(concurrency=concurrency)
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGTERM, signal.SIGINT):
+        loop.add_signal_handler(sig, worker.stop)
+
+    http_clients.start()
+    lag_task = asyncio.create_task(monitor_event_loop_lag()) if settings.METRICS_ENABLED else None
+    metrics_server = None
+    if settings.METRICS_WORKER_PORT and metrics_exposed():
+        metrics_server = start_metrics_server(settings.METRICS_WORKER_PORT)
+        logger.info(f"Serving worker metrics on :{settings.METRICS_WORKER_PORT}/metrics")
+    try:
+        await worker.run()
+    finally:
+        if lag_task:
+            lag_task.cancel()
+        if metrics_server:
+            metrics_server.shutdown()
+        await http_clients.aclose()
+        await velog_rate_limiter.aclose()
+        await progress_bus.aclose()
+        shutdown_image_pool()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Velog Backup job worker")
+    parser.add_argument("--concurrency", type=int, default=None, help="jobs run at once in this process")
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+    )
+    init_db()
+    asyncio.run(serve(args.concurrency))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,171 @@
+"""백업 처리량 벤치마크 (실제 Velog 없이 fake_velog 대역 서버 사용)
+
+기본은 대역 서버를 프로세스 내(ASGI transport)로 띄워 네트워크 없이 측정한다.
+--url로 별도 실행한 대역 서버(또는 replay 서버)를 지정할 수 있다.
+
+실행 (backend 디렉터리에서):
+    python -m benchmarks.bench_backup --users 4 --posts 300 --latency-ms 50
+    python -m benchmarks.bench_backup --url http://127.0.0.1:8081/graphql --usernames someone
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+import tempfile
+import time
+
+# 앱 설정 로드 전에 벤치마크용 기본값 지정 (이미 설정된 환경변수는 유지)
+_DB_PATH = os.path.join(tempfile.gettempdir(), "velog_backup_bench.db")
+os.environ.setdefault("DATABASE_URL", f"sqlite:///{_DB_PATH}")
+os.environ.setdefault("SECRET_KEY", "benchmark")
+os.environ.setdefault("GITHUB_CLIENT_ID", "benchmark")
+os.environ.setdefault("GITHUB_CLIENT_SECRET", "benchmark")
+os.environ.setdefault("ENVIRONMENT", "development")
+
+import httpx  # noqa: E402
+
+from app.api.backup import perform_backup_task  # noqa: E402
+from app.core.database import Base, SessionLocal, engine  # noqa: E402
+from app.core.http import http_clients  # noqa: E402
+from app.models.backup import BackupLog  # noqa: E402
+from app.models.user import User  # noqa: E402
+from app.services.velog import VelogService  # noqa: E402
+from benchmarks.fake_velog import FakeVelogConfig, create_app  # noqa: E402
+
+FAKE_HOST = "http://fake-velog"
+
+
+def install_fake_velog(config: FakeVelogConfig):
+    """대역 서버를 ASGI transport로 velog/images 클라이언트에 연결"""
+    app = create_app(config)
+    for name in ("velog", "images"):
+        http_clients.register(name, httpx.AsyncClient(transport=httpx.ASGITransport(app=app)))
+    VelogService.GRAPHQL_ENDPOINT = f"{FAKE_HOST}/graphql"
+    return app
+
+
+def prepare_users(usernames):
+    """벤치마크 DB 초기화 + 사용자 생성"""
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    db = SessionLocal()
+    try:
+        ids = []
+        for username in usernames:
+            user = User(
+                email=f"{username}@bench.local",
+                velog_username=username,
+                email_notification_enabled=False,
+            )
+            db.add(user)
+            db.commit()
+            ids.append(user.id)
+        return ids
+    finally:
+        db.close()
+
+
+async def run_backup(user_id: int, force: bool):
+    db = SessionLocal()
+    try:
+        await perform_backup_task(user_id, force, db)
+    finally:
+        db.close()
+
+
+def collect_logs(started_id: int):
+    db = SessionLocal()
+    try:
+        return db.query(BackupLog).filter(BackupLog.id > started_id).order_by(BackupLog.id).all()
+    finally:
+        db.close()
+
+
+async def run_round(label: str, user_ids, force: bool):
+    db = SessionLocal()
+    try:
+        last_id = db.query(BackupLog.id).order_by(BackupLog.id.desc()).limit(1).scalar() or 0
+    finally:
+        db.close()
+
+    started = time.perf_counter()
+    await asyncio.gather(*(run_backup(user_id, force) for user_id in user_ids))
+    elapsed = time.perf_counter() - started
+
+    logs = collect_logs(last_id)
+    processed = sum((log.posts_new or 0) + (log.posts_updated or 0) for log in logs)
+    total = sum(log.posts_total or 0 for log in logs)
+    print(f"\n[{label}] {len(logs)} backup(s) in {elapsed:.2f}s")
+    print(f"  listed {total} posts, fetched {processed} bodies -> {processed / elapsed:.1f} posts/s")
+    for log in logs:
+        velog = json.loads(log.metrics or "{}").get("velog", {})
+        print(
+            f"  user={log.user_id} status={log.status.value} mode={log.listing_mode} "
+            f"new={log.posts_new} updated={log.posts_updated} skipped={log.posts_skipped} "
+            f"failed={log.posts_failed} requests={velog.get('requests')} retries={velog.get('retries')} "
+            f"latency_ms={velog.get('latency_ms')} concurrency={velog.get('concurrency')}"
+        )
+
+
+async def main_async(args):
+    usernames = args.usernames or [f"bench{i}" for i in range(args.users)]
+
+    app = None
+    if args.url:
+        VelogService.GRAPHQL_ENDPOINT = args.url
+    else:
+        app = install_fake_velog(FakeVelogConfig(
+            posts=args.posts,
+            body_length=args.body_length,
+            images_per_post=args.images,
+            latency_ms=args.latency_ms,
+            latency_jitter_ms=args.latency_jitter_ms,
+            error_rate=args.error_rate,
+            throttle_rate=args.throttle_rate,
+            retry_after=args.retry_after,
+            partial_error_rate=args.partial_error_rate,
+            seed=args.seed,
+            public_url=FAKE_HOST,
+            replay_path=args.replay,
+        ))
+
+    user_ids = prepare_users(usernames)
+    try:
+        await run_round("first backup", user_ids, force=False)
+        for i in range(args.repeat):
+            await run_round(f"repeat {i + 1}{' (force)' if args.force else ''}", user_ids, force=args.force)
+    finally:
+        await http_clients.aclose()
+
+    if app is not None:
+        print(f"\nfake velog stats: {dict(app.state.fake_velog.stats)}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Backup throughput benchmark against a fake Velog")
+    parser.add_argument("--url", help="external fake/replay server GraphQL URL (default: in-process)")
+    parser.add_argument("--usernames", nargs="*", help="Velog usernames (default: bench0..N)")
+    parser.add_argument("--users", type=int, default=1, help="concurrent users")
+    parser.add_argument("--repeat", type=int, default=1, help="backups to run after the first one")
+    parser.add_argument("--force", action="store_true", help="force full re-fetch on repeat runs")
+    parser.add_argument("--posts", type=int, default=200)
+    parser.add_argument("--body-length", type=int, default=4000)
+    parser.add_argument("--images", type=int, default=3)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--latency-jitter-ms", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--throttle-rate", type=float, default=0.0)
+    parser.add_argument("--retry-after", type=float, default=1.0)
+    parser.add_argument("--partial-error-rate", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--replay", metavar="CASSETTE", help="in-process server replays this cassette")
+    args = parser.parse_args()
+
+    if args.replay and not args.usernames:
+        sys.exit("--replay needs --usernames matching the recorded blog")
+    asyncio.run(main_async(args))
+
+
+if __name__ == "__main__":
+    main()
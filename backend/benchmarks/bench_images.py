@@ -0,0 +1,85 @@
+"""마크다운 이미지 경로 치환 벤치마크 (기존 str.replace 반복 vs rewrite_images 한 번에 치환)
+
+이미지 수백 개가 들어 있는 긴 포스트를 합성해 두 방식의 소요 시간을 비교하고 결과가 같은지 확인한다.
+
+실행 (backend 디렉터리에서):
+    python -m benchmarks.bench_images --images 500 --body-length 2000000
+"""
+import argparse
+import os
+import random
+import time
+
+# 앱 설정 로드 전에 벤치마크용 기본값 지정 (이미 설정된 환경변수는 유지)
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+os.environ.setdefault("SECRET_KEY", "benchmark")
+os.environ.setdefault("GITHUB_CLIENT_ID", "benchmark")
+os.environ.setdefault("GITHUB_CLIENT_SECRET", "benchmark")
+os.environ.setdefault("ENVIRONMENT", "development")
+
+from app.services.image import ImageService  # noqa: E402
+
+
+def build_post(images: int, body_length: int, html_ratio: float, seed: int) -> str:
+    """본문 사이사이에 마크다운/HTML 이미지가 섞인 긴 포스트"""
+    rng = random.Random(seed)
+    chunk = max(body_length // (images + 1), 1)
+    filler = ("벨로그 백업 벤치마크 문단입니다. " * (chunk // 20 + 1))[:chunk]
+    parts = []
+    for i in range(images):
+        parts.append(filler)
+        url = f"https://velog.velcdn.com/images/bench/post/{i:04d}-image.png"
+        if rng.random() < html_ratio:
+            parts.append(f'\n<img src="{url}" alt="image {i}" width="600" />\n')
+        else:
+            parts.append(f"\n![image {i}]({url})\n")
+    parts.append(filler)
+    return "".join(parts)
+
+
+def legacy_rewrite(content: str) -> str:
+    """기존 방식: 이미지마다 본문 전체를 다시 훑는 str.replace"""
+    processed = content
+    for index, (full_match, alt_text, url) in enumerate(ImageService.extract_image_urls(content), 1):
+        relative_path = f"./images/{ImageService.get_image_filename(url, index)}"
+        if full_match.startswith('!['):
+            new_ref = f"![{alt_text}]({relative_path})"
+        else:
+            new_ref = full_match.replace(url, relative_path)
+        processed = processed.replace(full_match, new_ref, 1)
+    return processed
+
+
+def measure(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Markdown image rewrite benchmark")
+    parser.add_argument("--images", type=int, default=500)
+    parser.add_argument("--body-length", type=int, default=2_000_000, help="characters of text")
+    parser.add_argument("--html-ratio", type=float, default=0.2, help="share of <img> tags")
+    parser.add_argument("--repeat", type=int, default=5, help="runs per method (best is reported)")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    content = build_post(args.images, args.body_length, args.html_ratio, args.seed)
+    expected = legacy_rewrite(content)
+    rewritten, manifest = ImageService.rewrite_images(content)
+    if rewritten != expected:
+        raise SystemExit("rewrite_images output differs from the legacy rewrite")
+
+    print(f"post: {len(content):,} chars, {len(manifest)} images")
+    legacy = measure(lambda: legacy_rewrite(content), args.repeat)
+    single = measure(lambda: ImageService.rewrite_images(content), args.repeat)
+    print(f"  str.replace loop: {legacy * 1000:8.1f} ms")
+    print(f"  rewrite_images:   {single * 1000:8.1f} ms  ({legacy / single:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,369 @@
+"""로컬 Velog GraphQL 대역 서버 (벤치마크/부하 테스트용)
+
+app/services/velog.py가 사용하는 쿼리만 구현한다.
+- posts(username, cursor, limit): released_at 최신순 목록, 커서는 마지막 포스트 id
+- post(username, url_slug): 단건 본문
+- p0: post(..., url_slug: $s0) ... : 별칭 일괄 조회 (VelogService.build_batch_query)
+
+모드
+- synthetic (기본): 설정한 크기/본문 길이/이미지 수로 블로그를 결정적으로 생성
+- record: 요청을 실제 Velog로 프록시하고 응답을 JSONL 카세트에 기록
+- replay: 카세트에 기록된 응답을 (query, variables) 해시로 찾아 재생
+
+실행:
+    python -m benchmarks.fake_velog --posts 500 --latency-ms 80 --error-rate 0.02
+    python -m benchmarks.fake_velog --record cassette.jsonl
+    python -m benchmarks.fake_velog --replay cassette.jsonl
+
+백엔드에서 VELOG_GRAPHQL_URL=http://127.0.0.1:8081/graphql 로 지정해 사용한다.
+"""
+import argparse
+import asyncio
+import hashlib
+import json
+import random
+import re
+import struct
+import zlib
+from collections import Counter
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import httpx
+from fastapi import FastAPI, Request, Response
+from fastapi.responses import JSONResponse
+
+# p0: post(username: $username, url_slug: $s0)
+BATCH_SELECTION_RE = re.compile(r"(\w+)\s*:\s*post\s*\(\s*username:\s*\$username\s*,\s*url_slug:\s*\$(\w+)\s*\)")
+SINGLE_POST_RE = re.compile(r"\bpost\s*\(")
+POSTS_RE = re.compile(r"\bposts\s*\(")
+LIMIT_RE = re.compile(r"limit:\s*(\d+)")
+
+LIST_FIELDS = (
+    "id", "title", "short_description", "thumbnail", "url_slug",
+    "released_at", "updated_at", "tags", "is_private",
+)
+
+WORDS = (
+    "velog backup python fastapi graphql async await cache queue batch worker latency "
+    "throughput database index commit markdown image stream buffer pool retry budget"
+).split()
+
+EPOCH = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+@dataclass
+class FakeVelogConfig:
+    """대역 서버 설정"""
+    posts: int = 200  # 사용자당 포스트 수
+    body_length: int = 4000  # 본문 길이 (문자)
+    images_per_post: int = 3
+    image_bytes: int = 20_000  # 생성 이미지 크기 (근사치)
+    private_ratio: float = 0.0  # 비공개 포스트 비율
+    latency_ms: float = 0.0  # 요청당 지연
+    latency_jitter_ms: float = 0.0
+    error_rate: float = 0.0  # 502 응답 비율
+    throttle_rate: float = 0.0  # 429 응답 비율
+    retry_after: float = 1.0  # 429 응답의 Retry-After (초)
+    partial_error_rate: float = 0.0  # 일괄 조회에서 별칭 단위 GraphQL 오류 비율
+    seed: int = 42
+    public_url: str = "http://127.0.0.1:8081"  # 본문 이미지 URL의 호스트
+    upstream_url: str = "https://v2.velog.io/graphql"  # record 모드 프록시 대상
+    record_path: Optional[str] = None
+    replay_path: Optional[str] = None
+
+
+def cassette_key(query: str, variables: Optional[Dict]) -> str:
+    """(공백 정규화한 query, variables)의 sha256 - 카세트 조회 키"""
+    canonical = json.dumps(
+        {"query": " ".join(query.split()), "variables": variables or {}},
+        sort_keys=True, ensure_ascii=False,
+    )
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+def make_png(seed: str, approx_bytes: int) -> bytes:
+    """노이즈로 채운 grayscale PNG (압축되지 않아 크기가 approx_bytes에 가까움)"""
+    width = 256
+    height = max(1, approx_bytes // (width + 1))
+    rng = random.Random(seed)
+    raw = b"".join(b"\x00" + rng.randbytes(width) for _ in range(height))
+
+    def chunk(kind: bytes, data: bytes) -> bytes:
+        return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data))
+
+    header = struct.pack(">IIBBBBB", width, height, 8, 0, 0, 0, 0)
+    return (
+        b"\x89PNG\r\n\x1a\n"
+        + chunk(b"IHDR", header)
+        + chunk(b"IDAT", zlib.compress(raw, 1))
+        + chunk(b"IEND", b"")
+    )
+
+
+class SyntheticBlog:
+    """사용자별 합성 블로그 (같은 seed/username이면 항상 같은 내용)"""
+
+    def __init__(self, username: str, config: FakeVelogConfig):
+        self.username = username
+        self.config = config
+        rng = random.Random(f"{config.seed}:{username}")
+
+        self.posts: List[Dict] = []
+        for n in range(config.posts):
+            released = EPOCH + timedelta(hours=n * 6)
+            slug = f"post-{n:05d}"
+            self.posts.append({
+                "id": hashlib.md5(f"{username}/{slug}".encode()).hexdigest(),
+                "title": f"{username} 포스트 {n}",
+                "short_description": " ".join(rng.choices(WORDS, k=12)),
+                "thumbnail": self.image_url(slug, 0) if config.images_per_post else None,
+                "url_slug": slug,
+                "released_at": released.isoformat().replace("+00:00", "Z"),
+                "updated_at": (released + timedelta(minutes=rng.randint(0, 600))).isoformat().replace("+00:00", "Z"),
+                "tags": rng.sample(WORDS, k=3),
+                "is_private": rng.random() < config.private_ratio,
+            })
+        # 최신순 정렬 (Velog 목록과 동일)
+        self.posts.reverse()
+        self._index = {post["id"]: i for i, post in enumerate(self.posts)}
+        self._by_slug = {post["url_slug"]: post for post in self.posts}
+
+    def image_url(self, slug: str, index: int) -> str:
+        return f"{self.config.public_url}/images/{self.username}/{slug}/{index}.png"
+
+    def list_page(self, cursor: Optional[str], limit: int) -> List[Dict]:
+        start = self._index[cursor] + 1 if cursor in self._index else 0
+        return [
+            {field: post[field] for field in LIST_FIELDS}
+            for post in self.posts[start:start + limit]
+        ]
+
+    def get(self, slug: str) -> Optional[Dict]:
+        post = self._by_slug.get(slug)
+        if post is None:
+            return None
+        return {**post, "body": self.body(slug)}
+
+    def body(self, slug: str) -> str:
+        """문단 사이에 이미지를 섞은 마크다운 본문 (홀수 번째 이미지는 HTML img 태그)"""
+        rng = random.Random(f"{self.config.seed}:{self.username}:{slug}")
+        images = self.config.images_per_post
+        paragraphs = []
+        size = 0
+        while size < self.config.body_length:
+            paragraph = " ".join(rng.choices(WORDS, k=60))
+            paragraphs.append(paragraph)
+            size += len(paragraph) + 2
+        text = "\n\n".join(paragraphs)[:self.config.body_length]
+        step = len(text) // (images + 1) + 1
+        chunks = [text[i * step:(i + 1) * step] for i in range(images + 1)]
+
+        parts = [f"# {self._by_slug[slug]['title']}", chunks[0]]
+        for i in range(images):
+            url = self.image_url(slug, i)
+            parts.append(f'<img src="{url}" alt="image {i}">' if i % 2 else f"![image {i}]({url})")
+            parts.append(chunks[i + 1])
+        return "\n\n".join(parts)
+
+
+class FakeVelogServer:
+    """요청 분기 + 지연/오류 주입 + record/replay 카세트"""
+
+    def __init__(self, config: FakeVelogConfig):
+        self.config = config
+        self.rng = random.Random(config.seed)
+        self.stats: Counter = Counter()
+        self._blogs: Dict[str, SyntheticBlog] = {}
+        self._cassette: Dict[str, Tuple[int, str]] = {}
+        self._upstream: Optional[httpx.AsyncClient] = None
+
+        if config.replay_path:
+            self._cassette = load_cassette(config.replay_path)
+
+    def blog(self, username: str) -> SyntheticBlog:
+        if username not in self._blogs:
+            self._blogs[username] = SyntheticBlog(username, self.config)
+        return self._blogs[username]
+
+    async def handle(self, payload: Dict) -> Response:
+        query = payload.get("query") or ""
+        variables = payload.get("variables") or {}
+        self.stats["requests"] += 1
+
+        if self.config.latency_ms or self.config.latency_jitter_ms:
+            delay = self.config.latency_ms + self.rng.uniform(0, self.config.latency_jitter_ms)
+            await asyncio.sleep(delay / 1000)
+
+        if self.rng.random() < self.config.throttle_rate:
+            self.stats["throttled"] += 1
+            return JSONResponse(
+                {"errors": [{"message": "Too many requests"}]},
+                status_code=429,
+                headers={"Retry-After": str(self.config.retry_after)},
+            )
+        if self.rng.random() < self.config.error_rate:
+            self.stats["errors"] += 1
+            return JSONResponse({"errors": [{"message": "Bad gateway"}]}, status_code=502)
+
+        if self.config.replay_path:
+            return self.replay(query, variables)
+        if self.config.record_path:
+            return await self.record(payload, query, variables)
+        return JSONResponse(self.resolve(query, variables))
+
+    def resolve(self, query: str, variables: Dict) -> Dict:
+        """합성 블로그로 GraphQL 응답 생성"""
+        blog = self.blog(variables.get("username", ""))
+
+        selections = BATCH_SELECTION_RE.findall(query)
+        if selections:
+            self.stats["batch"] += 1
+            self.stats["batch_posts"] += len(selections)
+            data, errors = {}, []
+            for alias, variable in selections:
+                if self.rng.random() < self.config.partial_error_rate:
+                    data[alias] = None
+                    errors.append({"message": "Internal error", "path": [alias]})
+                else:
+                    data[alias] = blog.get(variables.get(variable, ""))
+            return {"data": data, "errors": errors} if errors else {"data": data}
+
+        if SINGLE_POST_RE.search(query):
+            self.stats["post"] += 1
+            return {"data": {"post": blog.get(variables.get("url_slug", ""))}}
+
+        if POSTS_RE.search(query):
+            self.stats["posts"] += 1
+            match = LIMIT_RE.search(query)
+            limit = int(match.group(1)) if match else 20
+            return {"data": {"posts": blog.list_page(variables.get("cursor"), limit)}}
+
+        self.stats["unsupported"] += 1
+        return {"errors": [{"message": "Unsupported query"}]}
+
+    def replay(self, query: str, variables: Dict) -> Response:
+        recorded = self._cassette.get(cassette_key(query, variables))
+        if recorded is None:
+            self.stats["replay_misses"] += 1
+            return JSONResponse({"errors": [{"message": "Not recorded"}]}, status_code=404)
+        status, body = recorded
+        return Response(body, status_code=status, media_type="application/json")
+
+    async def record(self, payload: Dict, query: str, variables: Dict) -> Response:
+        if self._upstream is None:
+            self._upstream = httpx.AsyncClient(timeout=30.0)
+        upstream = await self._upstream.post(self.config.upstream_url, json=payload)
+        body = upstream.text
+        with open(self.config.record_path, "a", encoding="utf-8") as f:
+            f.write(json.dumps({
+                "key": cassette_key(query, variables),
+                "query": query,
+                "variables": variables,
+                "status": upstream.status_code,
+                "body": body,
+            }, ensure_ascii=False) + "\n")
+        self.stats["recorded"] += 1
+        return Response(body, status_code=upstream.status_code, media_type="application/json")
+
+    async def aclose(self):
+        if self._upstream is not None:
+            await self._upstream.aclose()
+            self._upstream = None
+
+
+def load_cassette(path: str) -> Dict[str, Tuple[int, str]]:
+    """JSONL 카세트 로드 (같은 키가 여러 번 기록되면 마지막 응답 사용)"""
+    cassette = {}
+    for line in Path(path).read_text(encoding="utf-8").splitlines():
+        if line.strip():
+            entry = json.loads(line)
+            cassette[entry["key"]] = (entry["status"], entry["body"])
+    return cassette
+
+
+def create_app(config: Optional[FakeVelogConfig] = None) -> FastAPI:
+    """대역 서버 FastAPI 앱 생성 (app.state.fake_velog로 서버 상태 접근)"""
+    server = FakeVelogServer(config or FakeVelogConfig())
+
+    @asynccontextmanager
+    async def lifespan(app: FastAPI):
+        yield
+        await server.aclose()
+
+    app = FastAPI(title="Fake Velog GraphQL", lifespan=lifespan)
+    app.state.fake_velog = server
+
+    @app.post("/graphql")
+    async def graphql(request: Request):
+        return await server.handle(await request.json())
+
+    @app.get("/images/{path:path}")
+    async def image(path: str):
+        server.stats["images"] += 1
+        return Response(_png(path, server.config.image_bytes), media_type="image/png")
+
+    @app.get("/stats")
+    async def stats():
+        return dict(server.stats)
+
+    return app
+
+
+@lru_cache(maxsize=256)
+def _png(path: str, approx_bytes: int) -> bytes:
+    return make_png(path, approx_bytes)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local Velog GraphQL stand-in server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8081)
+    parser.add_argument("--posts", type=int, default=200, help="posts per user")
+    parser.add_argument("--body-length", type=int, default=4000)
+    parser.add_argument("--images", type=int, default=3, help="images per post")
+    parser.add_argument("--image-bytes", type=int, default=20_000)
+    parser.add_argument("--private-ratio", type=float, default=0.0)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--latency-jitter-ms", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of 502 responses")
+    parser.add_argument("--throttle-rate", type=float, default=0.0, help="fraction of 429 responses")
+    parser.add_argument("--retry-after", type=float, default=1.0)
+    parser.add_argument("--partial-error-rate", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--public-url", default=None, help="host used in generated image URLs")
+    parser.add_argument("--upstream", default="https://v2.velog.io/graphql")
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument("--record", metavar="CASSETTE", help="proxy to upstream and append responses")
+    mode.add_argument("--replay", metavar="CASSETTE", help="serve recorded responses")
+    args = parser.parse_args()
+
+    config = FakeVelogConfig(
+        posts=args.posts,
+        body_length=args.body_length,
+        images_per_post=args.images,
+        image_bytes=args.image_bytes,
+        private_ratio=args.private_ratio,
+        latency_ms=args.latency_ms,
+        latency_jitter_ms=args.latency_jitter_ms,
+        error_rate=args.error_rate,
+        throttle_rate=args.throttle_rate,
+        retry_after=args.retry_after,
+        partial_error_rate=args.partial_error_rate,
+        seed=args.seed,
+        public_url=args.public_url or f"http://{args.host}:{args.port}",
+        upstream_url=args.upstream,
+        record_path=args.record,
+        replay_path=args.replay,
+    )
+
+    import uvicorn
+    uvicorn.run(create_app(config), host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
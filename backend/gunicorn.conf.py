@@ -0,0 +1,25 @@
+"""gunicorn 설정 (현재 디렉터리의 gunicorn.conf.py를 자동으로 읽음)
+
+워커 프로세스가 여러 개이므로 Prometheus 메트릭을 PROMETHEUS_MULTIPROC_DIR에 프로세스별 파일로 기록하고,
+/metrics를 받은 워커가 모두 합산해 응답한다. 같은 호스트에서 python -m app.worker를 실행할 때도
+같은 디렉터리를 지정하면 백업 실행 메트릭이 함께 노출된다 (별도 호스트의 워커는 METRICS_WORKER_PORT로 따로 노출).
+"""
+import os
+import shutil
+import tempfile
+
+multiproc_dir = os.environ.setdefault(
+    "PROMETHEUS_MULTIPROC_DIR", os.path.join(tempfile.gettempdir(), "velog_backup_metrics")
+)
+
+
+def on_starting(server):
+    """이전 실행이 남긴 메트릭 파일 정리"""
+    shutil.rmtree(multiproc_dir, ignore_errors=True)
+    os.makedirs(multiproc_dir, exist_ok=True)
+
+
+def child_exit(server, worker):
+    """종료된 워커의 live 게이지 파일 정리"""
+    from prometheus_client import multiprocess
+    multiprocess.mark_process_dead(worker.pid)
@@ -0,0 +1,100 @@
+-- Velog Backup V4 Migration Script
+-- 백업 성능 개선 관련 컬럼 추가
+
+-- 증분 목록 조회 (워터마크)
+ALTER TABLE backup_logs ADD COLUMN IF NOT EXISTS listing_mode VARCHAR;
+ALTER TABLE backup_logs ADD COLUMN IF NOT EXISTS velog_watermark TIMESTAMP WITH TIME ZONE;
+
+-- 메타데이터 기반 변경 감지 (목록의 updated_at과 비교해 본문 조회 생략)
+ALTER TABLE post_cache ADD COLUMN IF NOT EXISTS velog_post_id VARCHAR;
+ALTER TABLE post_cache ADD COLUMN IF NOT EXISTS short_description TEXT;
+ALTER TABLE post_cache ADD COLUMN IF NOT EXISTS velog_updated_at TIMESTAMP WITH TIME ZONE;
+
+-- 백업 실행 통계 (적응형 동시성, 지연 백분위, 스로틀 이벤트)
+ALTER TABLE backup_logs ADD COLUMN IF NOT EXISTS metrics TEXT;
+
+-- 백업 작업 큐 (워커가 FOR UPDATE SKIP LOCKED로 가져가 lease/heartbeat로 실행)
+DO $$
+BEGIN
+    IF NOT EXISTS (SELECT 1 FROM pg_type WHERE typname = 'jobstatus') THEN
+        CREATE TYPE jobstatus AS ENUM ('QUEUED', 'RUNNING', 'DONE', 'FAILED');
+    END IF;
+END $$;
+
+CREATE TABLE IF NOT EXISTS backup_jobs (
+    id SERIAL PRIMARY KEY,
+    user_id INTEGER NOT NULL REFERENCES users(id) ON DELETE CASCADE,
+    force BOOLEAN NOT NULL DEFAULT FALSE,
+    status jobstatus NOT NULL DEFAULT 'QUEUED',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    run_after TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT now(),
+    locked_by VARCHAR,
+    lease_expires_at TIMESTAMP WITH TIME ZONE,
+    heartbeat_at TIMESTAMP WITH TIME ZONE,
+    backup_log_id INTEGER REFERENCES backup_logs(id) ON DELETE SET NULL,
+    error TEXT,
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT now(),
+    started_at TIMESTAMP WITH TIME ZONE,
+    finished_at TIMESTAMP WITH TIME ZONE
+);
+CREATE INDEX IF NOT EXISTS ix_backup_jobs_id ON backup_jobs (id);
+CREATE INDEX IF NOT EXISTS ix_backup_jobs_user_id ON backup_jobs (user_id);
+CREATE INDEX IF NOT EXISTS ix_backup_jobs_claim ON backup_jobs (status, run_after);
+
+-- 자동 백업 스케줄 (사용자별 주기, 다음 실행 시각)
+ALTER TABLE users ADD COLUMN IF NOT EXISTS auto_backup_enabled BOOLEAN DEFAULT TRUE;
+UPDATE users SET auto_backup_enabled = TRUE WHERE auto_backup_enabled IS NULL;
+ALTER TABLE users ALTER COLUMN auto_backup_enabled SET NOT NULL;
+ALTER TABLE users ADD COLUMN IF NOT EXISTS auto_backup_interval_hours INTEGER DEFAULT 24;
+ALTER TABLE users ADD COLUMN IF NOT EXISTS next_auto_backup_at TIMESTAMP WITH TIME ZONE;
+CREATE INDEX IF NOT EXISTS ix_users_next_auto_backup_at ON users (next_auto_backup_at);
+
+-- 백업 체크포인트/재개 (중단된 실행을 다음 실행이 이어서 진행)
+ALTER TYPE backupstatus ADD VALUE IF NOT EXISTS 'RESUMED';
+ALTER TABLE backup_logs ADD COLUMN IF NOT EXISTS checkpoint TEXT;
+ALTER TABLE backup_logs ADD COLUMN IF NOT EXISTS posts_resumed INTEGER DEFAULT 0;
+ALTER TABLE backup_logs ADD COLUMN IF NOT EXISTS resumed_from_id INTEGER REFERENCES backup_logs(id) ON DELETE SET NULL;
+
+-- 작업 우선순위 클래스 (수동 > 예약)와 예상 작업량 (대형 계정 동시 실행 제한)
+DO $$
+BEGIN
+    IF NOT EXISTS (SELECT 1 FROM pg_type WHERE typname = 'jobclass') THEN
+        CREATE TYPE jobclass AS ENUM ('MANUAL', 'SCHEDULED');
+    END IF;
+END $$;
+
+ALTER TABLE backup_jobs ADD COLUMN IF NOT EXISTS job_class jobclass NOT NULL DEFAULT 'MANUAL';
+ALTER TABLE backup_jobs ADD COLUMN IF NOT EXISTS priority INTEGER NOT NULL DEFAULT 0;
+ALTER TABLE backup_jobs ADD COLUMN IF NOT EXISTS cost INTEGER NOT NULL DEFAULT 0;
+DROP INDEX IF EXISTS ix_backup_jobs_claim;
+CREATE INDEX IF NOT EXISTS ix_backup_jobs_claim ON backup_jobs (status, priority, run_after);
+
+-- 이메일 발송 대기열 (백업은 행만 추가, 워커가 Resend 배치 API로 발송)
+DO $$
+BEGIN
+    IF NOT EXISTS (SELECT 1 FROM pg_type WHERE typname = 'emailstatus') THEN
+        CREATE TYPE emailstatus AS ENUM ('PENDING', 'SENDING', 'SENT', 'FAILED');
+    END IF;
+END $$;
+
+CREATE TABLE IF NOT EXISTS email_outbox (
+    id SERIAL PRIMARY KEY,
+    user_id INTEGER REFERENCES users(id) ON DELETE CASCADE,
+    dedupe_key VARCHAR NOT NULL UNIQUE,
+    to_email VARCHAR NOT NULL,
+    subject VARCHAR NOT NULL,
+    html TEXT NOT NULL,
+    status emailstatus NOT NULL DEFAULT 'PENDING',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    next_attempt_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT now(),
+    locked_until TIMESTAMP WITH TIME ZONE,
+    last_error TEXT,
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT now(),
+    sent_at TIMESTAMP WITH TIME ZONE
+);
+CREATE INDEX IF NOT EXISTS ix_email_outbox_id ON email_outbox (id);
+CREATE INDEX IF NOT EXISTS ix_email_outbox_user_id ON email_outbox (user_id);
+CREATE INDEX IF NOT EXISTS ix_email_outbox_claim ON email_outbox (status, next_attempt_at);
+
+-- 이미지 최적화 (사용자 설정, ZIP 내보내기/GitHub 동기화 전에 재압축)
+ALTER TABLE users ADD COLUMN IF NOT EXISTS image_optimization_enabled BOOLEAN DEFAULT FALSE;
@@ -1,3 +1,7 @@
+import asyncio
+import json
+
+import httpx
 import pytest
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
@@ -6,6 +10,11 @@ from sqlalchemy.pool import StaticPool
 
 from app.main import app
 from app.core.database import Base, get_db
+from app.core.http import http_clients
+from app.core.config import settings
+from app.services.resilience import velog_breaker
+from app.services.rate_limit import velog_rate_limiter, LocalTokenBucketStore
+from app.services.image_cache import image_cache
 
 
 # 테스트용 인메모리 데이터베이스
@@ -51,3 +60,41 @@ def client(db_session):
 
     app.dependency_overrides.clear()
     Base.metadata.drop_all(bind=engine)
+
+
+@pytest.fixture
+def velog_transport():
+    """Velog GraphQL 요청을 가로채는 MockTransport 설치 (요청 payload 목록 반환)"""
+    requests = []
+
+    def install(handler):
+        async def _handler(request: httpx.Request) -> httpx.Response:
+            await asyncio.sleep(0)  # 실제 네트워크처럼 이벤트 루프에 양보
+            payload = json.loads(request.content)
+            requests.append(payload)
+            return handler(payload)
+        http_clients.register("velog", httpx.AsyncClient(transport=httpx.MockTransport(_handler)))
+        return requests
+
+    yield install
+    http_clients.register("velog", None)
+
+
+@pytest.fixture(autouse=True)
+def fast_velog_requests(monkeypatch):
+    """재시도 백오프 대기 제거 + 공유 서킷 브레이커/요청률 제한 초기화"""
+    monkeypatch.setattr(settings, "VELOG_BACKOFF_BASE_SECONDS", 0.0)
+    monkeypatch.setattr(velog_rate_limiter, "rate", 1000.0)
+    monkeypatch.setattr(velog_rate_limiter, "burst", 1000.0)
+    monkeypatch.setattr(velog_rate_limiter, "_store", LocalTokenBucketStore())
+    velog_breaker.record_success()
+    yield
+    velog_breaker.record_success()
+
+
+@pytest.fixture(autouse=True)
+def isolated_image_cache(tmp_path, monkeypatch):
+    """테스트마다 빈 이미지 캐시 디렉터리 사용"""
+    monkeypatch.setattr(image_cache, "root", str(tmp_path / "image_cache"))
+    monkeypatch.setattr(image_cache, "_ready", False)
+    yield image_cache
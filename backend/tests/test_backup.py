@@ -0,0 +1,231 @@
+import asyncio
+import json
+from datetime import datetime
+
+import httpx
+import pytest
+from sqlalchemy import event
+
+from app.api import backup as backup_module
+from app.api.backup import perform_backup_task, filter_changed_posts, load_stored_posts
+from app.core.config import settings
+from app.models.backup import BackupLog, BackupStatus
+from app.models.post import PostCache
+from app.models.user import User
+from app.services.checkpoint import BackupCheckpoint
+
+
+class FakeVelog:
+    """posts/post 쿼리에 응답하는 가짜 Velog GraphQL 핸들러"""
+
+    def __init__(self, count: int):
+        self.posts = {
+            f"post-{i}": {
+                "id": f"id-{i}",
+                "title": f"포스트 {i}",
+                "short_description": "",
+                "thumbnail": None,
+                "url_slug": f"post-{i}",
+                "released_at": f"2024-01-{i + 1:02d}T00:00:00.000Z",
+                "updated_at": f"2024-01-{i + 1:02d}T00:00:00.000Z",
+                "tags": ["test"],
+                "is_private": False,
+                "body": f"본문 {i}",
+            }
+            for i in range(count)
+        }
+        self.body_requests = 0
+        self.events = []
+
+    def listing(self):
+        return sorted(self.posts.values(), key=lambda p: p["released_at"], reverse=True)
+
+    def __call__(self, payload):
+        variables = payload["variables"]
+        if "posts(" in payload["query"]:
+            self.events.append("list")
+            listing = self.listing()
+            cursor = variables.get("cursor")
+            if cursor:
+                index = next(i for i, p in enumerate(listing) if p["id"] == cursor) + 1
+                listing = listing[index:]
+            page = [{k: v for k, v in p.items() if k != "body"} for p in listing[:100]]
+            return httpx.Response(200, json={"data": {"posts": page}})
+
+        self.body_requests += 1
+        self.events.append("body")
+        if "url_slug" in variables:
+            return httpx.Response(200, json={"data": {"post": self.posts.get(variables["url_slug"])}})
+        data = {
+            f"p{name[1:]}": self.posts.get(slug)
+            for name, slug in variables.items() if name.startswith("s")
+        }
+        return httpx.Response(200, json={"data": data})
+
+
+@pytest.fixture
+def user(db_session):
+    user = User(email="test@example.com", velog_username="tester", email_notification_enabled=False)
+    db_session.add(user)
+    db_session.commit()
+    return user
+
+
+class TestPerformBackup:
+    """백업 작업 통합 테스트 (가짜 Velog)"""
+
+    @pytest.mark.asyncio
+    async def test_first_backup_saves_all_posts(self, db_session, user, velog_transport):
+        fake = FakeVelog(5)
+        velog_transport(fake)
+
+        await perform_backup_task(user.id, False, db_session)
+
+        log = db_session.query(BackupLog).one()
+        assert log.status == BackupStatus.SUCCESS
+        assert log.posts_new == 5
+        assert log.listing_mode == "full"
+        assert db_session.query(PostCache).count() == 5
+
+    @pytest.mark.asyncio
+    async def test_metrics_record_phase_breakdown(self, db_session, user, velog_transport):
+        """단계별 시간/요청 수/바이트가 metrics에 기록됨"""
+        velog_transport(FakeVelog(5))
+
+        await perform_backup_task(user.id, False, db_session)
+
+        log = db_session.query(BackupLog).one()
+        metrics = json.loads(log.metrics)
+        phases = metrics["phases"]
+        assert {"prepare", "listing", "fetch", "write"} <= phases.keys()
+        assert phases["listing"]["requests"] >= 1
+        assert phases["fetch"]["requests"] >= 1
+        assert phases["fetch"]["bytes"] > 0
+        assert phases["fetch"]["retries"] == 0
+        assert phases["write"]["rows"] == 5
+        assert metrics["total_seconds"] >= phases["prepare"]["seconds"]
+
+    @pytest.mark.asyncio
+    async def test_unchanged_posts_skip_body_fetch(self, db_session, user, velog_transport):
+        """목록의 updated_at이 같으면 본문을 다시 받지 않음"""
+        fake = FakeVelog(5)
+        velog_transport(fake)
+        await perform_backup_task(user.id, False, db_session)
+
+        fake.body_requests = 0
+        fake.posts["post-1"]["updated_at"] = "2024-02-01T00:00:00.000Z"
+        fake.posts["post-1"]["body"] = "수정된 본문"
+        changed, unchanged = filter_changed_posts(fake.listing(), load_stored_posts(db_session, user.id), False)
+
+        assert [p["url_slug"] for p in changed] == ["post-1"]
+        assert len(unchanged) == 4
+
+        await perform_backup_task(user.id, False, db_session)
+        log = db_session.query(BackupLog).order_by(BackupLog.id.desc()).first()
+        assert log.posts_updated == 1
+        assert fake.body_requests == 1
+
+    @pytest.mark.asyncio
+    async def test_force_fetches_everything(self, db_session, user, velog_transport):
+        fake = FakeVelog(3)
+        velog_transport(fake)
+        await perform_backup_task(user.id, False, db_session)
+
+        changed, unchanged = filter_changed_posts(fake.listing(), load_stored_posts(db_session, user.id), True)
+        assert len(changed) == 3
+        assert unchanged == []
+
+    @pytest.mark.asyncio
+    async def test_change_detection_does_not_load_rows(self, db_session, user, velog_transport):
+        """포스트 행(content)을 읽지 않고 요약으로 판단, 변경분은 upsert로 기록"""
+        fake = FakeVelog(5)
+        velog_transport(fake)
+        user_id = user.id
+        await perform_backup_task(user_id, False, db_session)
+        for post in fake.posts.values():
+            post["updated_at"] = "2024-02-01T00:00:00.000Z"
+        fake.posts["post-2"]["body"] = "수정된 본문"
+        db_session.expunge_all()
+
+        statements = []
+        engine = db_session.get_bind()
+
+        def record(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        event.listen(engine, "before_cursor_execute", record)
+        try:
+            await perform_backup_task(user_id, False, db_session)
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+
+        db_session.expunge_all()
+        log = db_session.query(BackupLog).order_by(BackupLog.id.desc()).first()
+        assert (log.posts_updated, log.posts_skipped) == (1, 4)
+        content_loads = [s for s in statements if s.startswith("SELECT") and "post_cache.content AS" in s]
+        assert content_loads == []
+        upserts = [s for s in statements if s.startswith("INSERT INTO post_cache") and "ON CONFLICT" in s]
+        assert len(upserts) == 1
+        post_2 = db_session.query(PostCache).filter(PostCache.slug == "post-2").one()
+        assert "수정된 본문" in post_2.content
+        post_3 = db_session.query(PostCache).filter(PostCache.slug == "post-3").one()
+        assert post_3.velog_updated_at.replace(tzinfo=None) == datetime(2024, 2, 1)
+
+    @pytest.mark.asyncio
+    async def test_processing_starts_before_listing_finishes(self, db_session, user, velog_transport):
+        """첫 페이지가 도착하면 나머지 페이지 조회 중에도 본문 조회 시작"""
+        fake = FakeVelog(250)
+        velog_transport(fake)
+
+        await perform_backup_task(user.id, False, db_session)
+
+        last_listing = len(fake.events) - 1 - fake.events[::-1].index("list")
+        assert fake.events.index("body") < last_listing
+        log = db_session.query(BackupLog).one()
+        assert log.posts_total == 250
+        assert log.posts_new == 250
+
+    @pytest.mark.asyncio
+    async def test_worker_crash_fails_backup(self, db_session, user, velog_transport, monkeypatch):
+        """fetch 워커 예외를 삼키지 않음 - 일부 포스트가 빠진 채 성공 처리되지 않음"""
+        velog_transport(FakeVelog(50))
+        original = backup_module.take_batch
+        calls = []
+
+        async def flaky_take_batch(queue, size):
+            calls.append(size)
+            if len(calls) == 2:
+                raise RuntimeError("worker crashed")
+            return await original(queue, size)
+
+        monkeypatch.setattr(backup_module, "take_batch", flaky_take_batch)
+
+        await asyncio.wait_for(perform_backup_task(user.id, False, db_session), 10)
+
+        log = db_session.query(BackupLog).one()
+        assert log.status == BackupStatus.FAILED
+        assert "worker crashed" in log.error_details
+
+    @pytest.mark.asyncio
+    async def test_checkpoint_failure_does_not_stall_backup(self, db_session, user, velog_transport, monkeypatch):
+        """체크포인트 저장 실패는 기록만 하고 계속 진행 - writer가 멈춰 워커가 대기하지 않음"""
+        velog_transport(FakeVelog(400))
+        monkeypatch.setattr(settings, "BACKUP_CHECKPOINT_SECONDS", 0)
+        original = BackupCheckpoint.record
+        calls = []
+
+        def flaky_record(self, results):
+            results = list(results)
+            if results and not calls:
+                calls.append(len(results))
+                raise RuntimeError("checkpoint write failed")
+            original(self, results)
+
+        monkeypatch.setattr(BackupCheckpoint, "record", flaky_record)
+
+        await asyncio.wait_for(perform_backup_task(user.id, False, db_session), 10)
+
+        log = db_session.query(BackupLog).one()
+        assert calls
+        assert log.status == BackupStatus.SUCCESS
+        assert log.posts_new == 400
@@ -0,0 +1,108 @@
+import json
+
+import pytest
+
+from app.api.backup import find_resumable_log, perform_backup_task
+from app.models.backup import BackupLog, BackupStatus
+from app.models.post import PostCache
+from app.services.checkpoint import BackupCheckpoint
+from app.services.post_writer import PostWriteStage
+from tests.test_backup import FakeVelog, user  # noqa: F401
+
+
+def page(*slugs):
+    return [{"url_slug": slug, "updated_at": "2024-01-01T00:00:00.000Z"} for slug in slugs]
+
+
+class TestBackupCheckpoint:
+    """목록 커서/처리 완료 포스트 체크포인트"""
+
+    def test_cursor_advances_past_fully_saved_pages_only(self):
+        checkpoint = BackupCheckpoint()
+        checkpoint.add_page("c1", page("a", "b"))
+        checkpoint.add_page("c2", page("c"))
+
+        checkpoint.record([{"status": "new", "slug": "c"}])
+        assert checkpoint.cursor is None  # 앞 페이지가 아직 진행 중
+
+        checkpoint.record([{"status": "skipped", "slug": "a"}, {"status": "failed", "slug": "b"}])
+        assert checkpoint.cursor == "c2"
+        assert checkpoint.listed == 3
+        assert checkpoint.done == {"a": "skipped", "b": "failed", "c": "new"}
+
+    def test_json_round_trip(self):
+        checkpoint = BackupCheckpoint(force=True, cursor="c1", listed=100, done={"a": "new"})
+        checkpoint.add_page("c2", page("a"))
+
+        restored = BackupCheckpoint.from_json(checkpoint.to_json())
+        assert (restored.force, restored.cursor, restored.listed) == (True, "c2", 101)
+        assert restored.done == {"a": "new"}
+        assert restored.seen is not None
+        assert BackupCheckpoint.from_json("not json") is None
+
+
+def interrupted_log(user_id, checkpoint: BackupCheckpoint) -> BackupLog:
+    return BackupLog(
+        user_id=user_id,
+        status=BackupStatus.FAILED,
+        message="워커 중단으로 작업이 회수됨",
+        checkpoint=checkpoint.to_json(),
+    )
+
+
+class TestResumeBackup:
+    """중단된 백업 이어서 진행"""
+
+    @pytest.mark.asyncio
+    async def test_resumes_from_cursor_without_refetching_done_posts(self, db_session, user, velog_transport):
+        fake = FakeVelog(30)
+        velog_transport(fake)
+        done = {f"post-{i}": "new" for i in range(20, 30)}  # 최신순 첫 10개
+        previous = interrupted_log(user.id, BackupCheckpoint(cursor="id-20", listed=10, done=done))
+        db_session.add(previous)
+        db_session.commit()
+
+        await perform_backup_task(user.id, False, db_session)
+
+        log = db_session.query(BackupLog).filter(BackupLog.id != previous.id).one()
+        assert log.status == BackupStatus.SUCCESS
+        assert log.resumed_from_id == previous.id
+        assert (log.posts_total, log.posts_new, log.posts_resumed) == (30, 30, 10)
+        assert log.checkpoint is None
+        assert json.loads(log.metrics)["resume"]["posts"] == 10
+
+        stored = {slug for (slug,) in db_session.query(PostCache.slug)}
+        assert stored == {f"post-{i}" for i in range(20)}  # 이어받은 포스트는 다시 조회하지 않음
+        db_session.refresh(previous)
+        assert previous.status == BackupStatus.RESUMED
+
+    def test_only_latest_matching_failure_is_resumable(self, db_session, user):
+        checkpoint = BackupCheckpoint(cursor="id-1", done={"post-2": "new"})
+        db_session.add(interrupted_log(user.id, checkpoint))
+        db_session.commit()
+
+        assert find_resumable_log(db_session, user.id, True) is None  # force 옵션 불일치
+        assert find_resumable_log(db_session, user.id, False)[1].cursor == "id-1"
+
+        db_session.add(BackupLog(user_id=user.id, status=BackupStatus.SUCCESS))
+        db_session.commit()
+        assert find_resumable_log(db_session, user.id, False) is None
+
+    @pytest.mark.asyncio
+    async def test_checkpoint_is_saved_while_running(self, db_session, user, velog_transport, monkeypatch):
+        """실행 중 예외로 끝나도 마지막 체크포인트가 남아 다음 실행이 이어받음"""
+        velog_transport(FakeVelog(5))
+        original = PostWriteStage._checkpoint
+
+        async def crash_after_checkpoint(stage, results):
+            await original(stage, results)
+            raise RuntimeError("worker died")
+
+        monkeypatch.setattr(PostWriteStage, "_checkpoint", crash_after_checkpoint)
+        await perform_backup_task(user.id, False, db_session)
+
+        log = db_session.query(BackupLog).one()
+        assert log.status == BackupStatus.FAILED
+        checkpoint = BackupCheckpoint.from_json(log.checkpoint)
+        assert len(checkpoint.done) == 5
+        assert find_resumable_log(db_session, user.id, False)[0].id == log.id
@@ -0,0 +1,99 @@
+import asyncio
+
+import pytest
+
+from app.services.concurrency import AdaptiveLimiter, ByteBudget, percentile
+
+
+class TestAdaptiveLimiter:
+    """AIMD 적응형 동시성 제한기 테스트"""
+
+    def test_additive_increase_on_success(self):
+        limiter = AdaptiveLimiter(initial=2, min_limit=1, max_limit=8, latency_target=1.0)
+        for _ in range(2):
+            limiter.in_flight += 1
+            limiter.release(0.1, 200)
+        assert limiter.limit == 3
+
+    def test_increase_capped_at_max(self):
+        limiter = AdaptiveLimiter(initial=2, min_limit=1, max_limit=2, latency_target=1.0)
+        for _ in range(10):
+            limiter.in_flight += 1
+            limiter.release(0.1, 200)
+        assert limiter.limit == 2
+
+    def test_multiplicative_decrease_on_throttle(self):
+        limiter = AdaptiveLimiter(initial=8, min_limit=1, max_limit=16, latency_target=1.0)
+        limiter.in_flight += 1
+        limiter.release(0.1, 429)
+        assert limiter.limit == 4
+        assert limiter.throttle_events == 1
+
+    def test_decrease_cooldown_ignores_burst(self):
+        """같은 시점에 보낸 요청들의 연속 오류는 한 번만 감소"""
+        limiter = AdaptiveLimiter(initial=8, min_limit=1, max_limit=16, latency_target=1.0)
+        for _ in range(3):
+            limiter.in_flight += 1
+            limiter.release(0.1, 503)
+        assert limiter.limit == 4
+        assert limiter.error_events == 3
+
+    def test_slow_response_decreases(self):
+        limiter = AdaptiveLimiter(initial=4, min_limit=1, max_limit=16, latency_target=1.0)
+        limiter.in_flight += 1
+        limiter.release(2.0, 200)
+        assert limiter.limit == 2
+
+    @pytest.mark.asyncio
+    async def test_acquire_blocks_at_limit(self):
+        limiter = AdaptiveLimiter(initial=1, min_limit=1, max_limit=1, latency_target=1.0)
+        await limiter.acquire()
+
+        waiter = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0)
+        assert not waiter.done()
+
+        limiter.release(0.1, 200)
+        await asyncio.wait_for(waiter, timeout=1)
+        assert limiter.in_flight == 1
+
+    def test_snapshot(self):
+        limiter = AdaptiveLimiter(initial=2, min_limit=1, max_limit=4, latency_target=1.0)
+        for latency in (0.1, 0.2, 0.3, 0.4):
+            limiter.in_flight += 1
+            limiter.release(latency, 200)
+        snapshot = limiter.snapshot()
+        assert snapshot["requests"] == 4
+        assert snapshot["latency_ms"]["p50"] == 200
+        assert snapshot["concurrency"]["peak"] == 3
+
+    def test_percentile(self):
+        assert percentile([], 50) is None
+        assert percentile([3, 1, 2], 50) == 2
+        assert percentile(list(range(1, 101)), 99) == 99
+
+
+class TestByteBudget:
+    """동시에 받는 중인 바이트 상한"""
+
+    @pytest.mark.asyncio
+    async def test_waits_until_bytes_released(self):
+        budget = ByteBudget(2500)
+        peak = 0
+
+        async def download(size):
+            nonlocal peak
+            async with budget.reserve(size):
+                peak = max(peak, budget.in_use)
+                await asyncio.sleep(0.01)
+
+        await asyncio.gather(*(download(1000) for _ in range(6)))
+        assert peak == 2000
+        assert budget.in_use == 0
+
+    @pytest.mark.asyncio
+    async def test_oversized_request_runs_alone(self):
+        budget = ByteBudget(1000)
+        async with budget.reserve(5000):
+            assert budget.in_use == 1000
+        assert budget.in_use == 0
@@ -0,0 +1,121 @@
+import json
+from datetime import datetime, timezone
+
+import httpx
+import pytest
+
+from app.api.backup import perform_backup_task
+from app.core.config import settings
+from app.core.http import http_clients
+from app.models.email import EmailOutbox, EmailStatus
+from app.models.user import User
+from app.services.email_outbox import EmailOutboxQueue
+from tests.test_backup import FakeVelog
+
+
+class FakeResend:
+    """Resend API 요청 기록 (handler로 응답 지정)"""
+
+    def __init__(self):
+        self.requests = []
+        self.handler = lambda request: httpx.Response(200, json={"data": []})
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        return self.handler(request)
+
+
+@pytest.fixture
+def resend(monkeypatch):
+    monkeypatch.setattr(settings, "RESEND_API_KEY", "re_test")
+    fake = FakeResend()
+    http_clients.register("resend", httpx.AsyncClient(transport=httpx.MockTransport(fake)))
+    yield fake
+    http_clients.register("resend", None)
+
+
+@pytest.fixture
+def db_call(db_session):
+    async def call(fn, *args):
+        return fn(db_session, *args)
+    return call
+
+
+def queue(db, count):
+    for i in range(count):
+        EmailOutboxQueue.enqueue(db, f"user{i}@example.com", f"제목 {i}", "<p>본문</p>", f"test:{i}")
+
+
+class TestEmailOutbox:
+    """이메일 발송 대기열 (Resend 배치 발송)"""
+
+    @pytest.mark.asyncio
+    async def test_backup_only_queues_email(self, db_session, velog_transport, resend):
+        user = User(email="test@example.com", velog_username="tester", email_notification_enabled=True)
+        db_session.add(user)
+        db_session.commit()
+        velog_transport(FakeVelog(2))
+
+        await perform_backup_task(user.id, False, db_session)
+
+        email = db_session.query(EmailOutbox).one()
+        assert email.status == EmailStatus.PENDING
+        assert email.to_email == "test@example.com"
+        assert "백업 완료" in email.subject
+        assert resend.requests == []
+
+    def test_dedupe_key(self, db_session):
+        first = EmailOutboxQueue.enqueue(db_session, "a@example.com", "s", "h", "backup:1:success")
+        second = EmailOutboxQueue.enqueue(db_session, "a@example.com", "s", "h", "backup:1:success")
+        assert first is not None and second is None
+        assert db_session.query(EmailOutbox).count() == 1
+
+    @pytest.mark.asyncio
+    async def test_sends_pending_in_one_batch(self, db_session, db_call, resend):
+        queue(db_session, 3)
+
+        assert await EmailOutboxQueue.deliver(db_call) == 3
+
+        assert len(resend.requests) == 1
+        assert resend.requests[0].url.path == "/emails/batch"
+        assert resend.requests[0].headers["Idempotency-Key"]
+        assert [m["to"] for m in json.loads(resend.requests[0].content)] == [[f"user{i}@example.com"] for i in range(3)]
+        db_session.expire_all()
+        assert {e.status for e in db_session.query(EmailOutbox)} == {EmailStatus.SENT}
+        assert await EmailOutboxQueue.deliver(db_call) == 0
+
+    @pytest.mark.asyncio
+    async def test_transient_error_backs_off(self, db_session, db_call, resend):
+        queue(db_session, 2)
+        resend.handler = lambda request: httpx.Response(503)
+
+        assert await EmailOutboxQueue.deliver(db_call) == 0
+
+        db_session.expire_all()
+        for email in db_session.query(EmailOutbox):
+            assert (email.status, email.attempts) == (EmailStatus.PENDING, 1)
+            assert email.next_attempt_at.replace(tzinfo=timezone.utc) > datetime.now(timezone.utc)
+        assert await EmailOutboxQueue.deliver(db_call) == 0  # 재시도 시각 전
+        assert len(resend.requests) == 1
+
+    @pytest.mark.asyncio
+    async def test_rejected_batch_is_split(self, db_session, db_call, resend):
+        """배치가 4xx로 거부되면 하나씩 다시 보내고, 거부된 메일만 실패 처리"""
+        queue(db_session, 3)
+
+        def handler(request):
+            body = json.loads(request.content)
+            if isinstance(body, list) or body["to"] == ["user1@example.com"]:
+                return httpx.Response(422, json={"message": "invalid"})
+            return httpx.Response(200, json={"id": "sent"})
+        resend.handler = handler
+
+        assert await EmailOutboxQueue.deliver(db_call) == 2
+
+        db_session.expire_all()
+        statuses = {e.to_email: e.status for e in db_session.query(EmailOutbox)}
+        assert statuses == {
+            "user0@example.com": EmailStatus.SENT,
+            "user1@example.com": EmailStatus.FAILED,
+            "user2@example.com": EmailStatus.SENT,
+        }
@@ -0,0 +1,72 @@
+import json
+
+import httpx
+import pytest
+
+from app.core.http import http_clients
+from app.services.velog import VelogService
+from benchmarks.fake_velog import FakeVelogConfig, cassette_key, create_app
+
+
+@pytest.fixture
+def fake_velog(monkeypatch):
+    """벤치마크용 대역 서버를 velog 클라이언트에 연결"""
+    monkeypatch.setattr(VelogService, "GRAPHQL_ENDPOINT", "http://fake-velog/graphql")
+
+    def install(config: FakeVelogConfig):
+        app = create_app(config)
+        http_clients.register("velog", httpx.AsyncClient(transport=httpx.ASGITransport(app=app)))
+        return app.state.fake_velog
+
+    yield install
+    http_clients.register("velog", None)
+
+
+class TestFakeVelog:
+    """로컬 Velog GraphQL 대역 서버"""
+
+    @pytest.mark.asyncio
+    async def test_listing_and_batch_fetch(self, fake_velog):
+        server = fake_velog(FakeVelogConfig(posts=130, body_length=500, images_per_post=2))
+        velog = VelogService()
+
+        posts = await velog.get_user_posts("tester")
+        assert len(posts) == 130
+        assert posts[0]["released_at"] > posts[-1]["released_at"]
+
+        slugs = [p["url_slug"] for p in posts[:5]]
+        contents = await velog.get_posts_content("tester", slugs)
+        assert set(contents) == set(slugs)
+        body = contents[slugs[0]]["body"]
+        assert "![image 0](" in body and '<img src="' in body
+        assert server.stats["posts"] == 3  # 100 + 30 + 빈 페이지
+        assert server.stats["batch_posts"] == 5
+
+    @pytest.mark.asyncio
+    async def test_injected_errors_are_retried(self, fake_velog):
+        server = fake_velog(FakeVelogConfig(posts=3, error_rate=0.5, seed=1))
+        velog = VelogService()
+
+        posts = await velog.get_user_posts("tester")
+        assert len(posts) == 3
+        assert velog.retries == server.stats["errors"] > 0
+
+    @pytest.mark.asyncio
+    async def test_replay_serves_recorded_responses(self, fake_velog, tmp_path):
+        query = "query { posts(username: $username, limit: 1) { id } }"
+        variables = {"username": "tester"}
+        cassette = tmp_path / "cassette.jsonl"
+        cassette.write_text(json.dumps({
+            "key": cassette_key(query, variables),
+            "status": 200,
+            "body": json.dumps({"data": {"posts": [{"id": "recorded"}]}}),
+        }) + "\n")
+        server = fake_velog(FakeVelogConfig(replay_path=str(cassette)))
+        velog = VelogService()
+
+        data, _ = await velog._post_graphql("  " + query.replace(" ", "\n  "), variables)
+        assert data["data"]["posts"][0]["id"] == "recorded"
+
+        with pytest.raises(httpx.HTTPStatusError):
+            await velog._post_graphql(query, {"username": "other"})
+        assert server.stats["replay_misses"] == 1
@@ -0,0 +1,49 @@
+import pytest
+
+from app.core.http import HTTPClientRegistry, UPSTREAMS
+
+
+class TestHTTPClientRegistry:
+    """업스트림별 공유 HTTP 클라이언트 레지스트리 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_start_creates_all_upstreams(self):
+        """start() 시 모든 업스트림 풀 생성"""
+        registry = HTTPClientRegistry()
+        registry.start()
+        try:
+            for name in UPSTREAMS:
+                assert not registry.get(name).is_closed
+        finally:
+            await registry.aclose()
+
+    @pytest.mark.asyncio
+    async def test_get_returns_same_client(self):
+        """같은 업스트림은 같은 클라이언트(커넥션 풀) 재사용"""
+        registry = HTTPClientRegistry()
+        try:
+            assert registry.get("velog") is registry.get("velog")
+            assert registry.get("velog") is not registry.get("github")
+        finally:
+            await registry.aclose()
+
+    @pytest.mark.asyncio
+    async def test_aclose_closes_clients(self):
+        """종료 시 모든 풀이 닫히고, 이후 get()은 새 풀 생성"""
+        registry = HTTPClientRegistry()
+        client = registry.get("images")
+        await registry.aclose()
+        assert client.is_closed
+
+        new_client = registry.get("images")
+        try:
+            assert new_client is not client
+            assert not new_client.is_closed
+        finally:
+            await registry.aclose()
+
+    def test_unknown_upstream(self):
+        """등록되지 않은 업스트림 요청 시 에러"""
+        registry = HTTPClientRegistry()
+        with pytest.raises(KeyError):
+            registry.get("unknown")
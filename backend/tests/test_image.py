@@ -0,0 +1,232 @@
+import asyncio
+import base64
+import io
+import json
+import os
+import threading
+
+import httpx
+import pytest
+
+from app.core.config import settings
+from app.core.http import http_clients
+from app.services.github_sync import GitHubSyncService
+from app.services.image import ImageQuota, ImageService
+
+
+class SlowCDN:
+    """요청마다 지연 후 응답하고 호스트별 최대 동시 요청 수를 기록"""
+
+    def __init__(self, delays=None, size=100):
+        self.delays = delays or {}
+        self.size = size
+        self.active = {}
+        self.peak = {}
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        host = request.url.host
+        self.active[host] = self.active.get(host, 0) + 1
+        self.peak[host] = max(self.peak.get(host, 0), self.active[host])
+        try:
+            await asyncio.sleep(self.delays.get(request.url.path, 0.01))
+        finally:
+            self.active[host] -= 1
+        body = request.url.path.encode().ljust(self.size, b".")
+        return httpx.Response(200, content=body, headers={"Content-Length": str(len(body))})
+
+
+@pytest.fixture
+def slow_cdn():
+    def install(**kwargs):
+        fake = SlowCDN(**kwargs)
+        http_clients.register("images", httpx.AsyncClient(transport=httpx.MockTransport(fake)))
+        return fake
+    yield install
+    http_clients.register("images", None)
+
+
+class TestDownloadImages:
+    """포스트 이미지 동시 다운로드"""
+
+    @pytest.mark.asyncio
+    async def test_results_keep_order_with_per_host_limit(self, slow_cdn, monkeypatch):
+        monkeypatch.setattr(settings, "IMAGE_DOWNLOAD_PER_HOST", 3)
+        cdn = slow_cdn(delays={f"/{i}.png": 0.05 - i * 0.002 for i in range(20)})
+        urls = [f"https://a.example/{i}.png" for i in range(20)] + ["https://b.example/x.png"]
+
+        files = await ImageService.download_images(urls)
+        results = [f.read() for f in files]
+        ImageService.close_images(files)
+
+        assert [r[:len(f"/{i}.png")] for i, r in enumerate(results[:20])] == [f"/{i}.png".encode() for i in range(20)]
+        assert results[20].startswith(b"/x.png")
+        assert cdn.peak["a.example"] == 3
+
+    @pytest.mark.asyncio
+    async def test_slow_image_times_out_alone(self, slow_cdn):
+        slow_cdn(delays={"/slow.png": 1.0})
+        urls = ["https://a.example/1.png", "https://a.example/slow.png", "https://a.example/1.png"]
+
+        files = await ImageService.download_images(urls, timeout=0.2)
+
+        assert files[1] is None
+        assert files[0] is files[2] and files[0].read().startswith(b"/1.png")
+        ImageService.close_images(files)
+
+
+
+class TestStreamedDownloads:
+    """이미지 본문을 디스크로 스트리밍 + 크기 상한"""
+
+    @pytest.mark.asyncio
+    async def test_oversized_image_is_skipped(self, isolated_image_cache, monkeypatch):
+        monkeypatch.setattr(settings, "IMAGE_DOWNLOAD_MAX_BYTES", 150)
+
+        async def chunks():
+            for _ in range(4):
+                yield b"x" * 64
+
+        def handler(request):
+            if request.url.path == "/declared.png":
+                return httpx.Response(200, content=b"x" * 200)
+            return httpx.Response(200, content=chunks())  # Content-Length 없음 - 받는 중에 중단
+
+        http_clients.register("images", httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+        try:
+            assert await ImageService.download_image("https://a.example/declared.png") is None
+            assert await ImageService.download_image("https://a.example/streamed.png") is None
+        finally:
+            http_clients.register("images", None)
+        # 받다 만 임시 파일이 캐시 디렉터리에 남지 않음
+        assert [name for name in os.listdir(isolated_image_cache.root) if name.startswith(".tmp-")] == []
+
+    @pytest.mark.asyncio
+    async def test_cancel_while_caching_closes_file(self, slow_cdn, isolated_image_cache, monkeypatch):
+        slow_cdn(size=100)
+        quota = ImageQuota(max_bytes=1000)
+        release = threading.Event()
+        opened = []
+        temp_file, store_file = isolated_image_cache.temp_file, isolated_image_cache.store_file
+
+        def tracked_temp_file():
+            f, path = temp_file()
+            opened.append(f)
+            return f, path
+
+        def blocked_store_file(*args):
+            release.wait(5)
+            return store_file(*args)
+
+        monkeypatch.setattr(isolated_image_cache, "temp_file", tracked_temp_file)
+        monkeypatch.setattr(isolated_image_cache, "store_file", blocked_store_file)
+        try:
+            with pytest.raises(asyncio.TimeoutError):
+                await asyncio.wait_for(ImageService.download_image("https://a.example/x.png", quota=quota), 0.2)
+        finally:
+            release.set()
+
+        (f,) = opened
+        assert f.closed
+        assert quota.used == 0
+
+    @pytest.mark.asyncio
+    async def test_job_quota_stops_remaining_images(self, slow_cdn):
+        slow_cdn(size=100)
+        quota = ImageQuota(max_bytes=250)
+        urls = [f"https://a.example/{i}.png" for i in range(3)]
+
+        files = await ImageService.download_images(urls, quota=quota)
+
+        assert sum(f is not None for f in files) == 2
+        assert quota.used == 200
+        ImageService.close_images(files)
+
+    @pytest.mark.asyncio
+    async def test_cache_disabled_uses_temp_file(self, slow_cdn, monkeypatch):
+        monkeypatch.setattr(settings, "IMAGE_CACHE_ENABLED", False)
+        slow_cdn(size=100)
+
+        f = await ImageService.download_image("https://a.example/x.png")
+        with f:
+            assert f.read().startswith(b"/x.png")
+
+    @pytest.mark.asyncio
+    async def test_blob_body_streams_file(self):
+        data = os.urandom(3 * 1024 + 2)
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(201, json={"sha": "abc"})
+
+        service = GitHubSyncService("token")
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            assert await service._create_blob(client, "owner", "repo", io.BytesIO(data)) == "abc"
+
+        body = requests[0].content
+        assert int(requests[0].headers["Content-Length"]) == len(body)
+        assert base64.b64decode(json.loads(body)["content"]) == data
+
+
+def legacy_rewrite(content):
+    """기존 str.replace 반복 치환 (결과 비교용)"""
+    processed = content
+    for index, (full_match, alt_text, url) in enumerate(ImageService.extract_image_urls(content), 1):
+        relative_path = f"./images/{ImageService.get_image_filename(url, index)}"
+        if full_match.startswith('!['):
+            new_ref = f"![{alt_text}]({relative_path})"
+        else:
+            new_ref = full_match.replace(url, relative_path)
+        processed = processed.replace(full_match, new_ref, 1)
+    return processed
+
+
+class TestRewriteImages:
+    """마크다운 이미지 경로 한 번에 치환"""
+
+    CONTENT = (
+        "# 제목\n"
+        "![첫번째](https://cdn.example.com/a.png)\n"
+        '<img src="https://cdn.example.com/b.JPG" width="300" />\n'
+        "본문 ![](https://cdn.example.com/c.gif?w=100) 중간\n"
+        "![첫번째](https://cdn.example.com/a.png)\n"
+        '<img src="https://cdn.example.com/not-image" />\n'
+    )
+
+    def test_matches_legacy_rewrite(self):
+        text, manifest = ImageService.rewrite_images(self.CONTENT)
+
+        assert text == legacy_rewrite(self.CONTENT)
+        # 파일명 번호는 마크다운 이미지 → HTML img 순 (기존 파일명 유지)
+        assert [(image.index, image.filename) for image in manifest] == [
+            (1, "1_a.png"), (2, "2_c.gif"), (3, "3_a.png"), (4, "4_b.JPG"),
+        ]
+        assert '<img src="./images/4_b.JPG" width="300" />' in text
+        assert "https://cdn.example.com/not-image" in text
+
+    def test_only_given_images_are_rewritten(self):
+        images = ImageService.scan_images(self.CONTENT)
+        kept = [image for image in images if image.index != 3]
+
+        text, manifest = ImageService.rewrite_images(self.CONTENT, kept)
+
+        assert [image.index for image in manifest] == [1, 2, 4]
+        assert text.count("https://cdn.example.com/a.png") == 1
+        assert text.endswith("![첫번째](https://cdn.example.com/a.png)\n" '<img src="https://cdn.example.com/not-image" />\n')
+
+    def test_no_images(self):
+        assert ImageService.rewrite_images("본문만 있음") == ("본문만 있음", [])
+
+    @pytest.mark.asyncio
+    async def test_process_images_keeps_failed_url(self):
+        content = '![a](https://cdn.example.com/a.png) <img src="https://cdn.example.com/b.png">'
+        http_clients.register("images", httpx.AsyncClient(transport=httpx.MockTransport(
+            lambda request: httpx.Response(404 if request.url.path == "/b.png" else 200, content=b"img")
+        )))
+        try:
+            text, files = await ImageService.process_images(content)
+        finally:
+            http_clients.register("images", None)
+
+        assert text == '![a](./images/1_a.png) <img src="https://cdn.example.com/b.png">'
+        assert files == [("1_a.png", b"img")]
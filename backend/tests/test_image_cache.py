@@ -0,0 +1,103 @@
+import io
+import sqlite3
+import zipfile
+from contextlib import closing
+from datetime import datetime, timezone
+
+import httpx
+import pytest
+
+from app.core.config import settings
+from app.core.http import http_clients
+from app.core.security import create_access_token
+from app.models.post import PostCache
+from app.services.image import ImageService
+from app.services.image_cache import ImageCache
+from tests.test_backup import user  # noqa: F401
+
+
+class FakeCDN:
+    """이미지 요청 기록 (URL 경로를 본문으로, ETag 지원)"""
+
+    def __init__(self):
+        self.requests = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        etag = f'"{request.url.path}"'
+        if request.headers.get("If-None-Match") == etag:
+            return httpx.Response(304)
+        return httpx.Response(200, content=request.url.path.encode(), headers={"ETag": etag})
+
+
+async def download(url):
+    f = await ImageService.download_image(url)
+    with f:
+        return f.read()
+
+
+@pytest.fixture
+def cdn():
+    fake = FakeCDN()
+    http_clients.register("images", httpx.AsyncClient(transport=httpx.MockTransport(fake)))
+    yield fake
+    http_clients.register("images", None)
+
+
+class TestImageCache:
+    """내용 주소 기반 이미지 캐시"""
+
+    @pytest.mark.asyncio
+    async def test_second_download_uses_cache(self, cdn):
+        url = "https://velog.velcdn.com/images/a.png"
+        assert await download(url) == b"/images/a.png"
+        assert await download(url) == b"/images/a.png"
+        assert len(cdn.requests) == 1
+
+    def test_same_content_stored_once(self, tmp_path):
+        cache = ImageCache(str(tmp_path), max_bytes=1024)
+        first = cache.store("https://a.example/x.png", b"same")
+        second = cache.store("https://b.example/y.png", b"same")
+        assert first.path == second.path
+        assert cache.total_bytes() == 4
+
+    def test_lru_eviction(self, tmp_path):
+        cache = ImageCache(str(tmp_path), max_bytes=10)
+        cache.store("https://x/a.png", b"aaaa")
+        cache.store("https://x/b.png", b"bbbb")
+        assert cache.lookup("https://x/a.png")  # a를 최근 사용으로
+        cache.store("https://x/c.png", b"cccc")
+
+        assert cache.lookup("https://x/b.png") is None
+        assert cache.read(cache.lookup("https://x/a.png")) == b"aaaa"
+        assert cache.total_bytes() == 8
+
+    @pytest.mark.asyncio
+    async def test_stale_entry_revalidated_with_etag(self, cdn, isolated_image_cache, monkeypatch):
+        url = "https://velog.velcdn.com/images/b.png"
+        await download(url)
+        monkeypatch.setattr(settings, "IMAGE_CACHE_REVALIDATE_HOURS", 1)
+        with closing(sqlite3.connect(f"{isolated_image_cache.root}/index.sqlite3")) as conn, conn:
+            conn.execute("UPDATE urls SET fetched_at = fetched_at - 7200")
+
+        assert await download(url) == b"/images/b.png"
+        assert cdn.requests[-1].headers["If-None-Match"] == '"/images/b.png"'
+        assert not isolated_image_cache.is_stale(isolated_image_cache.lookup(url))
+
+    def test_repeat_zip_export_skips_network(self, client, db_session, user, cdn):  # noqa: F811
+        db_session.add(PostCache(
+            user_id=user.id, slug="post", title="포스트", content_hash="h",
+            content="![a](https://velog.velcdn.com/images/a.png)\n<img src=\"https://velog.velcdn.com/images/b.gif\" />",
+            velog_published_at=datetime(2024, 1, 1, tzinfo=timezone.utc),
+        ))
+        db_session.commit()
+        headers = {"Authorization": f"Bearer {create_access_token({'sub': str(user.id)})}"}
+
+        first = client.get("/api/v1/backup/download-zip", headers=headers)
+        second = client.get("/api/v1/backup/download-zip", headers=headers)
+
+        assert first.status_code == second.status_code == 200
+        assert len(cdn.requests) == 2
+        with zipfile.ZipFile(io.BytesIO(second.content)) as archive:
+            assert archive.read("포스트/images/2_b.gif") == b"/images/b.gif"
+            assert "./images/1_a.png" in archive.read("포스트/index.md").decode()
@@ -0,0 +1,163 @@
+import io
+import tempfile
+import threading
+import time
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+
+import httpx
+import pytest
+
+from app.core.config import settings
+from app.core.http import http_clients
+from app.core.security import create_access_token
+from app.models.backup import BackupLog, BackupStatus
+from app.models.post import PostCache
+from app.services import image_optimizer
+from app.services.image import ImageService
+from app.services.image_optimizer import ImageOptimizer, optimize_file
+from tests.test_backup import user  # noqa: F401
+
+Image = pytest.importorskip("PIL.Image")
+
+
+def png_bytes(width=2400, height=1200) -> bytes:
+    img = Image.new("RGB", (width, height))
+    img.putdata([(x % 256, (x * y) % 256, y % 256) for y in range(height) for x in range(width)])
+    buf = io.BytesIO()
+    img.save(buf, "PNG")
+    return buf.getvalue()
+
+
+@pytest.fixture(scope="module")
+def big_png():
+    return png_bytes()
+
+
+@pytest.fixture
+def cdn(big_png):
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(200, content=big_png)
+
+    http_clients.register("images", httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+    yield requests
+    http_clients.register("images", None)
+    image_optimizer.shutdown_pool()
+
+
+class TestImageOptimizer:
+    """이미지 최적화 (프로세스 풀, 원본 해시 캐시)"""
+
+    def test_optimize_file_resizes_and_converts(self, tmp_path, big_png):
+        src, dst = tmp_path / "a.png", tmp_path / "a.out"
+        src.write_bytes(big_png)
+
+        ext, size, digest = optimize_file(str(src), str(dst), 1200, True, 85)
+
+        assert ext == ".webp" and size == dst.stat().st_size < len(big_png)
+        with Image.open(dst) as img:
+            assert (img.format, img.size) == ("WEBP", (1200, 600))
+
+    def test_not_smaller_keeps_original(self, tmp_path):
+        src = tmp_path / "small.png"
+        src.write_bytes(png_bytes(8, 8))
+        assert optimize_file(str(src), str(tmp_path / "out"), 1920, False, 85) is None
+
+    @pytest.mark.asyncio
+    async def test_timeout_starts_when_worker_slot_acquired(self, monkeypatch):
+        """변환 대기 시간은 시간 상한에 포함되지 않음 - 작업자 수만큼만 동시에 변환"""
+        monkeypatch.setattr(settings, "IMAGE_CACHE_ENABLED", False)
+        monkeypatch.setattr(settings, "IMAGE_OPTIMIZE_MIN_BYTES", 0)
+        monkeypatch.setattr(settings, "IMAGE_OPTIMIZE_WORKERS", 1)
+        monkeypatch.setattr(settings, "IMAGE_OPTIMIZE_TIMEOUT_SECONDS", 0.3)
+        pool = ThreadPoolExecutor(max_workers=4)
+        monkeypatch.setattr(image_optimizer, "get_pool", lambda: pool)
+        lock = threading.Lock()
+        active, peak = [0], [0]
+
+        def slow_optimize(src, dst, *args):
+            with lock:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+            time.sleep(0.15)
+            with open(dst, "wb") as out:
+                out.write(b"x")
+            with lock:
+                active[0] -= 1
+            return None, 1, "digest"
+
+        monkeypatch.setattr(image_optimizer, "optimize_file", slow_optimize)
+        images = ImageService.scan_images("".join(f"![{i}](https://cdn.example.com/{i}.png)" for i in range(4)))
+        files = []
+        for i in range(4):
+            f = tempfile.TemporaryFile()
+            f.write(b"image %d" % i * 100)
+            f.seek(0)
+            files.append(f)
+
+        optimizer = ImageOptimizer()
+        try:
+            optimized = await optimizer.optimize_all(list(zip(images, files)))
+            ImageService.close_images([f for _, f in optimized])
+        finally:
+            ImageService.close_images(files)
+            image_optimizer.shutdown_pool()
+            pool.shutdown()
+
+        assert optimizer.optimized == 4
+        assert peak[0] == 1
+
+    @pytest.mark.asyncio
+    async def test_optimized_result_cached_by_source_hash(self, cdn, big_png, monkeypatch):
+        monkeypatch.setattr(settings, "IMAGE_OPTIMIZE_MAX_DIMENSION", 1200)
+        images = ImageService.scan_images("![a](https://cdn.example.com/a.png)")
+
+        async def run():
+            optimizer = ImageOptimizer()
+            files = await ImageService.download_images([image.url for image in images])
+            optimized = await optimizer.optimize_all(list(zip(images, files)))
+            try:
+                (image, f), = optimized
+                return optimizer, image, f.read()
+            finally:
+                ImageService.close_images(files + [f for _, f in optimized])
+
+        optimizer, image, data = await run()
+        assert image.filename == "1_a.webp"
+        assert data[8:12] == b"WEBP"
+        assert optimizer.to_dict()["bytes_saved"] == len(big_png) - len(data) > 0
+
+        # 두 번째는 캐시된 결과 사용 (프로세스 풀 사용 안 함)
+        monkeypatch.setattr(image_optimizer, "get_pool", lambda: pytest.fail("optimized again"))
+        optimizer, image, cached = await run()
+        assert (image.filename, cached) == ("1_a.webp", data)
+        assert optimizer.optimized == 1
+
+    def test_zip_export_uses_user_setting(self, client, db_session, user, cdn, monkeypatch):  # noqa: F811
+        monkeypatch.setattr(settings, "IMAGE_OPTIMIZE_MAX_DIMENSION", 1200)
+        db_session.add(PostCache(
+            user_id=user.id, slug="post", title="포스트", content_hash="h",
+            content="![a](https://cdn.example.com/a.png)",
+            velog_published_at=datetime(2024, 1, 1, tzinfo=timezone.utc),
+        ))
+        db_session.add(BackupLog(user_id=user.id, status=BackupStatus.SUCCESS, metrics='{"total_seconds": 1.0}'))
+        db_session.commit()
+        headers = {"Authorization": f"Bearer {create_access_token({'sub': str(user.id)})}"}
+
+        response = client.put("/api/v1/user/settings", json={"image_optimization_enabled": True}, headers=headers)
+        assert response.json()["image_optimization_enabled"] is True
+
+        response = client.get("/api/v1/backup/download-zip", headers=headers)
+        with zipfile.ZipFile(io.BytesIO(response.content)) as archive:
+            assert "포스트/images/1_a.webp" in archive.namelist()
+            assert "./images/1_a.webp" in archive.read("포스트/index.md").decode()
+
+        # 절감량은 내보낸 백업 로그의 metrics.zip_images로 조회
+        (log,) = client.get("/api/v1/backup/logs", headers=headers).json()
+        assert log["metrics"]["total_seconds"] == 1.0
+        assert log["metrics"]["zip_images"]["optimized"] == 1
+        assert log["metrics"]["zip_images"]["bytes_saved"] > 0
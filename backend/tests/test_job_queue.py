@@ -0,0 +1,197 @@
+from datetime import datetime, timezone, timedelta
+
+import pytest
+
+from app.core.config import settings
+from app.models.backup import BackupLog, BackupStatus
+from app.models.job import BackupJob, JobClass, JobStatus
+from app.models.post import PostCache
+from app.models.user import User
+from app.services.job_queue import BackupJobQueue
+from app.worker import BackupWorker
+from tests.conftest import TestingSessionLocal
+from tests.test_backup import FakeVelog
+
+
+@pytest.fixture
+def user(db_session):
+    user = User(email="queue@example.com", velog_username="tester", email_notification_enabled=False)
+    db_session.add(user)
+    db_session.commit()
+    return user
+
+
+class TestBackupJobQueue:
+    """Postgres 작업 큐 (SQLite에서는 SKIP LOCKED 없이 동작)"""
+
+    def test_claim_takes_lease(self, db_session, user):
+        job = BackupJobQueue.enqueue(db_session, user.id)
+
+        claimed = BackupJobQueue.claim(db_session, "worker-a")
+        assert claimed.id == job.id
+        assert claimed.status == JobStatus.RUNNING
+        assert claimed.locked_by == "worker-a"
+        assert claimed.attempts == 1
+        assert BackupJobQueue.claim(db_session, "worker-b") is None
+
+    def test_expired_lease_is_reclaimed(self, db_session, user):
+        BackupJobQueue.enqueue(db_session, user.id)
+        job = BackupJobQueue.claim(db_session, "worker-a")
+        job.lease_expires_at = datetime.now(timezone.utc) - timedelta(seconds=1)
+        db_session.commit()
+
+        reclaimed = BackupJobQueue.claim(db_session, "worker-b")
+        assert reclaimed.id == job.id
+        assert reclaimed.locked_by == "worker-b"
+        assert reclaimed.attempts == 2
+        assert BackupJobQueue.heartbeat(db_session, job.id, "worker-a") is False
+        assert BackupJobQueue.heartbeat(db_session, job.id, "worker-b") is True
+
+    def test_crash_is_retried_until_max_attempts(self, db_session, user, monkeypatch):
+        monkeypatch.setattr(settings, "BACKUP_JOB_MAX_ATTEMPTS", 2)
+        job = BackupJobQueue.enqueue(db_session, user.id)
+
+        BackupJobQueue.claim(db_session, "worker-a")
+        BackupJobQueue.complete(db_session, job.id, "worker-a", "boom", retry=True)
+        db_session.refresh(job)
+        assert job.status == JobStatus.QUEUED
+        assert job.run_after.replace(tzinfo=timezone.utc) > datetime.now(timezone.utc)
+
+        job.run_after = datetime.now(timezone.utc) - timedelta(seconds=1)
+        db_session.commit()
+        BackupJobQueue.claim(db_session, "worker-a")
+        BackupJobQueue.complete(db_session, job.id, "worker-a", "boom", retry=True)
+        db_session.refresh(job)
+        assert job.status == JobStatus.FAILED
+
+    def test_release_returns_job_to_queue(self, db_session, user):
+        job = BackupJobQueue.enqueue(db_session, user.id)
+        BackupJobQueue.claim(db_session, "worker-a")
+
+        BackupJobQueue.release(db_session, job.id, "worker-a")
+        db_session.refresh(job)
+        assert (job.status, job.attempts, job.locked_by) == (JobStatus.QUEUED, 0, None)
+
+
+def make_user(db_session, name, posts=0):
+    user = User(email=f"{name}@example.com", velog_username=name)
+    db_session.add(user)
+    db_session.flush()
+    db_session.add_all(PostCache(user_id=user.id, slug=f"{name}-{i}", title="t", content="", content_hash="h") for i in range(posts))
+    db_session.commit()
+    return user
+
+
+class TestJobPriority:
+    """우선순위 클래스와 사용자/대형 작업 동시 실행 제한"""
+
+    def test_manual_runs_before_older_scheduled(self, db_session, user):
+        other = make_user(db_session, "other")
+        BackupJobQueue.enqueue(db_session, user.id, job_class=JobClass.SCHEDULED)
+        manual = BackupJobQueue.enqueue(db_session, other.id)
+
+        assert BackupJobQueue.claim(db_session, "worker-a").id == manual.id
+
+    def test_user_runs_one_job_at_a_time(self, db_session, user):
+        first = BackupJobQueue.enqueue(db_session, user.id)
+        BackupJobQueue.enqueue(db_session, user.id, job_class=JobClass.SCHEDULED)
+
+        assert BackupJobQueue.claim(db_session, "worker-a").id == first.id
+        assert BackupJobQueue.claim(db_session, "worker-b") is None
+
+    def test_large_jobs_leave_room_for_small_accounts(self, db_session, monkeypatch):
+        monkeypatch.setattr(settings, "BACKUP_LARGE_ACCOUNT_POSTS", 3)
+        monkeypatch.setattr(settings, "BACKUP_MAX_RUNNING_LARGE_JOBS", 1)
+        big_a, big_b, small = (make_user(db_session, n, posts) for n, posts in [("a", 5), ("b", 4), ("c", 1)])
+        jobs = [BackupJobQueue.enqueue(db_session, u.id) for u in (big_a, big_b, small)]
+        assert [job.cost for job in jobs] == [5, 4, 1]
+
+        assert BackupJobQueue.claim(db_session, "w").user_id == big_a.id
+        assert BackupJobQueue.claim(db_session, "w").user_id == small.id  # 두 번째 대형 작업은 대기
+        assert BackupJobQueue.claim(db_session, "w") is None
+
+    def test_large_job_count_rechecked_under_lock(self, db_session, monkeypatch):
+        """잠금을 기다리는 동안 다른 워커가 대형 작업을 가져가면 상한을 넘겨 가져가지 않음"""
+        monkeypatch.setattr(settings, "BACKUP_LARGE_ACCOUNT_POSTS", 3)
+        monkeypatch.setattr(settings, "BACKUP_MAX_RUNNING_LARGE_JOBS", 1)
+        big_a, big_b, small = (make_user(db_session, n, posts) for n, posts in [("a", 5), ("b", 4), ("c", 1)])
+        for u in (big_a, big_b, small):
+            BackupJobQueue.enqueue(db_session, u.id)
+
+        raced = []
+
+        def other_worker_claims(db):
+            if not raced:  # 첫 잠금 대기 중에 다른 워커가 대형 작업을 가져감
+                raced.append(True)
+                other = TestingSessionLocal()
+                try:
+                    assert BackupJobQueue.claim(other, "other").user_id == big_a.id
+                finally:
+                    other.close()
+            return True
+
+        monkeypatch.setattr(BackupJobQueue, "_lock_large_claims", staticmethod(other_worker_claims))
+        assert BackupJobQueue.claim(db_session, "w").user_id == small.id
+
+    def test_stats_per_class(self, db_session, user):
+        other = make_user(db_session, "other")
+        BackupJobQueue.enqueue(db_session, user.id)
+        BackupJobQueue.enqueue(db_session, other.id, job_class=JobClass.SCHEDULED)
+        BackupJobQueue.claim(db_session, "worker-a")
+
+        stats = BackupJobQueue.stats(db_session)
+        assert (stats["manual"]["running"], stats["manual"]["queued"]) == (1, 0)
+        assert stats["manual"]["avg_wait_seconds"] is not None
+        assert (stats["scheduled"]["queued"], stats["scheduled"]["avg_wait_seconds"]) == (1, None)
+        assert stats["scheduled"]["oldest_wait_seconds"] >= 0
+
+
+class TestBackupWorker:
+    """워커 프로세스의 작업 실행"""
+
+    @pytest.mark.asyncio
+    async def test_run_job_completes_backup(self, db_session, user, velog_transport):
+        velog_transport(FakeVelog(3))
+        job = BackupJobQueue.enqueue(db_session, user.id)
+        worker = BackupWorker(session_factory=TestingSessionLocal, worker_id="worker-a")
+        claimed = BackupJobQueue.claim(db_session, worker.worker_id)
+
+        await worker.run_job(claimed.id, claimed.user_id, claimed.force)
+
+        db_session.expire_all()
+        job = db_session.get(BackupJob, job.id)
+        assert job.status == JobStatus.DONE
+        log = db_session.get(BackupLog, job.backup_log_id)
+        assert log.status == BackupStatus.SUCCESS
+        assert log.posts_new == 3
+
+
+class TestTriggerEndpoint:
+    """웹 프로세스는 작업을 큐에 넣기만 함"""
+
+    def test_trigger_enqueues_job(self, client, db_session, user):
+        from app.core.security import create_access_token
+
+        headers = {"Authorization": f"Bearer {create_access_token({'sub': str(user.id)})}"}
+        response = client.post("/api/v1/backup/trigger", json={}, headers=headers)
+        assert response.status_code == 200
+        job = db_session.query(BackupJob).one()
+        assert job.status == JobStatus.QUEUED
+        assert response.json()["job_id"] == job.id
+        assert db_session.query(BackupLog).count() == 0
+
+        response = client.post("/api/v1/backup/trigger", json={}, headers=headers)
+        assert response.status_code == 409
+
+    def test_trigger_promotes_queued_scheduled_job(self, client, db_session, user):
+        from app.core.security import create_access_token
+
+        scheduled = BackupJobQueue.enqueue(db_session, user.id, job_class=JobClass.SCHEDULED)
+        headers = {"Authorization": f"Bearer {create_access_token({'sub': str(user.id)})}"}
+        response = client.post("/api/v1/backup/trigger", json={"force": True}, headers=headers)
+
+        assert response.status_code == 200
+        assert response.json()["job_id"] == scheduled.id
+        db_session.refresh(scheduled)
+        assert (scheduled.job_class, scheduled.priority, scheduled.force) == (JobClass.MANUAL, 0, True)
+        assert db_session.query(BackupJob).count() == 1
@@ -0,0 +1,100 @@
+import asyncio
+
+import httpx
+import pytest
+from prometheus_client import REGISTRY
+
+from app.api.backup import perform_backup_task
+from app.core.config import settings
+from app.core.metrics import httpx_event_hooks, monitor_event_loop_lag, observe_backup_run, start_metrics_server
+from tests.test_backup import FakeVelog, user  # noqa: F401
+
+
+def sample(name, **labels):
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+class TestMetricsEndpoint:
+    """GET /metrics (Prometheus 텍스트 포맷)"""
+
+    def test_exposes_route_latency_and_queue(self, client):
+        before = sample("http_request_duration_seconds_count", method="GET", route="/health", status="200")
+        client.get("/health")
+
+        response = client.get("/metrics")
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain")
+        assert 'backup_queue_jobs{job_class="manual",state="queued"} 0.0' in response.text
+        after = sample("http_request_duration_seconds_count", method="GET", route="/health", status="200")
+        assert after == before + 1
+
+    def test_unmatched_paths_share_label(self, client):
+        before = sample("http_request_duration_seconds_count", method="GET", route="unmatched", status="404")
+        client.get("/no-such-path/1")
+        client.get("/no-such-path/2")
+        after = sample("http_request_duration_seconds_count", method="GET", route="unmatched", status="404")
+        assert after == before + 2
+
+    def test_token_required_when_configured(self, client, monkeypatch):
+        monkeypatch.setattr(settings, "METRICS_TOKEN", "scrape-secret")
+        assert client.get("/metrics").status_code == 401
+        response = client.get("/metrics", headers={"Authorization": "Bearer scrape-secret"})
+        assert response.status_code == 200
+
+    def test_production_requires_token(self, client, monkeypatch):
+        monkeypatch.setattr(settings, "ENVIRONMENT", "production")
+        assert client.get("/metrics").status_code == 404
+
+        monkeypatch.setattr(settings, "METRICS_TOKEN", "scrape-secret")
+        response = client.get("/metrics", headers={"Authorization": "Bearer scrape-secret"})
+        assert response.status_code == 200
+
+    def test_worker_metrics_server(self, monkeypatch):
+        """웹 서버가 없는 백업 워커용 /metrics (같은 토큰 규칙)"""
+        monkeypatch.setattr(settings, "METRICS_TOKEN", "scrape-secret")
+        server = start_metrics_server(0, host="127.0.0.1")
+        try:
+            url = f"http://127.0.0.1:{server.server_address[1]}/metrics"
+            assert httpx.get(url).status_code == 401
+            response = httpx.get(url, headers={"Authorization": "Bearer scrape-secret"})
+            assert response.status_code == 200
+            assert "event_loop_lag_seconds" in response.text
+        finally:
+            server.shutdown()
+            server.server_close()
+
+
+class TestCollectors:
+    """업스트림 요청, 백업 단계, 이벤트 루프 지연"""
+
+    @pytest.mark.asyncio
+    async def test_upstream_hooks_record_status(self):
+        transport = httpx.MockTransport(lambda request: httpx.Response(429))
+        before = sample("upstream_request_duration_seconds_count", upstream="github", status="429")
+        async with httpx.AsyncClient(transport=transport, event_hooks=httpx_event_hooks("github")) as client:
+            await client.get("https://api.github.com/user")
+        assert sample("upstream_request_duration_seconds_count", upstream="github", status="429") == before + 1
+
+    @pytest.mark.asyncio
+    async def test_backup_run_observes_phases(self, db_session, user, velog_transport):  # noqa: F811
+        velog_transport(FakeVelog(3))
+        before = sample("backup_phase_duration_seconds_count", phase="fetch")
+        runs = sample("backup_duration_seconds_count", status="success")
+
+        await perform_backup_task(user.id, False, db_session)
+
+        assert sample("backup_phase_duration_seconds_count", phase="fetch") == before + 1
+        assert sample("backup_duration_seconds_count", status="success") == runs + 1
+
+    def test_image_bytes_saved(self):
+        before = sample("image_optimize_saved_bytes_total", source="github_sync")
+        observe_backup_run("success", {"total_seconds": 1.0, "images": {"bytes_saved": 2048}})
+        assert sample("image_optimize_saved_bytes_total", source="github_sync") == before + 2048
+
+    @pytest.mark.asyncio
+    async def test_event_loop_lag(self):
+        before = sample("event_loop_lag_seconds_count")
+        task = asyncio.create_task(monitor_event_loop_lag(0.01))
+        await asyncio.sleep(0.05)
+        task.cancel()
+        assert sample("event_loop_lag_seconds_count") > before
@@ -0,0 +1,108 @@
+import asyncio
+import threading
+
+import pytest
+
+from app.models.post import PostCache
+from app.models.user import User
+from app.services.post_writer import PostCacheWriter, PostWriteStage
+
+
+def make_row(user_id, slug, content="본문", title="제목"):
+    return {
+        "user_id": user_id,
+        "slug": slug,
+        "title": title,
+        "content": content,
+        "content_hash": f"hash-{content}",
+        "tags": "[]",
+    }
+
+
+@pytest.fixture
+def user(db_session):
+    user = User(email="writer@example.com", velog_username="writer")
+    db_session.add(user)
+    db_session.commit()
+    return user
+
+
+class TestPostCacheWriter:
+    """PostCache 일괄 upsert"""
+
+    def test_flushes_in_batches(self, db_session, user):
+        writer = PostCacheWriter(db_session, batch_size=2)
+        for i in range(5):
+            writer.upsert(make_row(user.id, f"post-{i}"))
+
+        assert writer.batches == 2
+        assert db_session.query(PostCache).count() == 4
+        writer.flush()
+        assert db_session.query(PostCache).count() == 5
+        assert writer.written == 5
+
+    def test_upsert_updates_existing_row(self, db_session, user):
+        writer = PostCacheWriter(db_session)
+        writer.upsert(make_row(user.id, "post"))
+        writer.flush()
+        original = db_session.query(PostCache).one()
+        original_id = original.id
+
+        writer.upsert(make_row(user.id, "post", content="수정", title="새 제목"))
+        writer.flush()
+        db_session.expire_all()
+
+        post = db_session.query(PostCache).one()
+        assert post.id == original_id
+        assert (post.title, post.content) == ("새 제목", "수정")
+
+    def test_touch_updates_metadata_only(self, db_session, user):
+        writer = PostCacheWriter(db_session)
+        writer.upsert(make_row(user.id, "post"))
+        writer.flush()
+        post = db_session.query(PostCache).one()
+
+        writer.touch(post.id, "post", {"title": "메타데이터만"})
+        writer.flush()
+        db_session.expire_all()
+
+        post = db_session.query(PostCache).one()
+        assert (post.title, post.content) == ("메타데이터만", "본문")
+
+    def test_failed_batch_is_reported(self, db_session, user):
+        writer = PostCacheWriter(db_session)
+        writer.upsert({"user_id": user.id, "slug": "broken", "title": None, "content_hash": "x"})
+        writer.flush()
+
+        assert writer.failed == {"broken"}
+        assert db_session.query(PostCache).count() == 0
+
+
+class TestPostWriteStage:
+    """단일 writer 파이프라인 단계"""
+
+    @pytest.mark.asyncio
+    async def test_single_writer_thread_drains_queue(self, db_session, user):
+        threads = set()
+
+        def handle(writer, item):
+            threads.add(threading.get_ident())
+            writer.upsert(make_row(user.id, item))
+            return {"status": "new", "slug": item}
+
+        stage = PostWriteStage(db_session.get_bind(), handle, batch_size=3, queue_size=2)
+        write_task = asyncio.create_task(stage.run())
+
+        async def fetch(start):
+            for i in range(start, start + 5):
+                await stage.put(f"post-{i}")
+
+        await asyncio.gather(fetch(0), fetch(5))
+        await stage.finish()
+        results = await write_task
+        await stage.aclose()
+
+        assert sorted(r["slug"] for r in results) == sorted(f"post-{i}" for i in range(10))
+        assert threads and threading.get_ident() not in threads
+        assert len(threads) == 1
+        assert db_session.query(PostCache).count() == 10
@@ -0,0 +1,185 @@
+import json
+
+import pytest
+
+from app.api import backup as backup_module
+from app.api.backup import backup_status_event, perform_backup_task
+from app.core.config import settings
+from app.core.security import create_access_token
+from app.models.backup import BackupLog, BackupStatus
+from app.models.job import BackupJob, JobStatus
+from app.services.progress import BackupProgress, ProgressBus, progress_bus
+from tests.test_backup import FakeVelog, user  # noqa: F401
+
+
+@pytest.fixture(autouse=True)
+def clean_progress_bus():
+    """다른 테스트(백업 트리거 등)가 남긴 마지막 이벤트 제거"""
+    progress_bus._last.clear()
+    yield
+    progress_bus._last.clear()
+
+
+class FakeRedis:
+    """ProgressBus가 쓰는 명령만 흉내내는 Redis (키 저장 + 발행 기록)"""
+
+    def __init__(self):
+        self.keys = {}
+        self.published = []
+
+    def pipeline(self):
+        return FakePipeline(self)
+
+    async def get(self, key):
+        return self.keys.get(key)
+
+
+class FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.commands = []
+
+    def set(self, key, value, ex=None):
+        self.commands.append(lambda: self.redis.keys.__setitem__(key, value))
+
+    def delete(self, key):
+        self.commands.append(lambda: self.redis.keys.pop(key, None))
+
+    def publish(self, channel, payload):
+        self.commands.append(lambda: self.redis.published.append((channel, payload)))
+
+    async def execute(self):
+        for command in self.commands:
+            command()
+
+
+def drain(queue):
+    events = []
+    while not queue.empty():
+        events.append(queue.get_nowait())
+    return events
+
+
+class TestProgressBus:
+    """백업 진행 상황 pub/sub (로컬 전달)"""
+
+    @pytest.mark.asyncio
+    async def test_late_subscriber_gets_last_event(self):
+        bus = ProgressBus()
+        await bus.publish(1, {"status": "in_progress", "processed": 3})
+
+        async with bus.subscribe(1) as queue:
+            assert drain(queue) == [{"status": "in_progress", "processed": 3}]
+            await bus.publish(2, {"status": "in_progress"})  # 다른 사용자
+            await bus.publish(1, {"status": "success"})
+            assert drain(queue) == [{"status": "success"}]
+
+        assert await bus.last_event(1) is None  # 완료 후 보관하지 않음
+
+    @pytest.mark.asyncio
+    async def test_redis_does_not_keep_terminal_event(self):
+        """Redis 경로도 완료 이벤트는 보관하지 않음 - 다음 예약 실행에 연결한 구독자가 지난 결과를 받지 않도록"""
+        bus = ProgressBus()
+        bus._redis = FakeRedis()
+
+        await bus.publish(1, {"status": "in_progress", "processed": 3})
+        assert await bus.last_event(1) == {"status": "in_progress", "processed": 3}
+
+        await bus.publish(1, {"status": "success"})
+        assert await bus.last_event(1) is None
+        assert len(bus._redis.published) == 2
+
+    def test_eta_from_fetch_rate(self):
+        progress = BackupProgress(1, 1, bus=ProgressBus())
+        progress.add_total(10)
+        assert progress.eta_seconds() is None
+
+        progress.record("skipped", fetched=False)
+        progress._started -= 2.0
+        progress.record("new")
+        progress.record("updated")
+        event = progress.snapshot()
+        assert (event["processed"], event["new"], event["updated"]) == (3, 1, 1)
+        assert 7.0 <= event["eta_seconds"] <= 7.2  # 남은 7개 / 초당 1개
+
+
+class TestBackupProgressStream:
+    """백업 파이프라인 → 진행 이벤트 → SSE"""
+
+    @pytest.mark.asyncio
+    async def test_backup_publishes_final_counters(self, db_session, user, velog_transport):
+        velog_transport(FakeVelog(4))
+
+        async with progress_bus.subscribe(user.id) as queue:
+            await perform_backup_task(user.id, False, db_session)
+            events = drain(queue)
+
+        final = events[-1]
+        assert final["status"] == "success"
+        assert (final["total"], final["processed"], final["new"]) == (4, 4, 4)
+        assert final["phase"] == "done"
+        assert all(e["status"] == "in_progress" for e in events[:-1])
+
+    def test_stream_without_active_backup_is_idle(self, client, db_session, user):
+        headers = {"Authorization": f"Bearer {create_access_token({'sub': str(user.id)})}"}
+
+        response = client.get("/api/v1/backup/progress", headers=headers)
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        assert response.text == 'event: progress\ndata: {"status": "idle"}\n\n'
+
+    @pytest.mark.asyncio
+    async def test_stream_sends_current_progress(self, client, db_session, user, monkeypatch):
+        monkeypatch.setattr(settings, "PROGRESS_STREAM_MAX_SECONDS", 0.2)
+        monkeypatch.setattr(settings, "PROGRESS_STREAM_KEEPALIVE_SECONDS", 0.1)
+        db_session.add(BackupJob(user_id=user.id))
+        db_session.commit()
+        await progress_bus.publish(user.id, {"status": "in_progress", "phase": "listing", "processed": 2})
+        headers = {"Authorization": f"Bearer {create_access_token({'sub': str(user.id)})}"}
+
+        response = client.get("/api/v1/backup/progress", headers=headers)
+        first = response.text.split("\n\n")[0]
+        assert json.loads(first.split("data: ", 1)[1])["phase"] == "listing"
+        assert ": keepalive" in response.text
+
+    def test_stream_polls_db_without_shared_bus(self, client, db_session, user, monkeypatch):
+        """별도 워커 + Redis 없음: 버스로 이벤트가 오지 않아도 DB 상태로 완료를 알림"""
+        monkeypatch.setattr(settings, "PROGRESS_DB_POLL_SECONDS", 0.05)
+        monkeypatch.setattr(settings, "PROGRESS_STREAM_KEEPALIVE_SECONDS", 0.05)
+        monkeypatch.setattr(settings, "PROGRESS_STREAM_MAX_SECONDS", 5)
+        db_session.add(BackupJob(user_id=user.id))
+        db_session.commit()
+        states = iter([
+            {"status": "queued", "phase": "queued"},
+            {"status": "queued", "phase": "queued"},
+            {"status": "in_progress", "total": 10},
+            {"status": "success", "phase": "done", "total": 10},
+        ])
+        monkeypatch.setattr(backup_module, "backup_status_event", lambda db, user_id: next(states))
+        headers = {"Authorization": f"Bearer {create_access_token({'sub': str(user.id)})}"}
+
+        response = client.get("/api/v1/backup/progress", headers=headers)
+
+        events = [json.loads(line.split("data: ", 1)[1]) for line in response.text.split("\n\n") if "data: " in line]
+        assert [e["status"] for e in events] == ["queued", "in_progress", "success"]
+
+    def test_status_event_follows_latest_job(self, db_session, user):
+        assert backup_status_event(db_session, user.id) == {"status": "idle"}
+
+        job = BackupJob(user_id=user.id)
+        db_session.add(job)
+        db_session.commit()
+        assert backup_status_event(db_session, user.id)["status"] == "queued"
+
+        log = BackupLog(user_id=user.id, status=BackupStatus.IN_PROGRESS, posts_total=7)
+        db_session.add(log)
+        db_session.flush()
+        job.status, job.backup_log_id = JobStatus.RUNNING, log.id
+        db_session.commit()
+        assert backup_status_event(db_session, user.id) == {"log_id": log.id, "status": "in_progress", "total": 7}
+
+        log.status, log.posts_new = BackupStatus.SUCCESS, 7
+        job.status = JobStatus.DONE
+        db_session.commit()
+        event = backup_status_event(db_session, user.id)
+        assert (event["status"], event["new"]) == ("success", 7)
@@ -0,0 +1,114 @@
+import pytest
+from prometheus_client import REGISTRY
+
+from app.core.config import settings
+from app.services.rate_limit import LocalTokenBucketStore, VelogRateLimiter
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestLocalTokenBucketStore:
+    """토큰 버킷 상태 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_burst_then_wait(self):
+        clock = FakeClock()
+        store = LocalTokenBucketStore(clock=clock)
+        bucket = [("global", 2.0, 2.0)]
+
+        assert await store.take(bucket) == 0
+        assert await store.take(bucket) == 0
+        assert await store.take(bucket) == pytest.approx(0.5)
+
+        clock.now += 0.5
+        assert await store.take(bucket) == 0
+
+    @pytest.mark.asyncio
+    async def test_take_is_all_or_nothing(self):
+        """한 버킷이라도 부족하면 다른 버킷 토큰도 차감하지 않음"""
+        clock = FakeClock()
+        store = LocalTokenBucketStore(clock=clock)
+        await store.take([("user:a", 1.0, 1.0)])
+
+        wait = await store.take([("global", 10.0, 10.0), ("user:a", 1.0, 1.0)])
+        assert wait > 0
+        assert store._buckets["global"][0] == 10.0
+
+    @pytest.mark.asyncio
+    async def test_active_users_expire(self):
+        clock = FakeClock()
+        store = LocalTokenBucketStore(clock=clock)
+        assert await store.active_users("a") == 1
+        assert await store.active_users("b") == 2
+        clock.now += 60
+        assert await store.active_users("b") == 1
+
+
+class TestVelogRateLimiter:
+    """전역 요청률 제한 + 사용자 간 공정 분배 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_fair_share_between_users(self):
+        clock = FakeClock()
+        store = LocalTokenBucketStore(clock=clock)
+        limiter = VelogRateLimiter(rate=10.0, burst=10.0, store=store)
+        await store.active_users("a")
+        await store.active_users("b")
+
+        granted = {"a": 0, "b": 0}
+        for _ in range(20):
+            for user in ("a", "b"):
+                active = await store.active_users(user)
+                wait = await store.take([
+                    ("global", limiter.rate, limiter.burst),
+                    (f"user:{user}", limiter.rate / active, limiter.burst / active),
+                ])
+                if wait == 0:
+                    granted[user] += 1
+
+        # 두 사용자가 전역 예산(10)을 절반씩 사용
+        assert granted == {"a": 5, "b": 5}
+
+    @pytest.mark.asyncio
+    async def test_acquire_returns_without_wait_under_budget(self):
+        limiter = VelogRateLimiter(rate=100.0, burst=5.0, store=LocalTokenBucketStore())
+        assert await limiter.acquire("a") == 0
+
+    @pytest.mark.asyncio
+    async def test_redis_failure_falls_back_temporarily(self, monkeypatch):
+        """Redis 오류 시 잠시만 로컬 예산을 쓰고 재시도 시각이 지나면 다시 공유 상태 사용"""
+        monkeypatch.setattr(settings, "VELOG_RATE_LIMIT_REDIS_RETRY_SECONDS", 30.0)
+
+        class FlakyShared:
+            def __init__(self):
+                self.calls = 0
+                self.local = LocalTokenBucketStore()
+
+            async def active_users(self, user_key):
+                self.calls += 1
+                if self.calls == 1:
+                    raise ConnectionError("redis down")
+                return await self.local.active_users(user_key)
+
+            async def take(self, buckets):
+                return await self.local.take(buckets)
+
+        shared = FlakyShared()
+        limiter = VelogRateLimiter(rate=100.0, burst=5.0, store=shared)
+
+        assert await limiter.acquire("a") == 0
+        assert await limiter.acquire("a") == 0
+        assert shared.calls == 1  # 재시도 시각 전에는 로컬 상태
+        assert REGISTRY.get_sample_value("velog_rate_limiter_local_fallback") == 1
+
+        limiter._fallback_until = 0.0  # 재시도 시각 경과
+        assert await limiter.acquire("a") == 0
+        assert shared.calls == 2
+        assert limiter._fallback_until is None
+        assert REGISTRY.get_sample_value("velog_rate_limiter_local_fallback") == 0
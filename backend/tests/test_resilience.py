@@ -0,0 +1,96 @@
+import asyncio
+from email.utils import format_datetime
+from datetime import datetime, timedelta, timezone
+
+import httpx
+import pytest
+
+from app.services.resilience import CircuitBreaker, CircuitOpenError, backoff_delay, parse_retry_after
+from app.services.velog import VelogService
+
+
+class TestRetryHelpers:
+    """재시도 보조 함수 테스트"""
+
+    def test_parse_retry_after_seconds(self):
+        assert parse_retry_after("3") == 3.0
+        assert parse_retry_after(None) is None
+        assert parse_retry_after("invalid") is None
+
+    def test_parse_retry_after_http_date(self):
+        retry_at = datetime.now(timezone.utc) + timedelta(seconds=30)
+        delay = parse_retry_after(format_datetime(retry_at, usegmt=True))
+        assert 25 <= delay <= 30
+
+    def test_backoff_delay_bounded(self):
+        for attempt in range(10):
+            assert 0 <= backoff_delay(attempt, base=0.5, cap=4.0) <= 4.0
+
+
+class TestCircuitBreaker:
+    """서킷 브레이커 상태 전이 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_opens_after_threshold(self):
+        breaker = CircuitBreaker("test", failure_threshold=2, reset_timeout=60, max_wait=0.1)
+        breaker.record_failure()
+        assert breaker.state == "closed"
+        breaker.record_failure()
+        assert breaker.state == "open"
+
+        with pytest.raises(CircuitOpenError):
+            await breaker.wait_until_available()
+
+    @pytest.mark.asyncio
+    async def test_half_open_single_probe(self):
+        breaker = CircuitBreaker("test", failure_threshold=1, reset_timeout=0.05, max_wait=1)
+        breaker.record_failure()
+
+        await breaker.wait_until_available()
+        assert breaker.state == "half_open"
+
+        # probe 진행 중에는 다른 호출자 대기
+        waiter = asyncio.create_task(breaker.wait_until_available())
+        await asyncio.sleep(0.01)
+        assert not waiter.done()
+
+        breaker.record_success()
+        await asyncio.wait_for(waiter, timeout=2)
+        assert breaker.state == "closed"
+
+    @pytest.mark.asyncio
+    async def test_failed_probe_reopens(self):
+        breaker = CircuitBreaker("test", failure_threshold=3, reset_timeout=0.01, max_wait=1)
+        for _ in range(3):
+            breaker.record_failure()
+        await asyncio.sleep(0.02)
+        await breaker.wait_until_available()
+        breaker.record_failure()
+        assert breaker.state == "open"
+
+
+class TestVelogRetries:
+    """Velog 요청 재시도 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_transient_errors_are_retried(self, velog_transport):
+        calls = []
+
+        def handler(payload):
+            calls.append(payload)
+            if len(calls) < 3:
+                return httpx.Response(503, headers={"Retry-After": "0"})
+            return httpx.Response(200, json={"data": {"post": None}})
+
+        velog_transport(handler)
+        velog = VelogService()
+        assert await velog.get_post_content("user", "slug") is None
+        assert len(calls) == 3
+        assert velog.retries == 2
+
+    @pytest.mark.asyncio
+    async def test_client_errors_not_retried(self, velog_transport):
+        requests = velog_transport(lambda payload: httpx.Response(400))
+        with pytest.raises(httpx.HTTPStatusError):
+            await VelogService().get_post_content("user", "slug")
+        assert len(requests) == 1
@@ -0,0 +1,81 @@
+from datetime import datetime, timezone, timedelta
+
+import pytest
+
+from app.core.security import create_access_token
+from app.models.job import BackupJob
+from app.models.user import User
+from app.services.scheduler import BackupScheduler
+
+
+def as_utc(value):
+    return value.replace(tzinfo=timezone.utc) if value.tzinfo is None else value
+
+
+@pytest.fixture
+def make_user(db_session):
+    def make(name, **kwargs):
+        user = User(email=f"{name}@example.com", velog_username=name, **kwargs)
+        db_session.add(user)
+        db_session.commit()
+        return user
+    return make
+
+
+class TestBackupScheduler:
+    """자동 백업 예약"""
+
+    def test_first_tick_spreads_start_times(self, db_session, make_user):
+        user = make_user("fresh", auto_backup_interval_hours=24)
+        now = datetime.now(timezone.utc)
+
+        assert BackupScheduler.schedule_due(db_session) == []
+        db_session.refresh(user)
+        assert now <= as_utc(user.next_auto_backup_at) <= now + timedelta(hours=24, seconds=1)
+        assert db_session.query(BackupJob).count() == 0
+
+    def test_due_user_is_enqueued_once(self, db_session, make_user):
+        past = datetime.now(timezone.utc) - timedelta(minutes=1)
+        user = make_user("due", auto_backup_interval_hours=10, next_auto_backup_at=past)
+
+        (scheduled,) = BackupScheduler.schedule_due(db_session)
+        assert scheduled[0] == user.id
+        assert BackupScheduler.schedule_due(db_session) == []
+        db_session.refresh(user)
+        delta = as_utc(user.next_auto_backup_at) - datetime.now(timezone.utc)
+        assert timedelta(hours=8.9) < delta < timedelta(hours=11.1)
+        assert db_session.query(BackupJob).filter(BackupJob.user_id == user.id).count() == 1
+
+    def test_skips_disabled_and_busy_users(self, db_session, make_user):
+        past = datetime.now(timezone.utc) - timedelta(minutes=1)
+        make_user("off", auto_backup_enabled=False, next_auto_backup_at=past)
+        busy = make_user("busy", next_auto_backup_at=past)
+        db_session.add(BackupJob(user_id=busy.id))
+        db_session.commit()
+
+        assert BackupScheduler.schedule_due(db_session) == []
+        assert db_session.query(BackupJob).count() == 1
+
+    def test_settings_update_reschedules(self, client, db_session, make_user):
+        user = make_user("owner")
+        headers = {"Authorization": f"Bearer {create_access_token({'sub': str(user.id)})}"}
+
+        response = client.put("/api/v1/user/settings", json={"auto_backup_interval_hours": 12}, headers=headers)
+        assert response.status_code == 200
+        assert response.json()["auto_backup_interval_hours"] == 12
+        assert response.json()["next_auto_backup_at"] is not None
+
+        response = client.put("/api/v1/user/settings", json={"auto_backup_enabled": False}, headers=headers)
+        assert response.json()["next_auto_backup_at"] is None
+
+        response = client.put("/api/v1/user/settings", json={"auto_backup_interval_hours": 1}, headers=headers)
+        assert response.status_code == 422
+
+    def test_new_user_enabled_in_api_and_scheduler(self, client, db_session, make_user):
+        """자동 백업 기본값(켜짐)을 API와 스케줄러가 같게 판단 (NULL 없음)"""
+        past = datetime.now(timezone.utc) - timedelta(minutes=1)
+        user = make_user("default", next_auto_backup_at=past)
+        headers = {"Authorization": f"Bearer {create_access_token({'sub': str(user.id)})}"}
+
+        assert client.get("/api/v1/user/settings", headers=headers).json()["auto_backup_enabled"] is True
+        assert len(BackupScheduler.schedule_due(db_session)) == 1
@@ -0,0 +1,178 @@
+import httpx
+import pytest
+
+from app.services.resilience import velog_breaker
+from app.services.velog import VelogService, PostBatchSizer
+
+
+def make_post(slug: str, body: str = "본문") -> dict:
+    return {
+        "id": f"id-{slug}",
+        "title": slug,
+        "released_at": "2024-01-01T00:00:00.000Z",
+        "updated_at": "2024-01-01T00:00:00.000Z",
+        "body": body,
+        "short_description": "",
+        "thumbnail": None,
+        "tags": [],
+        "is_private": False,
+        "url_slug": slug,
+    }
+
+
+class TestPostBatchSizer:
+    """배치 크기 자동 조절 테스트"""
+
+    def test_shrinks_when_payload_too_large(self):
+        sizer = PostBatchSizer(size=20, max_bytes=1000)
+        sizer.observe(batch_len=20, payload_bytes=4000)  # 포스트당 200바이트
+        assert sizer.size == 5
+
+    def test_recovers_up_to_max(self):
+        sizer = PostBatchSizer(size=20, max_bytes=1000)
+        sizer.observe(batch_len=20, payload_bytes=4000)
+        sizer.observe(batch_len=5, payload_bytes=50)
+        assert sizer.size == 20
+
+    def test_shrink_halves(self):
+        sizer = PostBatchSizer(size=8, max_bytes=1000)
+        sizer.shrink()
+        assert sizer.size == 4
+
+
+class TestBatchFetch:
+    """GraphQL 별칭 일괄 조회 테스트"""
+
+    def test_build_batch_query(self):
+        query = VelogService.build_batch_query(3)
+        assert "$s2: String!" in query
+        assert "p0: post(username: $username, url_slug: $s0)" in query
+        assert "p2: post(username: $username, url_slug: $s2)" in query
+
+    @pytest.mark.asyncio
+    async def test_batch_single_request(self, velog_transport):
+        """여러 포스트를 한 요청으로 조회"""
+        def handler(payload):
+            variables = payload["variables"]
+            data = {
+                f"p{i}": make_post(variables[f"s{i}"])
+                for i in range(len(variables) - 1)
+            }
+            return httpx.Response(200, json={"data": data})
+
+        requests = velog_transport(handler)
+        posts = await VelogService().get_posts_content("user", ["a", "b", "c"])
+
+        assert len(requests) == 1
+        assert set(posts) == {"a", "b", "c"}
+        assert posts["b"]["url_slug"] == "b"
+
+    @pytest.mark.asyncio
+    async def test_batch_failure_falls_back_to_single(self, velog_transport):
+        """배치 실패 시 단건 조회로 폴백"""
+        def handler(payload):
+            variables = payload["variables"]
+            if "s0" in variables:
+                return httpx.Response(413)
+            return httpx.Response(200, json={"data": {"post": make_post(variables["url_slug"])}})
+
+        requests = velog_transport(handler)
+        sizer = PostBatchSizer(size=4)
+        posts = await VelogService().get_posts_content("user", ["a", "b"], sizer)
+
+        assert len(requests) == 3
+        assert posts["a"]["url_slug"] == "a"
+        assert posts["b"]["url_slug"] == "b"
+        assert sizer.size == 2
+
+    @pytest.mark.asyncio
+    async def test_open_circuit_fails_batch_without_single_fetches(self, velog_transport, monkeypatch):
+        """서킷이 열려 있으면 단건 조회로 폴백하지 않고 배치 전체를 실패 처리"""
+        requests = velog_transport(lambda payload: pytest.fail("request sent while circuit open"))
+        monkeypatch.setattr(velog_breaker, "max_wait", 0.0)
+        for _ in range(velog_breaker.failure_threshold):
+            velog_breaker.record_failure()
+
+        velog = VelogService()
+        monkeypatch.setattr(velog, "get_post_content", lambda *args: pytest.fail("fell back to single fetch"))
+
+        posts = await velog.get_posts_content("user", ["a", "b", "c"], PostBatchSizer(size=4))
+
+        assert posts == {"a": None, "b": None, "c": None}
+        assert requests == []
+
+    @pytest.mark.asyncio
+    async def test_partial_errors_retried_individually(self, velog_transport):
+        """부분 오류가 난 별칭만 단건 재조회"""
+        def handler(payload):
+            variables = payload["variables"]
+            if "s0" in variables:
+                return httpx.Response(200, json={
+                    "data": {"p0": make_post("a"), "p1": None},
+                    "errors": [{"message": "timeout", "path": ["p1"]}],
+                })
+            return httpx.Response(200, json={"data": {"post": make_post(variables["url_slug"])}})
+
+        requests = velog_transport(handler)
+        posts = await VelogService().get_posts_content("user", ["a", "b"])
+
+        assert len(requests) == 2
+        assert requests[1]["variables"]["url_slug"] == "b"
+        assert posts["b"]["url_slug"] == "b"
+
+
+class TestIncrementalListing:
+    """워터마크 기반 증분 목록 조회 테스트"""
+
+    @staticmethod
+    def listed(slug: str, released_at: str, updated_at: str = None) -> dict:
+        return {
+            "id": f"id-{slug}",
+            "title": slug,
+            "short_description": "",
+            "thumbnail": None,
+            "url_slug": slug,
+            "released_at": released_at,
+            "updated_at": updated_at or released_at,
+            "tags": [],
+            "is_private": False,
+        }
+
+    def pages_handler(self, pages):
+        def handler(payload):
+            cursor = payload["variables"].get("cursor")
+            index = 0 if cursor is None else int(cursor.split("-")[1]) + 1
+            posts = pages[index] if index < len(pages) else []
+            for i, post in enumerate(posts):
+                post["id"] = f"page-{index}-{i}"
+            return httpx.Response(200, json={"data": {"posts": posts}})
+        return handler
+
+    @pytest.mark.asyncio
+    async def test_full_listing_walks_all_pages(self, velog_transport):
+        pages = [
+            [self.listed("new", "2024-03-01T00:00:00Z")],
+            [self.listed("old", "2024-01-01T00:00:00Z")],
+        ]
+        requests = velog_transport(self.pages_handler(pages))
+        posts = await VelogService().get_user_posts("user")
+
+        assert [p["url_slug"] for p in posts] == ["new", "old"]
+        assert len(requests) == 3
+
+    @pytest.mark.asyncio
+    async def test_incremental_stops_at_watermark(self, velog_transport):
+        pages = [
+            [
+                self.listed("new", "2024-03-01T00:00:00Z"),
+                self.listed("edited", "2024-01-15T00:00:00Z", "2024-02-20T00:00:00Z"),
+                self.listed("old", "2024-01-01T00:00:00Z"),
+            ],
+            [self.listed("older", "2023-12-01T00:00:00Z")],
+        ]
+        requests = velog_transport(self.pages_handler(pages))
+        since = VelogService.parse_datetime("2024-02-01T00:00:00Z")
+        posts = await VelogService().get_user_posts("user", since=since)
+
+        assert [p["url_slug"] for p in posts] == ["new", "edited"]
+        assert len(requests) == 1
@@ -5,12 +5,26 @@ import { useRouter } from 'next/navigation'
 import Link from 'next/link'
 import { Database, FileText, Calendar, Play, FolderOpen, Download, Loader2, Settings, X, Github } from 'lucide-react'
 import toast from 'react-hot-toast'
-import { backupAPI, settingsAPI } from '@/lib/api'
+import { backupAPI, settingsAPI, BackupProgressEvent } from '@/lib/api'
 import { format } from 'date-fns'
 import { ko } from 'date-fns/locale'
 import Header from '@/components/Header'
 import { useUser } from '@/contexts/UserContext'
 
+const PHASE_LABELS: Record<string, string> = {
+  queued: '대기 중',
+  starting: '준비 중',
+  listing: '포스트 목록 조회 중',
+  saving: '포스트 저장 중',
+  github_sync: 'GitHub 동기화 중',
+  done: '마무리 중',
+}
+
+function formatEta(seconds: number) {
+  if (seconds < 60) return `${Math.ceil(seconds)}초`
+  return `${Math.ceil(seconds / 60)}분`
+}
+
 export default function DashboardPage() {
   const router = useRouter()
   const { user, isLoading: userLoading, refreshUser } = useUser()
@@ -20,6 +34,9 @@ export default function DashboardPage() {
   const [showSetupModal, setShowSetupModal] = useState(false)
   const [setupRepo, setSetupRepo] = useState('')
   const [setupSaving, setSetupSaving] = useState(false)
+  const [progress, setProgress] = useState<BackupProgressEvent | null>(null)
+  const [watchProgress, setWatchProgress] = useState(false)
+  const [streamRound, setStreamRound] = useState(0)
 
   const loadStats = useCallback(async () => {
     try {
@@ -75,26 +92,38 @@ export default function DashboardPage() {
     setShowSetupModal(false)
   }
 
-  useEffect(() => {
-    const hasInProgressBackup = stats?.recent_logs?.some(
-      (log: any) => log.status === 'in_progress'
-    )
+  const hasInProgressBackup = stats?.recent_logs?.some(
+    (log: any) => log.status === 'in_progress'
+  )
 
-    if (!hasInProgressBackup) return
+  // 대기/진행 중인 백업은 SSE로 진행 상황 수신 (폴링 없음), 스트림이 끝나면 통계 1회 갱신
+  useEffect(() => {
+    if (!hasInProgressBackup && !watchProgress) return
 
-    const interval = setInterval(() => {
-      loadStats()
-    }, 3000)
+    const controller = new AbortController()
+    backupAPI.streamProgress((event) => {
+      if (event.status === 'queued' || event.status === 'in_progress') {
+        setProgress(event)
+      }
+    }, controller.signal)
+      .catch(() => new Promise((resolve) => setTimeout(resolve, 5000)))
+      .finally(async () => {
+        if (controller.signal.aborted) return
+        setProgress(null)
+        setWatchProgress(false)
+        await loadStats()
+        setStreamRound((round) => round + 1)
+      })
 
-    return () => clearInterval(interval)
-  }, [stats, loadStats])
+    return () => controller.abort()
+  }, [hasInProgressBackup, watchProgress, streamRound, loadStats])
 
   const handleBackup = async () => {
     setIsBackingUp(true)
     try {
       await backupAPI.trigger(false)
       toast.success('백업이 시작되었습니다!')
-      setTimeout(loadStats, 2000)
+      setWatchProgress(true)
     } catch (error: any) {
       toast.error(error.response?.data?.detail || '백업 시작에 실패했습니다')
     } finally {
@@ -287,6 +316,32 @@ export default function DashboardPage() {
               <span>{isBackingUp ? '백업 중...' : '지금 백업하기'}</span>
             </button>
           </div>
+
+          {progress && (
+            <div className="mt-4">
+              <div className="flex justify-between text-sm text-gray-600 dark:text-gray-400 mb-1">
+                <span className="flex items-center space-x-1">
+                  <Loader2 className="animate-spin" size={14} />
+                  <span>{PHASE_LABELS[progress.phase || ''] || '진행 중'}</span>
+                </span>
+                <span>
+                  {progress.processed ?? 0} / {progress.total ?? 0}
+                  {progress.eta_seconds != null && progress.eta_seconds > 0 && ` · 약 ${formatEta(progress.eta_seconds)} 남음`}
+                </span>
+              </div>
+              <div className="h-2 bg-gray-200 dark:bg-gray-600 rounded-full overflow-hidden">
+                <div
+                  className="h-full bg-primary-600 transition-all"
+                  style={{ width: `${progress.total ? Math.min(100, ((progress.processed ?? 0) / progress.total) * 100) : 0}%` }}
+                />
+              </div>
+              <p className="text-xs text-gray-500 dark:text-gray-400 mt-1">
+                새 포스트 {progress.new ?? 0} · 업데이트 {progress.updated ?? 0} · 변경 없음 {progress.skipped ?? 0}
+                {!!progress.failed && ` · 실패 ${progress.failed}`}
+                {!!progress.resumed && ` · 이어받음 ${progress.resumed}`}
+              </p>
+            </div>
+          )}
         </div>
 
         {/* View Posts */}
@@ -333,9 +388,11 @@ export default function DashboardPage() {
                           ? 'bg-gray-200 text-gray-800 dark:bg-gray-600 dark:text-gray-200'
                           : log.status === 'in_progress'
                           ? 'bg-blue-100 text-blue-800 dark:bg-blue-900/50 dark:text-blue-300'
+                          : log.status === 'resumed'
+                          ? 'bg-yellow-100 text-yellow-800 dark:bg-yellow-900/50 dark:text-yellow-300'
                           : 'bg-red-100 text-red-800 dark:bg-red-900/50 dark:text-red-300'
                       }`}>
-                        {log.status === 'in_progress' ? '진행 중' : log.status}
+                        {log.status === 'in_progress' ? '진행 중' : log.status === 'resumed' ? '이어서 진행됨' : log.status}
                       </span>
                       <p className="text-sm mt-1">{log.message || '백업 진행 중...'}</p>
                     </div>
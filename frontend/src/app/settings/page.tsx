@@ -2,13 +2,21 @@
 
 import { useEffect, useState, useCallback } from 'react'
 import { useRouter } from 'next/navigation'
-import { Edit, X, Github, Mail, Bell, BellOff, AlertTriangle, Sun, Moon, CheckCircle, ExternalLink, Unlink } from 'lucide-react'
+import { Edit, X, Github, Mail, Bell, BellOff, AlertTriangle, Sun, Moon, CheckCircle, ExternalLink, Unlink, Clock } from 'lucide-react'
 import toast from 'react-hot-toast'
 import { authAPI, settingsAPI, githubAppAPI } from '@/lib/api'
 import Header from '@/components/Header'
 import { useUser } from '@/contexts/UserContext'
 import { useTheme } from '@/contexts/ThemeContext'
 
+const AUTO_BACKUP_INTERVALS = [
+  { hours: 6, label: '6시간마다' },
+  { hours: 12, label: '12시간마다' },
+  { hours: 24, label: '매일' },
+  { hours: 72, label: '3일마다' },
+  { hours: 168, label: '매주' },
+]
+
 interface GitHubRepo {
   name: string
   full_name: string
@@ -30,6 +38,7 @@ export default function SettingsPage() {
   const [githubRepo, setGithubRepo] = useState('')
   const [githubSyncEnabled, setGithubSyncEnabled] = useState(false)
   const [githubInstalled, setGithubInstalled] = useState(false)
+  const [imageOptimizationEnabled, setImageOptimizationEnabled] = useState(false)
   const [savedGithubRepo, setSavedGithubRepo] = useState('')
   const [repoWarning, setRepoWarning] = useState<{ exists: boolean; description?: string } | null>(null)
   const [savingGithub, setSavingGithub] = useState(false)
@@ -42,6 +51,11 @@ export default function SettingsPage() {
   // Email Notification
   const [emailNotificationEnabled, setEmailNotificationEnabled] = useState(false)
 
+  // Auto Backup
+  const [autoBackupEnabled, setAutoBackupEnabled] = useState(true)
+  const [autoBackupInterval, setAutoBackupInterval] = useState(24)
+  const [nextAutoBackupAt, setNextAutoBackupAt] = useState<string | null>(null)
+
   const loadSettings = useCallback(async () => {
     try {
       const settingsRes = await settingsAPI.get()
@@ -50,7 +64,11 @@ export default function SettingsPage() {
       setSavedGithubRepo(repo)
       setGithubSyncEnabled(settingsRes.data.github_sync_enabled || false)
       setGithubInstalled(settingsRes.data.github_installed || false)
+      setImageOptimizationEnabled(settingsRes.data.image_optimization_enabled || false)
       setEmailNotificationEnabled(settingsRes.data.email_notification_enabled || false)
+      setAutoBackupEnabled(settingsRes.data.auto_backup_enabled)
+      setAutoBackupInterval(settingsRes.data.auto_backup_interval_hours || 24)
+      setNextAutoBackupAt(settingsRes.data.next_auto_backup_at || null)
     } catch (error) {
       toast.error('설정을 불러오는데 실패했습니다')
     } finally {
@@ -189,6 +207,17 @@ export default function SettingsPage() {
     await saveGithubSettings()
   }
 
+  const handleToggleImageOptimization = async () => {
+    const newValue = !imageOptimizationEnabled
+    try {
+      await settingsAPI.update({ image_optimization_enabled: newValue })
+      setImageOptimizationEnabled(newValue)
+      toast.success(newValue ? '이미지 최적화가 활성화되었습니다' : '이미지 최적화가 비활성화되었습니다')
+    } catch (error: any) {
+      toast.error('설정 변경에 실패했습니다')
+    }
+  }
+
   const handleToggleEmailNotification = async () => {
     const newValue = !emailNotificationEnabled
     try {
@@ -200,6 +229,18 @@ export default function SettingsPage() {
     }
   }
 
+  const updateAutoBackup = async (data: { auto_backup_enabled?: boolean; auto_backup_interval_hours?: number }) => {
+    try {
+      const res = await settingsAPI.update(data)
+      setAutoBackupEnabled(res.data.auto_backup_enabled)
+      setAutoBackupInterval(res.data.auto_backup_interval_hours)
+      setNextAutoBackupAt(res.data.next_auto_backup_at || null)
+      toast.success('자동 백업 설정이 저장되었습니다')
+    } catch (error: any) {
+      toast.error('설정 변경에 실패했습니다')
+    }
+  }
+
   return (
     <div className="min-h-screen bg-gray-50 dark:bg-gray-900">
       <Header user={user} />
@@ -447,6 +488,30 @@ export default function SettingsPage() {
               </button>
             </div>
 
+            <div className="flex items-center justify-between p-3 bg-gray-50 dark:bg-gray-700 rounded-lg">
+              <div>
+                <p className="font-medium">이미지 최적화</p>
+                <p className="text-sm text-gray-600 dark:text-gray-400">
+                  GitHub 동기화와 ZIP 다운로드 시 큰 이미지를 줄이고 PNG/GIF를 WebP로 변환
+                </p>
+              </div>
+              <button
+                role="switch"
+                aria-checked={imageOptimizationEnabled}
+                aria-label="이미지 최적화"
+                onClick={handleToggleImageOptimization}
+                className={`relative inline-flex h-6 w-11 items-center rounded-full transition-colors ${
+                  imageOptimizationEnabled ? 'bg-primary-600' : 'bg-gray-300 dark:bg-gray-500'
+                }`}
+              >
+                <span
+                  className={`inline-block h-4 w-4 transform rounded-full bg-white transition-transform ${
+                    imageOptimizationEnabled ? 'translate-x-6' : 'translate-x-1'
+                  }`}
+                />
+              </button>
+            </div>
+
             <button onClick={handleSaveGithubSync} className="btn btn-primary" disabled={savingGithub}>
               {savingGithub ? '확인 중...' : '설정 저장'}
             </button>
@@ -495,6 +560,56 @@ export default function SettingsPage() {
           </div>
         </div>
 
+        {/* 자동 백업 */}
+        <div className="card mb-6">
+          <div className="flex items-center space-x-2 mb-4">
+            <Clock size={20} />
+            <h2 className="text-xl font-bold">자동 백업</h2>
+          </div>
+          <p className="text-sm text-gray-600 dark:text-gray-400 mb-4">
+            설정한 주기마다 변경된 포스트를 자동으로 백업합니다.
+          </p>
+
+          <div className="flex items-center justify-between p-3 bg-gray-50 dark:bg-gray-700 rounded-lg mb-4">
+            <div>
+              <p className="font-medium">주기적 백업</p>
+              <p className="text-sm text-gray-600 dark:text-gray-400">
+                {autoBackupEnabled && nextAutoBackupAt
+                  ? `다음 백업 예정: ${new Date(nextAutoBackupAt).toLocaleString('ko-KR')}`
+                  : autoBackupEnabled ? '자동 백업 활성화됨' : '자동 백업 비활성화됨'}
+              </p>
+            </div>
+            <button
+              role="switch"
+              aria-checked={autoBackupEnabled}
+              aria-label="주기적 백업"
+              onClick={() => updateAutoBackup({ auto_backup_enabled: !autoBackupEnabled })}
+              className={`relative inline-flex h-6 w-11 items-center rounded-full transition-colors ${
+                autoBackupEnabled ? 'bg-primary-600' : 'bg-gray-300 dark:bg-gray-500'
+              }`}
+            >
+              <span
+                className={`inline-block h-4 w-4 transform rounded-full bg-white transition-transform ${
+                  autoBackupEnabled ? 'translate-x-6' : 'translate-x-1'
+                }`}
+              />
+            </button>
+          </div>
+
+          <label className="block text-sm font-medium mb-2" htmlFor="auto-backup-interval">백업 주기</label>
+          <select
+            id="auto-backup-interval"
+            value={autoBackupInterval}
+            disabled={!autoBackupEnabled}
+            onChange={(e) => updateAutoBackup({ auto_backup_interval_hours: Number(e.target.value) })}
+            className="input w-full"
+          >
+            {AUTO_BACKUP_INTERVALS.map(({ hours, label }) => (
+              <option key={hours} value={hours}>{label}</option>
+            ))}
+          </select>
+        </div>
+
         {/* 테마 설정 */}
         <div className="card mb-6">
           <div className="flex items-center space-x-2 mb-4">
@@ -40,8 +40,60 @@ export const backupAPI = {
   getStats: () => api.get('/backup/stats'),
   getLogs: (limit: number = 20) => api.get(`/backup/logs?limit=${limit}`),
   downloadZip: () => api.get('/backup/download-zip', { responseType: 'blob' }),
+  streamProgress: (onEvent: (event: BackupProgressEvent) => void, signal: AbortSignal) =>
+    streamEvents('/backup/progress', onEvent, signal),
 };
 
+export interface BackupProgressEvent {
+  status: 'queued' | 'in_progress' | 'success' | 'failed' | 'idle';
+  phase?: string;
+  log_id?: number;
+  total?: number;
+  processed?: number;
+  new?: number;
+  updated?: number;
+  skipped?: number;
+  failed?: number;
+  resumed?: number;
+  eta_seconds?: number | null;
+  message?: string;
+}
+
+// SSE 스트림 읽기 (EventSource는 Authorization 헤더를 보낼 수 없어 fetch 스트리밍으로 파싱)
+async function streamEvents<T>(path: string, onEvent: (event: T) => void, signal: AbortSignal) {
+  const token = localStorage.getItem('access_token');
+  const response = await fetch(`${API_URL}/api/v1${path}`, {
+    headers: {
+      Accept: 'text/event-stream',
+      ...(token ? { Authorization: `Bearer ${token}` } : {}),
+    },
+    signal,
+  });
+  if (!response.ok || !response.body) {
+    throw new Error(`Stream failed: ${response.status}`);
+  }
+
+  const reader = response.body.getReader();
+  const decoder = new TextDecoder();
+  let buffer = '';
+  while (true) {
+    const { done, value } = await reader.read();
+    if (done) break;
+    buffer += decoder.decode(value, { stream: true });
+    let boundary;
+    while ((boundary = buffer.indexOf('\n\n')) >= 0) {
+      const data = buffer
+        .slice(0, boundary)
+        .split('\n')
+        .filter((line) => line.startsWith('data: '))
+        .map((line) => line.slice(6))
+        .join('\n');
+      buffer = buffer.slice(boundary + 2);
+      if (data) onEvent(JSON.parse(data));
+    }
+  }
+}
+
 export const postsAPI = {
   getAll: (page: number = 1, limit: number = 20) =>
     api.get(`/backup/posts?page=${page}&limit=${limit}`),
@@ -54,7 +106,10 @@ export const settingsAPI = {
   update: (data: {
     github_repo?: string;
     github_sync_enabled?: boolean;
+    image_optimization_enabled?: boolean;
     email_notification_enabled?: boolean;
+    auto_backup_enabled?: boolean;
+    auto_backup_interval_hours?: number;
   }) => api.put('/user/settings', data),
   checkGitHubRepo: (name: string) => api.get(`/user/github/repo/check?name=${encodeURIComponent(name)}`),
 };